@@ -9,16 +9,17 @@ concurrency and throttling, and wrappers for anyio primitives.
 
 import asyncio
 import functools
+import sys
 import time as std_time
 from collections.abc import AsyncGenerator
 from collections.abc import Awaitable as CAwaitable
-from typing import Any, Callable, Optional, TypeVar, cast
+from typing import Any, Callable, Optional, TypeVar, Union, cast
 
 import anyio
 from pydantic import BaseModel, Field
 from pydantic_core import PydanticUndefined
 
-from lionfuncs.concurrency import CapacityLimiter, Semaphore
+from lionfuncs.concurrency import Lock, Semaphore
 from lionfuncs.to_list import to_list
 from lionfuncs.utils import force_async, is_coro_func
 
@@ -27,6 +28,9 @@ R = TypeVar("R")
 
 UNDEFINED = PydanticUndefined
 
+# asyncio.TaskGroup is available from Python 3.11
+_NATIVE_TASK_GROUP = sys.version_info >= (3, 11)
+
 __all__ = [
     "Throttle",
     "throttle",
@@ -51,10 +55,35 @@ class Throttle:
 
     def __init__(self, period: float) -> None:
         self.period = period
-        self.last_called_sync: float = 0.0
-        self.last_called_async: float = 0.0
+        # Call times are kept in integer nanoseconds from time.monotonic_ns(),
+        # converting to seconds only when sleeping or when read
+        self._last_called_sync_ns: int = 0
+        self._last_called_async_ns: int = 0
         self._async_lock = asyncio.Lock()
 
+    @property
+    def last_called_sync(self) -> float:
+        """Monotonic time in seconds of the last synchronous call."""
+        return self._last_called_sync_ns / 1_000_000_000
+
+    @last_called_sync.setter
+    def last_called_sync(self, value: float) -> None:
+        self._last_called_sync_ns = round(value * 1_000_000_000)
+
+    @property
+    def last_called_async(self) -> float:
+        """Monotonic time in seconds of the last asynchronous call."""
+        return self._last_called_async_ns / 1_000_000_000
+
+    @last_called_async.setter
+    def last_called_async(self, value: float) -> None:
+        self._last_called_async_ns = round(value * 1_000_000_000)
+
+    def _wait_ns(self, last_called_ns: int) -> int:
+        """Nanoseconds left in the current period since ``last_called_ns``."""
+        period_ns = round(self.period * 1_000_000_000)
+        return period_ns - (std_time.monotonic_ns() - last_called_ns)
+
     def __call__(
         self, func: Callable[..., T]
     ) -> Callable[..., T]:  # For synchronous functions
@@ -62,11 +91,10 @@ class Throttle:
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs) -> Any:
-            current_time = std_time.time()
-            elapsed = current_time - self.last_called_sync
-            if elapsed < self.period:
-                std_time.sleep(self.period - elapsed)
-            self.last_called_sync = std_time.time()
+            wait_ns = self._wait_ns(self._last_called_sync_ns)
+            if wait_ns > 0:
+                std_time.sleep(wait_ns / 1_000_000_000)
+            self._last_called_sync_ns = std_time.monotonic_ns()
             return func(*args, **kwargs)
 
         return wrapper
@@ -76,19 +104,10 @@ class Throttle:
     ) -> Any:
         """Helper to call an async function with throttling."""
         async with self._async_lock:
-            try:
-                current_time = anyio.current_time()
-            except RuntimeError:  # pragma: no cover
-                current_time = std_time.time()
-
-            elapsed = current_time - self.last_called_async
-            if elapsed < self.period:
-                await anyio.sleep(self.period - elapsed)
-
-            try:
-                self.last_called_async = anyio.current_time()
-            except RuntimeError:  # pragma: no cover
-                self.last_called_async = std_time.time()
+            wait_ns = self._wait_ns(self._last_called_async_ns)
+            if wait_ns > 0:
+                await anyio.sleep(wait_ns / 1_000_000_000)
+            self._last_called_async_ns = std_time.monotonic_ns()
 
         return await func(*args, **kwargs)
 
@@ -124,7 +143,8 @@ def max_concurrent(
     limit: int,
 ) -> Callable[[Callable[..., CAwaitable[Any]]], Callable[..., CAwaitable[Any]]]:
     """
-    Limit the concurrency of async function execution using a semaphore.
+    Limit the concurrency of async function execution using a semaphore, or a
+    lock when the limit is 1.
     If the function is synchronous, it will be wrapped to run in a thread pool.
 
     Args:
@@ -133,7 +153,9 @@ def max_concurrent(
     if limit < 1:
         raise ValueError("Concurrency limit must be at least 1")
 
-    semaphore = Semaphore(limit)
+    # A limit of 1 is plain mutual exclusion, for which a lock is cheaper than
+    # a counting semaphore
+    guard: Union[Lock, Semaphore] = Lock() if limit == 1 else Semaphore(limit)
 
     def decorator(func: Callable[..., Any]) -> Callable[..., CAwaitable[Any]]:
         processed_func = func
@@ -142,7 +164,7 @@ def max_concurrent(
 
         @functools.wraps(processed_func)
         async def wrapper(*args, **kwargs) -> Any:
-            async with semaphore:
+            async with guard:
                 return await processed_func(*args, **kwargs)
 
         return wrapper
@@ -188,8 +210,11 @@ class ALCallParams(CallParams):
                 "A sync/async func must be provided either at initialization or call time."
             )  # pragma: no cover
 
-        # Merge kwargs from initialization and call time
-        merged_kwargs = {**self.kwargs, **additional_kwargs}
+        # Merge kwargs from initialization and call time; without call-time
+        # overrides the stored dict is unpacked directly instead of copied first
+        merged_kwargs = (
+            {**self.kwargs, **additional_kwargs} if additional_kwargs else self.kwargs
+        )
 
         return await alcall(
             input_,
@@ -236,6 +261,30 @@ async def alcall(
     flatten_tuple_set: bool = False,
     **kwargs: Any,
 ) -> list[Any]:
+    """
+    Apply a function to each item in a list concurrently, with retries.
+
+    Retries run in waves: every item is attempted once, then all failed items
+    are retried together after one shared delay. A failed item's retry
+    therefore waits for the slowest item in its wave, and with retry_timing
+    an item's duration includes that wait. Without retry_default, the first
+    item to fail on its last attempt is raised immediately and the rest of
+    its wave is cancelled.
+
+    Args:
+        input_: The items to process.
+        func: The function to call for each item.
+        num_retries: Number of retries for each item.
+        retry_default: Value used for items whose retries are exhausted. If
+            unset, the first such failure is raised.
+        retry_timing: Whether to return (result, duration) tuples.
+        max_concurrent: Maximum number of concurrent calls.
+        throttle_period: Minimum time between calls in seconds.
+        **kwargs: Additional keyword arguments passed to func.
+
+    Returns:
+        The results in input order.
+    """
     if not callable(func):  # pragma: no cover
         try:
             func_list = list(func)  # type: ignore
@@ -296,56 +345,90 @@ async def alcall(
             else:
                 return await anyio.to_thread.run_sync(func, item_internal, **kwargs)  # type: ignore
 
-    async def execute_task(i: Any, index: int) -> Any:
-        start_time = anyio.current_time()
-        attempts = 0
-        current_delay_val = retry_delay
-        while True:
-            try:
-                result = await call_func_internal(i)
-                if retry_timing:
-                    end_time = anyio.current_time()
-                    return index, result, end_time - start_time
-                else:
-                    return index, result
-            except asyncio.CancelledError:  # pragma: no cover
+    n_items = len(processed_input_)
+    # Outcome of each item's latest attempt as (succeeded, value, end_time),
+    # where value is the exception for a failed attempt
+    outcomes: list[Any] = [None] * n_items
+    start_times: list[Optional[float]] = [None] * n_items
+    throttled = bool(throttle_period and throttle_period > 0)
+
+    async def attempt_task(index: int, fail_fast: bool) -> None:
+        if start_times[index] is None:
+            start_times[index] = anyio.current_time()
+        try:
+            result = await call_func_internal(processed_input_[index])
+            outcomes[index] = (True, result, anyio.current_time())
+        except asyncio.CancelledError:  # pragma: no cover
+            raise
+        except Exception as e:  # Catch broad exceptions for retry logic
+            if fail_fast:
                 raise
-            except Exception:  # Catch broad exceptions for retry logic
-                attempts += 1
-                if attempts <= num_retries:
-                    if current_delay_val > 0:
-                        await anyio.sleep(current_delay_val)
-                        current_delay_val *= backoff_factor
-                else:
-                    if retry_default is not UNDEFINED:
-                        if retry_timing:
-                            end_time = anyio.current_time()
-                            duration = end_time - start_time
-                            return index, retry_default, duration
-                        else:
-                            return index, retry_default
-                    raise
-
-    async def task_wrapper(item_wrapper: Any, idx_wrapper: int) -> Any:
-        task_result: Any
+            outcomes[index] = (False, e, anyio.current_time())
+
+    async def task_wrapper(index: int, fail_fast: bool) -> None:
         if semaphore:
             async with semaphore:
-                task_result = await execute_task(item_wrapper, idx_wrapper)
+                await attempt_task(index, fail_fast)
         else:
-            task_result = await execute_task(item_wrapper, idx_wrapper)
+            await attempt_task(index, fail_fast)
 
-        if throttle_period and throttle_period > 0:
+        if throttled:
             await anyio.sleep(throttle_period)
-        return task_result
 
-    tasks = [task_wrapper(item, idx) for idx, item in enumerate(processed_input_)]
-
-    try:
-        completed_results_with_indices = await asyncio.gather(*tasks)
-    except Exception as e:  # pragma: no cover
-        raise e
+    async def gather_or_cancel(coros: list[CAwaitable[None]]) -> None:
+        # Like gather, but the first failure cancels the rest of the wave
+        tasks = [asyncio.ensure_future(coro) for coro in coros]
+        try:
+            await asyncio.gather(*tasks)
+        except Exception:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def run_wave(indices: list[int], fail_fast: bool) -> None:
+        if semaphore and not throttled and max_concurrent < len(indices):
+            # Bounded concurrency: run exactly max_concurrent workers that pull
+            # items from a shared iterator, instead of one semaphore-gated task
+            # per item. Throttled calls keep the per-item path so the throttle
+            # sleep never holds a concurrency slot.
+            pending_indices = iter(indices)
+
+            async def pool_worker() -> None:
+                for index in pending_indices:
+                    await attempt_task(index, fail_fast)
+
+            await gather_or_cancel([pool_worker() for _ in range(max_concurrent)])
+        else:
+            await gather_or_cancel(
+                [task_wrapper(index, fail_fast) for index in indices]
+            )
 
-    completed_results_with_indices.sort(key=lambda x: x[0])
+    # Retries run in waves: all items that failed in a wave are re-dispatched
+    # together after one shared delay, instead of each failed item sleeping
+    # and retrying on its own. Without retry_default, the last wave fails fast:
+    # the first item to exhaust its retries cancels the wave and is raised.
+    pending = list(range(n_items))
+    current_delay_val = retry_delay
+    for attempt in range(num_retries + 1):
+        last_wave = attempt == num_retries
+        await run_wave(pending, fail_fast=last_wave and retry_default is UNDEFINED)
+        pending = [index for index in pending if not outcomes[index][0]]
+        if not pending or last_wave:
+            break
+        if current_delay_val > 0:
+            await anyio.sleep(current_delay_val)
+            current_delay_val *= backoff_factor
+
+    completed_results_with_indices: list[tuple] = []
+    for index, (succeeded, value, end_time) in enumerate(outcomes):
+        result = value if succeeded else retry_default
+        if retry_timing:
+            completed_results_with_indices.append(
+                (index, result, end_time - start_times[index])
+            )
+        else:
+            completed_results_with_indices.append((index, result))
 
     final_results: list[Any]
     if retry_timing:
@@ -384,6 +467,7 @@ class BCallParams(CallParams):
     dropna: bool = False
     unique_output: bool = False
     flatten_tuple_set: bool = False
+    overlap_batches: bool = False
 
     async def __call__(
         self,
@@ -396,7 +480,9 @@ class BCallParams(CallParams):
                 "A sync/async func must be provided either at initialization or call time."
             )  # pragma: no cover
 
-        merged_kwargs = {**self.kwargs, **additional_kwargs}
+        merged_kwargs = (
+            {**self.kwargs, **additional_kwargs} if additional_kwargs else self.kwargs
+        )
 
         return bcall(
             input_,
@@ -418,6 +504,7 @@ class BCallParams(CallParams):
             dropna=self.dropna,
             unique_output=self.unique_output,
             flatten_tuple_set=self.flatten_tuple_set,
+            overlap_batches=self.overlap_batches,
             **merged_kwargs,
         )
 
@@ -443,6 +530,7 @@ async def bcall(
     dropna: bool = False,
     unique_output: bool = False,
     flatten_tuple_set: bool = False,
+    overlap_batches: bool = False,
     **kwargs: Any,
 ) -> AsyncGenerator[list[Any], None]:
     processed_bcall_input = to_list(input_, flatten=True, dropna=True, unique=False)
@@ -450,28 +538,57 @@ async def bcall(
     if batch_size <= 0:
         raise ValueError("batch_size must be positive.")  # pragma: no cover
 
-    for i in range(0, len(processed_bcall_input), batch_size):
-        batch = processed_bcall_input[i : i + batch_size]
-        yield await alcall(
-            batch,
-            func,
-            sanitize_input=sanitize_input,
-            unique_input=unique_input,
-            num_retries=num_retries,
-            initial_delay=initial_delay,
-            retry_delay=retry_delay,
-            backoff_factor=backoff_factor,
-            retry_default=retry_default,
-            retry_timeout=retry_timeout,
-            retry_timing=retry_timing,
-            max_concurrent=max_concurrent,
-            throttle_period=throttle_period,
-            flatten=flatten,
-            dropna=dropna,
-            unique_output=unique_output,
-            flatten_tuple_set=flatten_tuple_set,
-            **kwargs,
-        )
+    alcall_kwargs = dict(
+        sanitize_input=sanitize_input,
+        unique_input=unique_input,
+        num_retries=num_retries,
+        initial_delay=initial_delay,
+        retry_delay=retry_delay,
+        backoff_factor=backoff_factor,
+        retry_default=retry_default,
+        retry_timeout=retry_timeout,
+        retry_timing=retry_timing,
+        max_concurrent=max_concurrent,
+        throttle_period=throttle_period,
+        flatten=flatten,
+        dropna=dropna,
+        unique_output=unique_output,
+        flatten_tuple_set=flatten_tuple_set,
+        **kwargs,
+    )
+    batches = (
+        processed_bcall_input[i : i + batch_size]
+        for i in range(0, len(processed_bcall_input), batch_size)
+    )
+
+    if not overlap_batches:
+        for batch in batches:
+            yield await alcall(batch, func, **alcall_kwargs)
+        return
+
+    # Double-buffering: the next batch is started before the current one is
+    # awaited, so it runs while the current batch finishes and is consumed
+    pending: Optional[asyncio.Task] = None
+    try:
+        for batch in batches:
+            current, pending = pending, asyncio.create_task(
+                alcall(batch, func, **alcall_kwargs)
+            )
+            if current is not None:
+                yield await current
+        if pending is not None:
+            current, pending = pending, None
+            yield await current
+    finally:
+        if pending is not None:
+            # Cancel the prefetched batch and retrieve its outcome, so a batch
+            # that already failed does not log "exception was never retrieved".
+            # asyncio.wait never raises the task's own outcome, so only a
+            # cancellation aimed at bcall itself propagates from here.
+            pending.cancel()
+            await asyncio.wait({pending})
+            if not pending.cancelled():
+                pending.exception()
 
 
 class CancelScope:
@@ -541,29 +658,41 @@ class CancelScope:
 
 class TaskGroup:
     """
-    A group of tasks that are treated as a unit, wrapping anyio.abc.TaskGroup.
+    A group of tasks that are treated as a unit.
+
+    On Python 3.11+ this wraps the native asyncio.TaskGroup, avoiding anyio's
+    extra scheduling layer; on older versions it wraps anyio.abc.TaskGroup.
+    Either way, task failures propagate as an exception group on exit.
     """
 
     def __init__(self):
-        self._anyio_task_group: Optional[anyio.abc.TaskGroup] = None
+        self._task_group: Optional[Any] = None
 
     def start_soon(
         self, func: Callable[..., CAwaitable[Any]], *args: Any, name: Any = None
     ) -> None:
-        if self._anyio_task_group is None:  # pragma: no cover
+        if self._task_group is None:  # pragma: no cover
             raise RuntimeError(
                 "Task group is not active. Use 'async with TaskGroup():'"
             )
-        self._anyio_task_group.start_soon(func, *args, name=name)
+        if _NATIVE_TASK_GROUP:
+            self._task_group.create_task(
+                func(*args), name=None if name is None else str(name)
+            )
+        else:
+            self._task_group.start_soon(func, *args, name=name)
 
     async def __aenter__(self) -> "TaskGroup":
-        self._anyio_task_group = anyio.create_task_group()
-        await self._anyio_task_group.__aenter__()
+        if _NATIVE_TASK_GROUP:
+            self._task_group = asyncio.TaskGroup()  # type: ignore[attr-defined]
+        else:
+            self._task_group = anyio.create_task_group()
+        await self._task_group.__aenter__()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> Optional[bool]:
-        if self._anyio_task_group:
-            return await self._anyio_task_group.__aexit__(exc_type, exc_val, exc_tb)
+        if self._task_group:
+            return await self._task_group.__aexit__(exc_type, exc_val, exc_tb)
         return False  # pragma: no cover
 
 
@@ -585,24 +714,33 @@ async def parallel_map(
 
     Raises:
         Exception: Propagates the first exception encountered from any of the tasks.
+            No new items are started once any item has failed.
     """
     if max_concurrency < 1:
         raise ValueError("max_concurrency must be at least 1")  # pragma: no cover
 
-    limiter = CapacityLimiter(max_concurrency)
     results: list[Optional[R]] = [None] * len(items)
     exceptions: list[Optional[Exception]] = [None] * len(items)
-
-    async def _worker(index: int, item: T) -> None:
-        async with limiter:
+    pending_items = enumerate(items)
+    failed = False
+
+    # A fixed pool of workers pulls items from a shared iterator, so at most
+    # max_concurrency tasks exist regardless of the number of items. Once any
+    # item fails, workers finish their current item but start no new ones.
+    async def _worker() -> None:
+        nonlocal failed
+        for index, item in pending_items:
             try:
                 results[index] = await func(item)
             except Exception as exc:  # pylint: disable=broad-except
                 exceptions[index] = exc
+                failed = True
+            if failed:
+                return
 
     async with TaskGroup() as tg:
-        for i, item_val in enumerate(items):
-            tg.start_soon(_worker, i, item_val)
+        for _ in range(min(max_concurrency, len(items))):
+            tg.start_soon(_worker)
 
     first_exception = None
     for exc in exceptions:
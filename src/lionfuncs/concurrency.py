@@ -284,6 +284,9 @@ class BoundedQueue(Generic[T]):
                 for task in self._workers:
                     if not task.done():
                         task.cancel()
+                # Let cancelled workers hand back any item their pending get
+                # already took before new workers compete for the queue
+                await asyncio.gather(*self._workers, return_exceptions=True)
                 self._workers.clear()
 
             for i in range(num_workers):
@@ -301,32 +304,87 @@ class BoundedQueue(Generic[T]):
     ) -> None:
         """Worker loop that processes queue items."""
         self.logger.debug(f"Worker {worker_id} started")
-        while not self._stop_event.is_set():
-            try:
-                try:
-                    item = await asyncio.wait_for(self.get(), timeout=0.1)
-                except asyncio.TimeoutError:
-                    continue
+        # Wait on the next item and the stop signal together instead of polling
+        # get() with a timeout, so idle workers never wake up and shutdown is
+        # immediate
+        stop_task = asyncio.create_task(self._stop_event.wait())
+        get_task: asyncio.Task | None = None
+        try:
+            while not self._stop_event.is_set():
+                get_task = asyncio.create_task(self.get())
+                await asyncio.wait(
+                    {get_task, stop_task}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not get_task.done():
+                    # Stop requested while idle; the get may still have taken
+                    # an item before it saw the cancellation
+                    for item in await self._cancel_get(get_task):
+                        await self._process_item(item, worker_func, error_handler)
+                    break
+                item = get_task.result()
+                get_task = None
+                await self._process_item(item, worker_func, error_handler)
+        except asyncio.CancelledError:
+            self.logger.debug(f"Worker {worker_id} cancelled")
+            if get_task is not None:
+                for item in await self._cancel_get(get_task):
+                    self._requeue(item)
+        finally:
+            stop_task.cancel()
+        self.logger.debug(f"Worker {worker_id} stopped")
+
+    async def _cancel_get(self, get_task: asyncio.Task) -> list[T]:
+        """
+        Cancel a pending get() task and wait for it to finish.
+
+        Args:
+            get_task: The task running get()
+
+        Returns:
+            The item the task had already taken from the queue, if any, as a
+            one-element list; otherwise an empty list.
+        """
+        get_task.cancel()
+        try:
+            return [await get_task]
+        except asyncio.CancelledError:
+            if not get_task.cancelled():
+                raise
+            return []
+        except QueueStateError:
+            return []
+
+    def _requeue(self, item: T) -> None:
+        """Put back an item a cancelled worker took but did not process."""
+        try:
+            self.queue.put_nowait(item)
+        except asyncio.QueueFull:
+            self.logger.error("Queue full, dropping item taken by cancelled worker")
+        # The re-queued copy is tracked as a new task; retire the taken one
+        self.queue.task_done()
 
+    async def _process_item(
+        self,
+        item: T,
+        worker_func: Callable[[T], Awaitable[Any]],
+        error_handler: Callable[[Exception, T], Awaitable[None]] | None,
+    ) -> None:
+        """Run worker_func on one item and mark it done."""
+        try:
+            await worker_func(item)
+        except Exception as e:
+            self._metrics["errors"] += 1
+            if error_handler:
                 try:
-                    await worker_func(item)
-                except Exception as e:
-                    self._metrics["errors"] += 1
-                    if error_handler:
-                        try:
-                            await error_handler(e, item)
-                        except Exception:
-                            self.logger.exception(
-                                f"Error in error handler. Original error: {e}"
-                            )
-                    else:
-                        self.logger.exception("Error processing item")
-                finally:
-                    self.task_done()
-            except asyncio.CancelledError:
-                self.logger.debug(f"Worker {worker_id} cancelled")
-                break
-        self.logger.debug(f"Worker {worker_id} stopped")
+                    await error_handler(e, item)
+                except Exception:
+                    self.logger.exception(
+                        f"Error in error handler. Original error: {e}"
+                    )
+            else:
+                self.logger.exception("Error processing item")
+        finally:
+            self.task_done()
 
     async def __aenter__(self) -> "BoundedQueue[T]":
         """Enter async context."""
@@ -1,6 +1,5 @@
 from collections.abc import Mapping, Sequence
-from functools import partial
-from typing import Any, Callable, Literal
+from typing import Any, Callable, Literal, Optional
 
 from pydantic_core import PydanticUndefined
 
@@ -138,6 +137,7 @@ def fuzzy_match_keys(
             rf_scorer: Callable[..., float]
             method_name_lower = default_method.lower()
             current_score_cutoff = threshold  # Default for 0-1 range scorers
+            scorer_kwargs: Optional[dict[str, Any]] = None
 
             if method_name_lower == "levenshtein":
                 rf_scorer = rapidfuzz.fuzz.ratio
@@ -146,26 +146,25 @@ def fuzzy_match_keys(
                 rf_scorer = rapidfuzz.fuzz.WRatio
                 current_score_cutoff = threshold * 100
             elif method_name_lower == "jaro_winkler":
-                # JaroWinkler.similarity returns 0-1, so threshold is used directly
-                rf_scorer = partial(
-                    rapidfuzz.distance.JaroWinkler.similarity,
-                    prefix_weight=jaro_winkler_prefix_weight,
-                )
+                # JaroWinkler.similarity returns 0-1, so threshold is used directly.
+                # Passing prefix_weight via scorer_kwargs (not a partial) keeps
+                # extractOne on rapidfuzz's native scorer path.
+                rf_scorer = rapidfuzz.distance.JaroWinkler.similarity
+                scorer_kwargs = {"prefix_weight": jaro_winkler_prefix_weight}
                 # current_score_cutoff remains threshold (0-1)
 
-            # rapidfuzz's processor handles case transformation for query and choices
-            processor_func = None if case_sensitive else str.lower
-
             for input_key in remaining_input_for_fuzz:
                 if not available_expected_comp_forms:
                     break  # All expected keys have been matched
 
+                # Choices are already in comparison form, so only the query needs
+                # lowering; a rapidfuzz processor would re-lower every choice per call
                 match_result = rapidfuzz.process.extractOne(
-                    query=input_key,  # Original input key
+                    query=input_key if case_sensitive else input_key.lower(),
                     choices=available_expected_comp_forms,  # Comparison forms of available expected keys
                     scorer=rf_scorer,
                     score_cutoff=current_score_cutoff,  # Use scaled cutoff
-                    processor=processor_func,  # Applies to query and choices before scoring
+                    scorer_kwargs=scorer_kwargs,
                 )
 
                 if match_result:
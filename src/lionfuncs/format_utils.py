@@ -1,18 +1,37 @@
 """Utilities for formatting data into human-readable strings."""
 
+import functools
 import json
-from collections.abc import Mapping  # Added import
+from collections.abc import Callable, Mapping
+from enum import Enum
 from typing import Any
 
+import orjson
+from pydantic import BaseModel
+
 from lionfuncs.to_dict import to_dict
 
 __all__ = ["as_readable"]
 
+# orjson only supports a 2-space indent. Datetimes and dataclasses are passed
+# to `default=str` so they render the same way as through json.dumps. Enums,
+# non-finite floats, floats json.dumps writes in exponent notation and dict keys
+# json.dumps rejects are rendered differently, see _orjson_matches_stdlib.
+_ORJSON_INDENT_OPTIONS = (
+    orjson.OPT_INDENT_2
+    | orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+)
+
 
+@functools.lru_cache(maxsize=1)
 def _is_in_notebook() -> bool:
     """Check if code is running in a Jupyter notebook environment.
 
     Uses IPython's get_ipython() function to detect if we're in a notebook.
+    The result is computed once per process; call `_is_in_notebook.cache_clear()`
+    to force it to be recomputed.
 
     Returns:
         bool: True if running in a Jupyter notebook, False otherwise
@@ -50,107 +69,251 @@ def _format_dict_yaml_like(
     Returns:
         str: A YAML-like formatted string representation of the data
     """
-    if max_depth is not None and current_depth >= max_depth:
-        return f"{' ' * (indent_level * base_indent)}..."
+    lines: list[str] = []
+    # Indent strings per level, shared by the whole call and grown on demand
+    pads = [" " * (level * base_indent) for level in range(indent_level + 2)]
+    _append_yaml_like_lines(
+        data_dict, indent_level, pads, max_depth, current_depth, lines
+    )
+    return "\n".join(lines)
+
+
+def _quote_if_special(value: str) -> str:
+    """Wrap a scalar string in double quotes if it contains YAML-special chars."""
+    if ":" in value or "{" in value or "}" in value or "[" in value or "]" in value:
+        return f'"{value}"'
+    return value
+
+
+def _append_yaml_like_lines(
+    data: Any,
+    indent_level: int,
+    pads: list[str],
+    max_depth: int | None,
+    current_depth: int,
+    lines: list[str],
+) -> None:
+    """Append the YAML-like lines for `data` to `lines`.
+
+    Nested values write into the same list instead of returning joined strings,
+    so the output is joined once rather than once per nesting level.
 
-    lines = []
-    prefix = " " * (indent_level * base_indent)
+    Args:
+        data: The value to format
+        indent_level: Current indentation level
+        pads: Indent string for each level; holds at least indent_level + 1
+            entries and is extended here so the next level is always present
+        max_depth: Maximum recursion depth (None for unlimited)
+        current_depth: Current recursion depth
+        lines: The output buffer; always receives at least one entry
+    """
+    if len(pads) <= indent_level + 1:
+        pads.append(pads[indent_level] + pads[1])
+    prefix = pads[indent_level]
+    append = lines.append
 
-    if isinstance(data_dict, dict):
-        if not data_dict:
-            return f"{prefix}{{}}"
+    if max_depth is not None and current_depth >= max_depth:
+        append(f"{prefix}...")
+        return
+
+    if isinstance(data, dict):
+        if not data:
+            append(f"{prefix}{{}}")
+            return
 
-        for key, value in data_dict.items():
+        for key, value in data.items():
             if isinstance(value, dict):
                 # Nested dict
-                lines.append(f"{prefix}{key}:")  # Apply prefix here
-                lines.append(
-                    _format_dict_yaml_like(
-                        value,
-                        indent_level + 1,  # Increase indent for nested content
-                        base_indent,
-                        max_depth,
-                        current_depth + 1,
-                    )
+                append(f"{prefix}{key}:")
+                if not value and (max_depth is None or current_depth + 1 < max_depth):
+                    # Empty dict leaf, emitted without a recursive call
+                    append(pads[indent_level + 1] + "{}")
+                    continue
+                _append_yaml_like_lines(
+                    value,
+                    indent_level + 1,  # Increase indent for nested content
+                    pads,
+                    max_depth,
+                    current_depth + 1,
+                    lines,
                 )
             elif isinstance(value, (list, tuple, set)):
                 # List under a key
                 if not value:
-                    lines.append(f"{prefix}{key}: []")
+                    append(f"{prefix}{key}: []")
                     continue
 
-                lines.append(f"{prefix}{key}:")  # Apply prefix here
+                append(f"{prefix}{key}:")
+                item_prefix = pads[indent_level + 1] + "- "
                 for item in value:
-                    # For list items, the '-' acts as part of the indent,
-                    # so the content itself starts at indent_level + 1 (relative to the key)
-                    # and the '-' is at indent_level + 1 (relative to the key's prefix)
-                    item_str = _format_dict_yaml_like(
+                    # The '-' replaces the leading indent of the item's first line,
+                    # the rest of the item keeps the indent of indent_level + 1
+                    first = len(lines)
+                    _append_yaml_like_lines(
                         item,
                         indent_level + 1,  # Content of list item
-                        base_indent,
+                        pads,
                         max_depth,
                         current_depth + 1,
-                    ).lstrip()
-                    lines.append(f"{prefix}{' ' * base_indent}- {item_str}")
+                        lines,
+                    )
+                    lines[first] = item_prefix + lines[first].lstrip()
             elif isinstance(value, str) and "\n" in value:
                 # Multi-line string
-                lines.append(f"{prefix}{key}: |")  # Apply prefix here
-                subprefix = " " * ((indent_level + 1) * base_indent)
-                for line in value.splitlines():
-                    lines.append(f"{subprefix}{line}")
+                append(f"{prefix}{key}: |")
+                # One buffer entry for the whole block; the final join supplies
+                # the newline before it, so only the inner breaks are indented
+                subprefix = pads[indent_level + 1]
+                append(subprefix + ("\n" + subprefix).join(value.splitlines()))
             else:
                 # Simple single-line scalar
                 if isinstance(value, str):
-                    # Add quotes if string contains special characters
-                    if (
-                        ":" in value
-                        or "{" in value
-                        or "}" in value
-                        or "[" in value
-                        or "]" in value
-                    ):
-                        value = f'"{value}"'
-                lines.append(f"{prefix}{key}: {value}")  # Apply prefix here
-        return "\n".join(lines)
-
-    elif isinstance(data_dict, (list, tuple, set)):
-        if not data_dict:
-            return f"{prefix}[]"  # Apply prefix here
-
-        # For top-level or nested lists
-        for item in data_dict:
-            # For list items, the content starts at the current indent_level
-            # and the '-' is part of that indent_level's prefix
-            item_str = _format_dict_yaml_like(
+                    value = _quote_if_special(value)
+                append(f"{prefix}{key}: {value}")
+        return
+
+    if isinstance(data, (list, tuple, set)):
+        if not data:
+            append(f"{prefix}[]")
+            return
+
+        # For top-level or nested lists the content starts at the current
+        # indent_level and the '-' is part of that indent_level's prefix
+        indented = prefix + " "
+        for item in data:
+            first = len(lines)
+            _append_yaml_like_lines(
                 item,
                 indent_level,  # Content of list item at current indent
-                base_indent,
+                pads,
                 max_depth,
                 current_depth + 1,
+                lines,
             )
-            # The item_str already includes its own prefix if it's a complex type.
-            # If it's a simple scalar, it will just be the value.
-            # We need to ensure the '-' is correctly prefixed.
-            if item_str.startswith(
-                prefix + " "
-            ):  # if it's already indented (e.g. nested list/dict)
-                lines.append(f"{prefix}- {item_str.lstrip()}")
-            else:  # simple scalar
-                lines.append(f"{prefix}- {item_str}")
-        return "\n".join(lines)
+            item_str = lines[first]
+            if item_str.startswith(indented):  # already indented (nested list/dict)
+                item_str = item_str.lstrip()
+            lines[first] = f"{prefix}- {item_str}"
+        return
 
     # Base case: single-line scalar
-    if isinstance(data_dict, str):
-        # Add quotes if string contains special characters
-        if (
-            ":" in data_dict
-            or "{" in data_dict
-            or "}" in data_dict
-            or "[" in data_dict
-            or "]" in data_dict
-        ):
-            data_dict = f'"{data_dict}"'
-    return f"{prefix}{data_dict}"  # Apply prefix here
+    if isinstance(data, str):
+        data = _quote_if_special(data)
+    append(f"{prefix}{data}")
+
+
+def _dumps_json(data: Any, indent: int) -> str:
+    """Serialize data as indented JSON, using orjson when the output is identical.
+
+    Args:
+        data: The data to serialize
+        indent: Number of spaces per indentation level
+
+    Returns:
+        str: The JSON string
+
+    Raises:
+        TypeError: If the data cannot be serialized by the standard json module
+    """
+    if indent == 2 and _orjson_matches_stdlib(data):
+        try:
+            return orjson.dumps(
+                data, default=str, option=_ORJSON_INDENT_OPTIONS
+            ).decode()
+        except orjson.JSONEncodeError:
+            pass  # e.g. integers beyond 64 bits, let json.dumps decide
+    return json.dumps(data, indent=indent, ensure_ascii=False, default=str)
+
+
+def _orjson_matches_stdlib(data: Any) -> bool:
+    """Check that orjson would render data exactly like json.dumps.
+
+    Args:
+        data: The data to check
+
+    Returns:
+        bool: False if data holds an Enum, a NaN/Infinity float or a float that
+            json.dumps writes in exponent notation (nonzero with an absolute
+            value below 1e-4 or from 1e16), in a value or in a dict key, or a
+            dict key json.dumps does not accept (anything but str, int, float,
+            bool and None)
+    """
+    stack = [data]
+    pop, extend = stack.pop, stack.extend
+    while stack:
+        item = pop()
+        if isinstance(item, dict):
+            for key in item:
+                if isinstance(key, Enum) or not (
+                    key is None or isinstance(key, (str, int, float))
+                ):
+                    return False
+            extend(item.keys())
+            extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            extend(item)
+        elif isinstance(item, Enum):
+            return False
+        elif isinstance(item, float) and not (item == 0 or 1e-4 <= abs(item) < 1e16):
+            # Also catches NaN and Infinity, which fail every comparison
+            return False
+    return True
+
+
+def _dump_model(model: BaseModel) -> Any:
+    """Dump a Pydantic model for formatting.
+
+    Calls `model_dump` directly, which already converts nested models, instead
+    of going through the generic `to_dict` method dispatch. Models whose
+    `model_dump` fails or does not return a mapping still go through `to_dict`.
+
+    Args:
+        model: The Pydantic model instance to dump
+
+    Returns:
+        Any: The dumped data, with None values excluded
+    """
+    try:
+        dumped = model.model_dump(exclude_none=True)
+    except Exception:
+        dumped = None
+    if isinstance(dumped, Mapping):
+        return dumped
+    return to_dict(model, exclude_none=True, suppress_errors=True, default_on_error={})
+
+
+def _format_yaml_like(data: Any, indent: int, max_depth: int | None) -> str:
+    """Format processed data as YAML-like text; scalars use their str()."""
+    if not isinstance(data, (dict, list, tuple, set)):
+        return str(data)
+    return _format_dict_yaml_like(
+        data,
+        indent_level=1 if indent > 0 else 0,
+        base_indent=indent,
+        max_depth=max_depth,
+    )
+
+
+def _format_json(data: Any, indent: int, max_depth: int | None) -> str:
+    """Format processed data as JSON, falling back to str() if not serializable."""
+    try:
+        return _dumps_json(data, indent)
+    except Exception:
+        return str(data)
+
+
+def _format_repr(data: Any, indent: int, max_depth: int | None) -> str:
+    """Format processed data with repr()."""
+    return repr(data)
+
+
+# format_type -> (formatter, code fence language for notebook display or None)
+_FORMATTERS: dict[str, tuple[Callable[[Any, int, int | None], str], str | None]] = {
+    "auto": (_format_yaml_like, "yaml"),
+    "yaml_like": (_format_yaml_like, "yaml"),
+    "json": (_format_json, "json"),
+    "repr": (_format_repr, None),
+}
 
 
 def as_readable(
@@ -178,79 +341,53 @@ def as_readable(
 
     Returns:
         str: A formatted string representation of the data
+
+    Raises:
+        ValueError: If format_type is not one of the supported formats
     """
-    # Check if we're in a notebook
-    use_rich_display = (
-        in_notebook_override if in_notebook_override is not None else _is_in_notebook()
-    )
+    # Resolve the formatter first so an unsupported format fails before any work
+    try:
+        formatter, fence_language = _FORMATTERS[format_type.lower()]
+    except KeyError:
+        raise ValueError(f"Unsupported format_type: {format_type}") from None
 
     # Convert data to a dict/list structure first for consistent formatting
     # Handle primitives and None directly for simple string representation
     if isinstance(data, (str, int, float, bool)) or data is None:
         processed_data = data
+    elif isinstance(data, BaseModel):
+        # A Pydantic model that dumps to {} is still a valid (empty) structure
+        processed_data = _dump_model(data)
     else:
         # For complex types, attempt to convert to dict for structured formatting
         try:
             # Use a non-None default_on_error to distinguish from successful None conversion
             # and to see if to_dict truly failed to produce a structure.
-            # Pydantic models are common, check for BaseModel too.
-            from pydantic import (
-                BaseModel as PydanticBaseModel,  # Local import to avoid circular if not already loaded
-            )
-
             temp_processed_data = to_dict(
                 data, exclude_none=True, suppress_errors=True, default_on_error={}
             )
 
-            # If to_dict returns the default_on_error value ({})
-            # AND original data was not actually an empty dict or a Pydantic model that could dump to empty,
-            # it implies conversion to a meaningful dict failed. Fallback to original data for str representation.
+            # If to_dict returns the default_on_error value ({}) AND original data
+            # was not actually an empty dict, it implies conversion to a meaningful
+            # dict failed. Fallback to original data for str representation.
             is_original_empty_mapping = isinstance(data, Mapping) and not data
-            is_original_pydantic_model = isinstance(data, PydanticBaseModel)
 
             if temp_processed_data == {} and not is_original_empty_mapping:
-                # If it's a Pydantic model that results in {}, that might be valid (e.g. all fields excluded/None)
-                # So, only fallback for non-Pydantic, non-empty-mapping types that became {}
-                if not is_original_pydantic_model:
-                    processed_data = data
-                else:  # It was a Pydantic model that resulted in {}, treat that as the processed form
-                    processed_data = temp_processed_data
+                processed_data = data
             else:
                 processed_data = temp_processed_data
         except Exception:
             # If any other error occurs during to_dict, fall back to original data
             processed_data = data
 
-    # Determine effective format
-    effective_format = format_type.lower()
-    if effective_format == "auto":
-        effective_format = "yaml_like"
-
-    # Format based on selected format type
-    if effective_format == "yaml_like":
-        if not isinstance(processed_data, (dict, list, tuple, set)):
-            formatted_str = str(processed_data)
-        else:
-            formatted_str = _format_dict_yaml_like(
-                processed_data,
-                indent_level=1 if indent > 0 else 0,
-                base_indent=indent,
-                max_depth=max_depth,
-            )
-        if use_rich_display:
-            return f"```yaml\n{formatted_str}\n```"
-        return formatted_str
-    elif effective_format == "json":
-        try:
-            formatted_str = json.dumps(
-                processed_data, indent=indent, ensure_ascii=False, default=str
-            )
-        except Exception:
-            formatted_str = str(processed_data)
-        if use_rich_display:
-            return f"```json\n{formatted_str}\n```"
+    formatted_str = formatter(processed_data, indent, max_depth)
+
+    # Only fenced formats are wrapped for rich notebook display
+    if fence_language is None:
         return formatted_str
-    elif effective_format == "repr":
-        return repr(processed_data)
-    else:
-        raise ValueError(f"Unsupported format_type: {format_type}")
+    use_rich_display = (
+        in_notebook_override if in_notebook_override is not None else _is_in_notebook()
+    )
+    if use_rich_display:
+        return f"```{fence_language}\n{formatted_str}\n```"
+    return formatted_str
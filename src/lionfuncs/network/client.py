@@ -11,6 +11,7 @@ import logging
 from typing import Any, Optional, TypeVar
 
 import httpx
+import orjson
 
 from lionfuncs.errors import (
     APIClientError,
@@ -26,6 +27,14 @@ from lionfuncs.network.resilience import CircuitBreaker, RetryConfig
 T = TypeVar("T")
 logger = logging.getLogger(__name__)
 
+# Connection pool limits used when none are supplied. Keeping idle connections
+# alive lets repeated calls to the same host skip the TCP/TLS handshake.
+DEFAULT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=20,
+    keepalive_expiry=30.0,
+)
+
 
 class AsyncAPIClient:
     """
@@ -49,6 +58,7 @@ class AsyncAPIClient:
         headers: Optional[dict[str, str]] = None,
         auth: Optional[httpx.Auth] = None,
         client: Optional[httpx.AsyncClient] = None,
+        limits: Optional[httpx.Limits] = None,
         circuit_breaker: Optional[CircuitBreaker] = None,
         retry_config: Optional[RetryConfig] = None,
         **client_kwargs,
@@ -62,6 +72,8 @@ class AsyncAPIClient:
             headers: Default headers to include with every request.
             auth: Authentication to use for requests.
             client: An existing httpx.AsyncClient to use instead of creating a new one.
+            limits: Connection pool limits for the shared client session.
+                Defaults to DEFAULT_LIMITS.
             circuit_breaker: Optional circuit breaker for resilience.
             retry_config: Optional retry configuration for resilience.
             **client_kwargs: Additional keyword arguments to pass to httpx.AsyncClient.
@@ -70,6 +82,7 @@ class AsyncAPIClient:
         self.timeout = timeout
         self.headers = headers or {}
         self.auth = auth
+        self.limits = limits or DEFAULT_LIMITS
         self._client = client
         self._client_kwargs = client_kwargs
         self._session_lock = asyncio.Lock()
@@ -106,6 +119,7 @@ class AsyncAPIClient:
                     timeout=self.timeout,
                     headers=self.headers,
                     auth=self.auth,
+                    limits=self.limits,
                     **self._client_kwargs,
                 )
             return self._client
@@ -155,6 +169,10 @@ class AsyncAPIClient:
             url: The URL to request.
             **kwargs: Additional keyword arguments to pass to httpx.AsyncClient.request.
 
+        A ``json`` keyword argument is serialized with orjson and sent as the
+        request body with a ``Content-Type: application/json`` header, and the
+        response body is decoded with orjson.
+
         Returns:
             The parsed response data.
 
@@ -167,6 +185,14 @@ class AsyncAPIClient:
             ServerError: If a server error occurs.
             APIClientError: For other API client errors.
         """
+        json_data = kwargs.pop("json", None)
+        if json_data is not None:
+            kwargs["content"] = orjson.dumps(json_data, option=orjson.OPT_NON_STR_KEYS)
+            # httpx.Headers matches names case-insensitively, so a caller's
+            # content-type replaces the default instead of being sent twice
+            headers = httpx.Headers(kwargs.get("headers"))
+            headers.setdefault("Content-Type", "application/json")
+            kwargs["headers"] = headers
 
         # Define the actual request function
         async def _make_request():
@@ -176,7 +202,7 @@ class AsyncAPIClient:
             try:
                 response = await client.request(method, url, **kwargs)
                 response.raise_for_status()
-                return response.json()
+                return orjson.loads(response.content)
             except httpx.ConnectError as e:
                 logger.exception("Connection error")
                 raise APIConnectionError(f"Connection error: {e!s}") from e
@@ -255,12 +281,10 @@ class AsyncAPIClient:
 
         # Apply retry if configured
         if self.retry_config:
-            from lionfuncs.network.resilience import retry_with_backoff
+            retry_driver = self.retry_config.as_driver()
 
             async def request_func():
-                return await retry_with_backoff(
-                    _make_request, **self.retry_config.as_kwargs()
-                )
+                return await retry_driver(_make_request)
 
         # Apply circuit breaker if configured
         if self.circuit_breaker:
@@ -9,6 +9,7 @@ This module provides classes for tracking the lifecycle of API requests,
 including status, timing, and result information.
 """
 
+import asyncio
 import datetime
 import traceback
 from dataclasses import dataclass, field
@@ -73,6 +74,15 @@ class NetworkRequestEvent:
     logs: list[str] = field(default_factory=list)
     metadata: dict[str, Any] = field(default_factory=dict)
 
+    # _done is kept in a slot rather than the instance __dict__: it is not a
+    # dataclass field, and vars()-based serializers such as to_dict() and
+    # as_readable() do not see it
+    __slots__ = ("__dict__", "__weakref__", "_done")
+
+    def __post_init__(self) -> None:
+        # Set once the request reaches a terminal status (see wait())
+        self._done = asyncio.Event()
+
     def _update_timestamp(self) -> None:
         """Update the updated_at timestamp to the current time."""
         self.updated_at = datetime.datetime.utcnow()
@@ -106,8 +116,23 @@ class NetworkRequestEvent:
         ):
             self.completed_at = now
 
+        if new_status in (
+            RequestStatus.COMPLETED,
+            RequestStatus.FAILED,
+            RequestStatus.CANCELLED,
+        ):
+            self._done.set()
+
         self._update_timestamp()
 
+    async def wait(self) -> None:
+        """
+        Wait until the request is COMPLETED, FAILED or CANCELLED.
+
+        Returns immediately if the request has already finished.
+        """
+        await self._done.wait()
+
     def set_result(
         self, status_code: int, headers: Optional[dict], body: Optional[Any]
     ) -> None:
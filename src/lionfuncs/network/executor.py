@@ -10,12 +10,13 @@ enforces concurrency and rate limits, and tracks request lifecycles.
 """
 
 import asyncio
+import contextlib
 import logging
 import uuid
 from collections.abc import Coroutine
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Optional, Union
 
-from lionfuncs.concurrency import CapacityLimiter, WorkQueue
+from lionfuncs.concurrency import CapacityLimiter, Semaphore, WorkQueue
 from lionfuncs.network.events import NetworkRequestEvent, RequestStatus
 from lionfuncs.network.primitives import TokenBucketRateLimiter
 
@@ -41,6 +42,7 @@ class Executor:
         api_tokens_period: float = 60.0,  # e.g., per 60 seconds
         api_tokens_bucket_capacity: Optional[float] = None,  # Defaults to rate if None
         num_workers: int = 5,  # Number of workers for the WorkQueue
+        batch_window_ms: float = 0,  # Coalescing window; 0 disables batching
     ):
         """
         Initialize the Executor.
@@ -58,6 +60,12 @@ class Executor:
             api_tokens_bucket_capacity: Max capacity of the API token bucket.
                                         Defaults to api_tokens_rate if None.
             num_workers: Number of worker coroutines to process the queue.
+            batch_window_ms: If > 0, tasks submitted for the same endpoint_url
+                             within this many milliseconds are coalesced into a
+                             single queue item and dispatched together. Each task
+                             is still rate-limited and tracked individually, and
+                             tasks waiting in a window count against
+                             queue_capacity.
         """
         self.work_queue = WorkQueue(maxsize=queue_capacity)
         self._num_workers = num_workers
@@ -77,17 +85,44 @@ class Executor:
                 max_tokens=api_tokens_bucket_capacity,
             )
 
+        self._batch_window = batch_window_ms / 1000
+        self._pending: dict[Optional[str], list[dict[str, Any]]] = {}
+        self._flush_tasks: set[asyncio.Task] = set()
+        # Set by stop() to cut every open batch window short
+        self._flush_now = asyncio.Event()
+        # One slot per batched task from submission until a worker dequeues its
+        # batch, so batching applies the same backpressure as the queue
+        self._batch_slots = Semaphore(queue_capacity)
+
         self._is_running = False
         logger.debug(
             f"Initialized Executor with queue_capacity={queue_capacity}, "
             f"concurrency_limit={concurrency_limit}, requests_rate={requests_rate}, "
             f"requests_period={requests_period}, api_tokens_rate={api_tokens_rate}, "
-            f"api_tokens_period={api_tokens_period}, num_workers={num_workers}"
+            f"api_tokens_period={api_tokens_period}, num_workers={num_workers}, "
+            f"batch_window_ms={batch_window_ms}"
         )
 
-    async def _worker(self, task_data: dict[str, Any]) -> None:
+    async def _worker(
+        self, task_data: Union[dict[str, Any], list[dict[str, Any]]]
+    ) -> None:
+        """
+        Internal worker coroutine that processes an item from the queue.
+
+        Args:
+            task_data: Dictionary containing the API coroutine and event, or a
+                       list of such dictionaries when batching is enabled.
+        """
+        if isinstance(task_data, list):
+            for _ in task_data:
+                self._batch_slots.release()
+            await asyncio.gather(*(self._process_task(t) for t in task_data))
+        else:
+            await self._process_task(task_data)
+
+    async def _process_task(self, task_data: dict[str, Any]) -> None:
         """
-        Internal worker coroutine that processes a single task from the queue.
+        Process a single task: acquire limits, make the call and record the result.
 
         Args:
             task_data: Dictionary containing the API coroutine and event.
@@ -201,9 +236,47 @@ class Executor:
             "api_coro": api_call_coroutine,
             "event": event,
         }
-        await self.work_queue.put(task_data)
+        if self._batch_window > 0:
+            await self._batch_slots.acquire()
+            batch = self._pending.get(endpoint_url)
+            if batch is None:
+                # First task of a new batch opens its window
+                self._pending[endpoint_url] = [task_data]
+                flush_task = asyncio.create_task(self._flush_after_window(endpoint_url))
+                self._flush_tasks.add(flush_task)
+                flush_task.add_done_callback(self._flush_tasks.discard)
+            else:
+                batch.append(task_data)
+        else:
+            await self.work_queue.put(task_data)
         return event
 
+    async def _flush_after_window(self, endpoint_url: Optional[str]) -> None:
+        """
+        Wait for the batch window to elapse, then flush the endpoint's batch.
+
+        The window ends early when the executor is stopping.
+
+        Args:
+            endpoint_url: The endpoint whose pending tasks should be flushed.
+        """
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._flush_now.wait(), timeout=self._batch_window)
+        await self._flush(endpoint_url)
+
+    async def _flush(self, endpoint_url: Optional[str]) -> None:
+        """
+        Enqueue all pending tasks for an endpoint as a single queue item.
+
+        Args:
+            endpoint_url: The endpoint whose pending tasks should be flushed.
+        """
+        batch = self._pending.pop(endpoint_url, None)
+        if not batch:
+            return
+        logger.debug(f"Flushing batch of {len(batch)} tasks for {endpoint_url}")
+        await self.work_queue.put(batch)
+
     async def start(self) -> None:
         """
         Start the executor and its internal worker queue.
@@ -215,6 +288,7 @@ class Executor:
             return
 
         self._is_running = True
+        self._flush_now.clear()
         await self.work_queue.start()
         await self.work_queue.process(
             worker_func=self._worker, num_workers=self._num_workers
@@ -233,6 +307,15 @@ class Executor:
             return
 
         self._is_running = False
+
+        # Close every open batch window and wait until those batches are
+        # enqueued; cancelling a flush mid-put would leave its tasks QUEUED
+        self._flush_now.set()
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks)
+        if graceful:
+            await self.work_queue.join()
+
         await self.work_queue.stop(timeout=None if graceful else 0.1)
         logger.info(f"Executor stopped (graceful={graceful})")
 
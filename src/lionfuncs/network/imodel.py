@@ -78,9 +78,10 @@ class iModel:
         """
         client = await self.endpoint.get_client()
 
-        # Prepare the final set of arguments for the API call
-        # Start with endpoint defaults, then merge payload, then call-specific overrides
-        merged_call_args = self.endpoint.config.default_request_kwargs.copy()
+        # Endpoint defaults sit under call-specific overrides and are merged into
+        # a dict per call, so later changes to the defaults never reach a
+        # request that is already queued
+        default_call_args = self.endpoint.config.default_request_kwargs
 
         if isinstance(request_payload, BaseModel):
             payload_dict = request_payload.model_dump(exclude_none=True)
@@ -119,11 +120,9 @@ class iModel:
             )
             event_method_str = _http_method
 
-            # Prepare kwargs for AsyncAPIClient.request
-            client_request_kwargs = merged_call_args.copy()
-            client_request_kwargs.update(
-                additional_request_params
-            )  # call_specific_kwargs override endpoint defaults
+            # Prepare kwargs for AsyncAPIClient.request; call-specific kwargs
+            # override endpoint defaults
+            client_request_kwargs = {**default_call_args, **additional_request_params}
 
             if _http_method in [
                 "POST",
@@ -177,19 +176,26 @@ class iModel:
             event_endpoint_url_str = f"sdk://{self.endpoint.config.sdk_config.sdk_provider_name}/{_sdk_method_name}"
             event_method_str = "SDK_CALL"
 
-            # For SDKs, typically all data is passed as keyword arguments
-            sdk_call_final_args = merged_call_args.copy()
-
+            # For SDKs, typically all data is passed as keyword arguments:
+            # call-specific kwargs override the payload, which overrides defaults
             if isinstance(payload_dict, dict):  # If payload is a dict, merge it
-                sdk_call_final_args.update(payload_dict)
-            elif (
-                payload_dict is not None
-            ):  # If payload is not a dict but not None, log a warning
-                logger.warning(
-                    "Non-dict request_payload for SDK call might not be correctly passed unless SDK method expects a single positional arg."
-                )
+                sdk_call_final_args = {
+                    **default_call_args,
+                    **payload_dict,
+                    **additional_request_params,
+                }
+            else:
+                if (
+                    payload_dict is not None
+                ):  # If payload is not a dict but not None, log a warning
+                    logger.warning(
+                        "Non-dict request_payload for SDK call might not be correctly passed unless SDK method expects a single positional arg."
+                    )
+                sdk_call_final_args = {
+                    **default_call_args,
+                    **additional_request_params,
+                }
 
-            sdk_call_final_args.update(additional_request_params)
             event_payload_to_log = sdk_call_final_args.copy()
 
             # Define a function instead of using lambda
@@ -6,6 +6,7 @@ header factories, and rate limiting.
 """
 
 import logging
+import re
 import time
 from typing import Any, Callable, Literal, Optional, TypeVar, Union
 
@@ -19,6 +20,34 @@ logger = logging.getLogger(__name__)
 # Auth types supported by HeaderFactory
 AUTH_TYPES = Literal["bearer", "x-api-key"]
 
+# Rate limit header prefixes recognized by AdaptiveRateLimiter, in priority order
+_RATE_LIMIT_HEADER_PREFIXES = ("x-ratelimit-", "x-rate-limit-", "ratelimit-", "x-rl-")
+
+# Lowercased rate limit header name -> (prefix index, slot) where slot 0 is
+# limit, 1 is remaining and 2 is reset
+_RATE_LIMIT_HEADER_SLOTS: dict[str, tuple[int, int]] = {
+    f"{prefix}{name}": (i, j)
+    for i, prefix in enumerate(_RATE_LIMIT_HEADER_PREFIXES)
+    for j, name in enumerate(("limit", "remaining", "reset"))
+}
+_RETRY_AFTER_HEADER = "retry-after"
+
+# Matches every recognized rate limit header line in a raw CRLF-joined header
+# block, so raw responses can be scanned in one pass without building a dict
+_RL_RE = re.compile(
+    rb"^("
+    + b"|".join(
+        re.escape(name.encode())
+        for name in (*_RATE_LIMIT_HEADER_SLOTS, _RETRY_AFTER_HEADER)
+    )
+    + rb"):[ \t]*(\S+)",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+# TokenBucketRateLimiter keeps its bucket in integer micro-tokens so that
+# refills and decrements are exact and never accumulate float drift
+_MICRO_TOKENS = 1_000_000
+
 
 class HeaderFactory:
     """Utility for creating authentication and content headers."""
@@ -89,11 +118,15 @@ class HeaderFactory:
         if not api_key:
             raise ValueError("API key is required for authentication")
 
-        headers = HeaderFactory.get_content_type_header(content_type)
+        # Built directly rather than via the helpers above to avoid the extra
+        # calls and intermediate dicts on this path
         if auth_type == "bearer":
-            headers.update(HeaderFactory.get_bearer_auth_header(api_key))
+            headers = {
+                "Content-Type": content_type,
+                "Authorization": f"Bearer {api_key}",
+            }
         elif auth_type == "x-api-key":
-            headers.update(HeaderFactory.get_x_api_key_header(api_key))
+            headers = {"Content-Type": content_type, "x-api-key": api_key}
         else:
             raise ValueError(f"Unsupported auth type: {auth_type}")
 
@@ -135,6 +168,27 @@ class EndpointConfig(BaseModel):
             return f"{self.base_url}/{self.endpoint}"
         return f"{self.base_url}/{self.endpoint.format(**self.params)}"
 
+    @property
+    def base_headers(self) -> dict[str, str]:
+        """
+        Get the auth, content type and default headers for the endpoint.
+
+        The headers are built with HeaderFactory.get_header on every access,
+        so they always reflect the current config.
+
+        Returns:
+            A dictionary with the headers.
+
+        Raises:
+            ValueError: If the API key is missing or the auth type is unsupported.
+        """
+        return HeaderFactory.get_header(
+            auth_type=self.auth_type,
+            content_type=self.content_type,
+            api_key=self.api_key,
+            default_headers=self.default_headers,
+        )
+
     def update(self, **kwargs) -> None:
         """
         Update the config with new values.
@@ -193,26 +247,23 @@ class Endpoint:
         Create payload and headers for a request.
 
         Args:
-            request: The request parameters or model.
+            request: The request parameters or model. Models are dumped by
+                alias with None fields excluded.
             extra_headers: Additional headers to include.
             **kwargs: Additional keyword arguments for the request.
 
         Returns:
             A tuple of (payload, headers).
         """
-        headers = HeaderFactory.get_header(
-            auth_type=self.config.auth_type,
-            content_type=self.config.content_type,
-            api_key=self.config.api_key,
-            default_headers=self.config.default_headers,
-        )
+        headers = self.config.base_headers
         if extra_headers:
             headers.update(extra_headers)
 
+        # Models are keyed by their wire aliases; None values are not sent
         request_dict = (
             request
             if isinstance(request, dict)
-            else request.model_dump(exclude_none=True)
+            else request.model_dump(exclude_none=True, by_alias=True)
         )
         params = self.config.kwargs.copy()
 
@@ -262,6 +313,9 @@ class TokenBucketRateLimiter:
     bucket at a constant rate, and each request consumes one or more tokens.
     If the bucket is empty, requests must wait until enough tokens are
     available.
+
+    Token counts are stored internally as integer micro-tokens; the
+    tokens and max_tokens attributes convert to and from floats.
     """
 
     def __init__(
@@ -285,7 +339,6 @@ class TokenBucketRateLimiter:
         self.max_tokens = max_tokens if max_tokens is not None else rate
         self.tokens = initial_tokens if initial_tokens is not None else self.max_tokens
         self.last_refill = time.monotonic()
-        self._lock = Lock()  # Using our own Lock implementation
 
         logger.debug(
             f"Initialized TokenBucketRateLimiter with rate={rate}, "
@@ -293,23 +346,57 @@ class TokenBucketRateLimiter:
             f"initial_tokens={self.tokens}"
         )
 
-    async def _refill(self) -> None:
+    @property
+    def tokens(self) -> float:
+        """Current number of tokens in the bucket."""
+        return self._tokens_u / _MICRO_TOKENS
+
+    @tokens.setter
+    def tokens(self, value: float) -> None:
+        self._tokens_u = round(value * _MICRO_TOKENS)
+
+    @property
+    def max_tokens(self) -> float:
+        """Maximum token bucket capacity."""
+        return self._max_tokens_u / _MICRO_TOKENS
+
+    @max_tokens.setter
+    def max_tokens(self, value: float) -> None:
+        self._max_tokens_u = round(value * _MICRO_TOKENS)
+
+    def _scale_tokens(self, new_rate: float) -> None:
+        """
+        Scale the current tokens by new_rate / rate using integer arithmetic.
+
+        Args:
+            new_rate: The rate the limiter is about to switch to.
+        """
+        self._tokens_u = (
+            self._tokens_u
+            * round(new_rate * _MICRO_TOKENS)
+            // round(self.rate * _MICRO_TOKENS)
+        )
+
+    def _refill(self) -> None:
         """
         Refill tokens based on elapsed time.
 
         This method calculates the number of tokens to add based on the
         time elapsed since the last refill, and adds them to the bucket
-        up to the maximum capacity.
+        up to the maximum capacity. It never awaits, so it runs atomically
+        with respect to other tasks on the event loop.
         """
         now = time.monotonic()
         elapsed = now - self.last_refill
-        new_tokens = elapsed * (self.rate / self.period)
+        new_tokens_u = int(elapsed * self.rate * _MICRO_TOKENS / self.period)
 
-        if new_tokens > 0:
-            self.tokens = min(self.tokens + new_tokens, self.max_tokens)
+        # Only advance last_refill once at least one micro-token has accrued,
+        # so very frequent calls don't lose the fractional remainder
+        if new_tokens_u > 0:
+            self._tokens_u = min(self._tokens_u + new_tokens_u, self._max_tokens_u)
             self.last_refill = now
             logger.debug(
-                f"Refilled {new_tokens:.2f} tokens, current tokens: {self.tokens:.2f}/{self.max_tokens}"
+                f"Refilled {new_tokens_u / _MICRO_TOKENS:.2f} tokens, current tokens: {self.tokens:.2f}/{self.max_tokens}"
             )
 
     async def acquire(self, tokens: float = 1.0) -> float:
@@ -323,26 +410,28 @@ class TokenBucketRateLimiter:
             Wait time in seconds before tokens are available.
             Returns 0.0 if tokens are immediately available.
         """
-        async with self._lock:
-            await self._refill()
-
-            if self.tokens >= tokens:
-                self.tokens -= tokens
-                logger.debug(
-                    f"Acquired {tokens} tokens, remaining: {self.tokens:.2f}/{self.max_tokens}"
-                )
-                return 0.0
-
-            # Calculate wait time until enough tokens are available
-            deficit = tokens - self.tokens
-            wait_time = deficit * self.period / self.rate
+        # No await between the refill and the decrement, so no other task can
+        # interleave here and a lock is unnecessary.
+        self._refill()
 
+        tokens_u = round(tokens * _MICRO_TOKENS)
+        if self._tokens_u >= tokens_u:
+            self._tokens_u -= tokens_u
             logger.debug(
-                f"Not enough tokens (requested: {tokens}, available: {self.tokens:.2f}/{self.max_tokens}), "
-                f"wait time: {wait_time:.2f}s"
+                f"Acquired {tokens} tokens, remaining: {self.tokens:.2f}/{self.max_tokens}"
             )
+            return 0.0
+
+        # Calculate wait time until enough tokens are available
+        deficit = (tokens_u - self._tokens_u) / _MICRO_TOKENS
+        wait_time = deficit * self.period / self.rate
 
-            return wait_time
+        logger.debug(
+            f"Not enough tokens (requested: {tokens}, available: {self.tokens:.2f}/{self.max_tokens}), "
+            f"wait time: {wait_time:.2f}s"
+        )
+
+        return wait_time
 
     async def execute(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
         """
@@ -410,12 +499,16 @@ class EndpointRateLimiter:
         Returns:
             The rate limiter for the specified endpoint.
         """
-        if endpoint not in self.limiters:
-            logger.debug(f"Creating new rate limiter for endpoint: {endpoint}")
-            self.limiters[endpoint] = TokenBucketRateLimiter(
-                rate=self.default_rate, period=self.default_period
-            )
-        return self.limiters[endpoint]
+        limiter = self.limiters.get(endpoint)
+        if limiter is not None:
+            return limiter
+
+        logger.debug(f"Creating new rate limiter for endpoint: {endpoint}")
+        limiter = TokenBucketRateLimiter(
+            rate=self.default_rate, period=self.default_period
+        )
+        self.limiters[endpoint] = limiter
+        return limiter
 
     async def execute(
         self,
@@ -475,10 +568,7 @@ class EndpointRateLimiter:
                 and original_tokens > 0
             ):
                 # Reduce tokens proportionally to the rate reduction
-                reduction_factor = rate / limiter.rate
-                limiter.tokens = min(
-                    original_tokens * reduction_factor, original_tokens
-                )
+                limiter._scale_tokens(rate)
                 logger.debug(
                     f"Adjusted tokens for endpoint {endpoint}: {original_tokens} -> {limiter.tokens}"
                 )
@@ -552,6 +642,25 @@ class AdaptiveRateLimiter(TokenBucketRateLimiter):
             f"safety_factor={safety_factor}"
         )
 
+    def update_from_raw_headers(self, raw_headers: bytes) -> None:
+        """
+        Update rate limits from a raw response header block.
+
+        Scans the block with a single precompiled regex and only decodes the
+        rate limit headers it finds, which avoids materializing a header dict
+        when headers are available as bytes (e.g. httpx's ``headers.raw``
+        joined with ``b"\\r\\n"``).
+
+        Args:
+            raw_headers: CRLF-separated ``name: value`` header lines.
+        """
+        self.update_from_headers(
+            {
+                match.group(1).decode("latin-1"): match.group(2).decode("latin-1")
+                for match in _RL_RE.finditer(raw_headers)
+            }
+        )
+
     def update_from_headers(self, headers: dict[str, str]) -> None:
         """
         Update rate limits based on API response headers.
@@ -566,8 +675,17 @@ class AdaptiveRateLimiter(TokenBucketRateLimiter):
         Args:
             headers: Response headers from API.
         """
-        # Convert headers to lowercase for case-insensitive matching
-        lower_headers = {k.lower(): v for k, v in headers.items()}
+        # Single pass over the headers, lowercasing each key once and
+        # bucketing the values we care about by prefix
+        found: dict[int, list[Optional[str]]] = {}
+        retry_after_value = None
+        for key, value in headers.items():
+            lower_key = key.lower()
+            slot = _RATE_LIMIT_HEADER_SLOTS.get(lower_key)
+            if slot is not None:
+                found.setdefault(slot[0], [None, None, None])[slot[1]] = value
+            elif lower_key == _RETRY_AFTER_HEADER:
+                retry_after_value = value
 
         # Look for rate limit info in headers
         limit = None
@@ -575,18 +693,16 @@ class AdaptiveRateLimiter(TokenBucketRateLimiter):
         reset = None
 
         # Try different header patterns
-        for prefix in ["x-ratelimit-", "x-rate-limit-", "ratelimit-", "x-rl-"]:
-            if (
-                f"{prefix}limit" in lower_headers
-                and f"{prefix}remaining" in lower_headers
-            ):
+        for index in sorted(found):
+            prefix = _RATE_LIMIT_HEADER_PREFIXES[index]
+            limit_value, remaining_value, reset_value = found[index]
+            if limit_value is not None and remaining_value is not None:
                 try:
-                    limit = int(lower_headers[f"{prefix}limit"])
-                    remaining = int(lower_headers[f"{prefix}remaining"])
+                    limit = int(limit_value)
+                    remaining = int(remaining_value)
 
                     # Reset time can be in different formats
-                    if f"{prefix}reset" in lower_headers:
-                        reset_value = lower_headers[f"{prefix}reset"]
+                    if reset_value is not None:
                         try:
                             # Try parsing as epoch timestamp
                             reset = float(reset_value)
@@ -613,9 +729,9 @@ class AdaptiveRateLimiter(TokenBucketRateLimiter):
                     logger.warning(f"Error parsing rate limit headers: {e}")
 
         # Check for Retry-After header (simpler format used by some APIs)
-        if "retry-after" in lower_headers and not (limit and remaining):
+        if retry_after_value is not None and not (limit and remaining):
             try:
-                retry_after = float(lower_headers["retry-after"])
+                retry_after = float(retry_after_value)
                 # Assume we're at the limit
                 limit = 1
                 remaining = 0
@@ -642,14 +758,15 @@ class AdaptiveRateLimiter(TokenBucketRateLimiter):
                 f"requests per second (was: {self.rate:.2f})"
             )
 
+            # If the rate is being reduced, reduce tokens proportionally
+            reduce_tokens = final_rate < self.rate and self._tokens_u > 0
+            if reduce_tokens:
+                self._scale_tokens(final_rate)
+
             # Update the rate
-            old_rate = self.rate
             self.rate = final_rate
 
-            # If the rate was reduced, reduce tokens proportionally
-            if final_rate < old_rate and self.tokens > 0:
-                reduction_factor = final_rate / old_rate
-                self.tokens = min(self.tokens * reduction_factor, self.tokens)
+            if reduce_tokens:
                 logger.debug(
                     f"Adjusted tokens due to rate reduction: {self.tokens:.2f}/{self.max_tokens}"
                 )
@@ -720,6 +837,28 @@ class ServiceEndpointConfig(BaseModel):
     # For SDK, these are default parameters for the SDK method call.
     default_request_kwargs: dict[str, Any] = Field(default_factory=dict)
 
+    @classmethod
+    def from_trusted(cls, **data: Any) -> "ServiceEndpointConfig":
+        """
+        Build a config from already-validated data, skipping field validation.
+
+        Only use this when the caller guarantees the shape of ``data``, e.g. when
+        deriving a config from a validated one via ``model_dump()`` with a few
+        fields overridden. Nested configs must already be model instances.
+
+        Args:
+            **data: Field values for the config.
+
+        Returns:
+            A ServiceEndpointConfig built with ``model_construct``.
+
+        Raises:
+            ValueError: If the transport-specific requirements are not met.
+        """
+        # model_construct still runs model_post_init, so transport defaults and
+        # the cheap transport checks are applied
+        return cls.model_construct(**data)
+
     def model_post_init(self, __context):
         """Validate transport-specific configuration after initialization."""
         if self.transport_type == "http" and self.http_config is None:
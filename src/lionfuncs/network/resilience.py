@@ -10,15 +10,19 @@ import functools
 import logging
 import random
 import time
-from collections.abc import Awaitable, Callable
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable
 from enum import Enum
-from typing import Any, Optional, TypeVar
+from typing import Any, Optional, TypeVar, Union
 
 from lionfuncs.errors import CircuitBreakerOpenError
 
 T = TypeVar("T")
 logger = logging.getLogger(__name__)
 
+# Number of most recent state transitions a CircuitBreaker keeps in its metrics
+_STATE_CHANGE_HISTORY = 256
+
 
 class CircuitState(Enum):
     """Circuit breaker states."""
@@ -76,7 +80,10 @@ class CircuitBreaker:
         self.failure_threshold = failure_threshold
         self.recovery_time = recovery_time
         self.half_open_max_calls = half_open_max_calls
-        self.excluded_exceptions = excluded_exceptions or set()
+        # Stored as a tuple so the failure check is a single isinstance call
+        self._excluded_exceptions: tuple[type[Exception], ...] = tuple(
+            excluded_exceptions or ()
+        )
         self.name = name
 
         # State variables
@@ -84,14 +91,15 @@ class CircuitBreaker:
         self.state = CircuitState.CLOSED
         self.last_failure_time = 0
         self._half_open_calls = 0
-        self._lock = asyncio.Lock()
 
         # Metrics
         self._metrics = {
             "success_count": 0,
             "failure_count": 0,
             "rejected_count": 0,
-            "state_changes": [],
+            # Bounded ring buffer of (time, from, to) tuples; expanded to
+            # dicts only when metrics are read
+            "state_changes": deque(maxlen=_STATE_CHANGE_HISTORY),
         }
 
         logger.debug(
@@ -99,12 +107,22 @@ class CircuitBreaker:
             f"recovery_time={recovery_time}, half_open_max_calls={half_open_max_calls}"
         )
 
+    @property
+    def excluded_exceptions(self) -> frozenset[type[Exception]]:
+        """Exception types that do not count as failures (read-only)."""
+        return frozenset(self._excluded_exceptions)
+
     @property
     def metrics(self) -> dict[str, Any]:
         """Get circuit breaker metrics."""
-        return self._metrics.copy()
-
-    async def _change_state(self, new_state: CircuitState) -> None:
+        metrics = self._metrics.copy()
+        metrics["state_changes"] = [
+            {"time": changed_at, "from": old_state, "to": new_state}
+            for changed_at, old_state, new_state in self._metrics["state_changes"]
+        ]
+        return metrics
+
+    def _change_state(self, new_state: CircuitState) -> None:
         """
         Change circuit state with logging and metrics tracking.
 
@@ -115,11 +133,7 @@ class CircuitBreaker:
         if new_state != old_state:
             self.state = new_state
             self._metrics["state_changes"].append(
-                {
-                    "time": time.time(),
-                    "from": old_state.value,
-                    "to": new_state.value,
-                }
+                (time.time(), old_state.value, new_state.value)
             )
 
             logger.info(
@@ -132,48 +146,60 @@ class CircuitBreaker:
             elif new_state == CircuitState.CLOSED:
                 self.failure_count = 0
 
-    async def _check_state(self) -> bool:
+    def _reject_if_open(self) -> Optional[float]:
         """
-        Check circuit state and determine if request can proceed.
+        Reject a request if the circuit is open and still recovering.
+
+        Moves the circuit to half-open once the recovery time has elapsed.
 
         Returns:
-            True if request can proceed, False otherwise.
+            Seconds until recovery if the request was rejected, None otherwise.
         """
-        async with self._lock:
-            now = time.time()
-
-            if self.state == CircuitState.OPEN:
-                # Check if recovery time has elapsed
-                if now - self.last_failure_time >= self.recovery_time:
-                    await self._change_state(CircuitState.HALF_OPEN)
-                else:
-                    recovery_remaining = self.recovery_time - (
-                        now - self.last_failure_time
-                    )
-                    self._metrics["rejected_count"] += 1
+        if self.state is not CircuitState.OPEN:
+            return None
+
+        remaining = self.recovery_time - (time.monotonic() - self.last_failure_time)
+        if remaining <= 0:
+            self._change_state(CircuitState.HALF_OPEN)
+            return None
+
+        self._metrics["rejected_count"] += 1
+        logger.warning(
+            f"Circuit '{self.name}' is OPEN, rejecting request. "
+            f"Try again in {remaining:.2f}s"
+        )
+        return remaining
 
-                    logger.warning(
-                        f"Circuit '{self.name}' is OPEN, rejecting request. "
-                        f"Try again in {recovery_remaining:.2f}s"
-                    )
+    def _check_state(self) -> bool:
+        """
+        Check circuit state and determine if request can proceed.
 
-                    return False
+        This never awaits, so the read-modify-write of the breaker state is
+        atomic with respect to other tasks on the event loop and needs no lock.
 
-            if self.state == CircuitState.HALF_OPEN:
-                # Only allow a limited number of calls in half-open state
-                if self._half_open_calls >= self.half_open_max_calls:
-                    self._metrics["rejected_count"] += 1
+        Returns:
+            True if request can proceed, False otherwise.
+        """
+        state = self.state
+        if state is CircuitState.CLOSED:
+            return True
 
-                    logger.warning(
-                        f"Circuit '{self.name}' is HALF_OPEN and at capacity. "
-                        f"Try again later."
-                    )
+        if state is CircuitState.OPEN and self._reject_if_open() is not None:
+            return False
 
-                    return False
+        # Only allow a limited number of calls in half-open state
+        if self._half_open_calls >= self.half_open_max_calls:
+            self._metrics["rejected_count"] += 1
 
-                self._half_open_calls += 1
+            logger.warning(
+                f"Circuit '{self.name}' is HALF_OPEN and at capacity. "
+                f"Try again later."
+            )
 
-            return True
+            return False
+
+        self._half_open_calls += 1
+        return True
 
     async def execute(
         self, func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any
@@ -193,10 +219,17 @@ class CircuitBreaker:
             CircuitBreakerOpenError: If the circuit is open.
             Exception: Any exception raised by the function.
         """
+        # Reject while open with the retry-after value from the same clock read
+        remaining = self._reject_if_open()
+        if remaining is not None:
+            raise CircuitBreakerOpenError(
+                f"Circuit breaker '{self.name}' is open. Retry after {remaining:.2f} seconds",
+                retry_after=remaining,
+            )
+
         # Check if circuit allows this call
-        can_proceed = await self._check_state()
-        if not can_proceed:
-            remaining = self.recovery_time - (time.time() - self.last_failure_time)
+        if not self._check_state():
+            remaining = self.recovery_time - (time.monotonic() - self.last_failure_time)
             raise CircuitBreakerOpenError(
                 f"Circuit breaker '{self.name}' is open. Retry after {remaining:.2f} seconds",
                 retry_after=remaining,
@@ -209,39 +242,33 @@ class CircuitBreaker:
             result = await func(*args, **kwargs)
 
             # Handle success
-            async with self._lock:
-                self._metrics["success_count"] += 1
+            self._metrics["success_count"] += 1
 
-                # On success in half-open state, close the circuit
-                if self.state == CircuitState.HALF_OPEN:
-                    await self._change_state(CircuitState.CLOSED)
+            # On success in half-open state, close the circuit
+            if self.state is CircuitState.HALF_OPEN:
+                self._change_state(CircuitState.CLOSED)
 
             return result
 
         except Exception as e:
-            # Determine if this exception should count as a circuit failure
-            is_excluded = any(
-                isinstance(e, exc_type) for exc_type in self.excluded_exceptions
-            )
+            # Excluded exceptions (and their subclasses) don't count as failures
+            if not isinstance(e, self._excluded_exceptions):
+                self.failure_count += 1
+                self.last_failure_time = time.monotonic()
+                self._metrics["failure_count"] += 1
 
-            if not is_excluded:
-                async with self._lock:
-                    self.failure_count += 1
-                    self.last_failure_time = time.time()
-                    self._metrics["failure_count"] += 1
-
-                    # Log failure
-                    logger.warning(
-                        f"Circuit '{self.name}' failure: {e}. "
-                        f"Count: {self.failure_count}/{self.failure_threshold}"
-                    )
+                # Log failure
+                logger.warning(
+                    f"Circuit '{self.name}' failure: {e}. "
+                    f"Count: {self.failure_count}/{self.failure_threshold}"
+                )
 
-                    # Check if we need to open the circuit
-                    if (
-                        self.state == CircuitState.CLOSED
-                        and self.failure_count >= self.failure_threshold
-                    ) or self.state == CircuitState.HALF_OPEN:
-                        await self._change_state(CircuitState.OPEN)
+                # Check if we need to open the circuit
+                if (
+                    self.state is CircuitState.CLOSED
+                    and self.failure_count >= self.failure_threshold
+                ) or self.state is CircuitState.HALF_OPEN:
+                    self._change_state(CircuitState.OPEN)
 
             logger.exception(f"Circuit breaker '{self.name}' caught exception")
             raise
@@ -301,6 +328,134 @@ class RetryConfig:
             "exclude_exceptions": self.exclude_exceptions,
         }
 
+    def as_driver(self) -> Callable[..., Awaitable[Any]]:
+        """
+        Get the retry driver for this configuration.
+
+        Drivers are cached per distinct configuration, so calling this is cheap
+        and configurations with equal settings share one driver.
+
+        Returns:
+            An async function ``driver(func, *args, **kwargs)`` that calls
+            ``func`` with retries, equivalent to retry_with_backoff.
+        """
+        return _build_retry_driver(
+            self.max_retries,
+            self.base_delay,
+            self.max_delay,
+            self.backoff_factor,
+            self.jitter,
+            self.jitter_factor,
+            _exception_tuple(self.retry_exceptions),
+            _exception_tuple(self.exclude_exceptions),
+        )
+
+
+def _exception_tuple(
+    exceptions: Union[type[Exception], Iterable[type[Exception]]],
+) -> tuple[type[Exception], ...]:
+    """
+    Normalize exception types to a hashable tuple for the driver cache key.
+
+    Args:
+        exceptions: A single exception class or an iterable of them, as
+            accepted by an ``except`` clause.
+
+    Returns:
+        The exception types as a tuple.
+    """
+    if isinstance(exceptions, type):
+        return (exceptions,)
+    return tuple(exceptions)
+
+
+@functools.lru_cache(maxsize=128)
+def _build_retry_driver(
+    max_retries: int,
+    base_delay: float,
+    max_delay: float,
+    backoff_factor: float,
+    jitter: bool,
+    jitter_factor: float,
+    retry_exceptions: tuple[type[Exception], ...],
+    exclude_exceptions: tuple[type[Exception], ...],
+) -> Callable[..., Awaitable[Any]]:
+    """
+    Build a retry driver with the given settings bound as constants.
+
+    Drivers are cached per distinct configuration, so repeated calls with the
+    same settings reuse one closure instead of re-resolving the options.
+
+    Args:
+        max_retries: Maximum number of retries.
+        base_delay: Initial delay between retries in seconds.
+        max_delay: Maximum delay between retries in seconds.
+        backoff_factor: Factor to increase delay with each retry.
+        jitter: Whether to add randomness to the delay.
+        jitter_factor: How much randomness to add as a percentage.
+        retry_exceptions: Tuple of exception types to retry.
+        exclude_exceptions: Tuple of exception types to not retry.
+
+    Returns:
+        An async function ``driver(func, *args, **kwargs)`` that calls
+        ``func`` with retries.
+    """
+    # Pre-compute the backoff schedule once per configuration; jitter is applied
+    # multiplicatively per retry before capping at max_delay. The schedule stops
+    # once every later retry would wait the same as its last entry: when even
+    # the lowest jitter reaches max_delay, or the delay stops changing. Later
+    # retries reuse the last entry, so max_retries may be arbitrarily large.
+    lowest_jitter = 1.0 - jitter_factor if jitter else 1.0
+    schedule = []
+    delay = base_delay
+    while len(schedule) < max_retries:
+        schedule.append(delay)
+        next_delay = delay * backoff_factor
+        if delay * lowest_jitter >= max_delay or next_delay == delay:
+            break
+        delay = next_delay
+    delays = tuple(schedule if jitter else (min(d, max_delay) for d in schedule))
+    last_scheduled = len(delays)
+
+    async def driver(func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+        retries = 0
+
+        while True:
+            try:
+                return await func(*args, **kwargs)
+            except exclude_exceptions:
+                # Don't retry these exceptions
+                logger.debug(
+                    f"Not retrying {func.__name__} for excluded exception type"
+                )
+                raise
+            except retry_exceptions as e:
+                # No need to store the exception since we're raising it if max retries reached
+                retries += 1
+                if retries > max_retries:
+                    logger.warning(
+                        f"Maximum retries ({max_retries}) reached for {func.__name__}"
+                    )
+                    raise
+
+                current_delay = delays[min(retries, last_scheduled) - 1]
+                if jitter:
+                    # This is not used for cryptographic purposes, just for jitter
+                    jitter_amount = random.uniform(
+                        1.0 - jitter_factor, 1.0 + jitter_factor
+                    )
+                    current_delay = min(current_delay * jitter_amount, max_delay)
+
+                logger.info(
+                    f"Retry {retries}/{max_retries} for {func.__name__} "
+                    f"after {current_delay:.2f}s delay. Error: {e!s}"
+                )
+
+                # Wait before retrying
+                await asyncio.sleep(current_delay)
+
+    return driver
+
 
 async def retry_with_backoff(
     func: Callable[..., Awaitable[T]],
@@ -337,43 +492,17 @@ async def retry_with_backoff(
     Raises:
         Exception: The last exception raised by the function after all retries.
     """
-    retries = 0
-    delay = base_delay
-
-    while True:
-        try:
-            return await func(*args, **kwargs)
-        except exclude_exceptions:
-            # Don't retry these exceptions
-            logger.debug(f"Not retrying {func.__name__} for excluded exception type")
-            raise
-        except retry_exceptions as e:
-            # No need to store the exception since we're raising it if max retries reached
-            retries += 1
-            if retries > max_retries:
-                logger.warning(
-                    f"Maximum retries ({max_retries}) reached for {func.__name__}"
-                )
-                raise
-
-            # Calculate backoff with optional jitter
-            if jitter:
-                # This is not used for cryptographic purposes, just for jitter
-                jitter_amount = random.uniform(1.0 - jitter_factor, 1.0 + jitter_factor)
-                current_delay = min(delay * jitter_amount, max_delay)
-            else:
-                current_delay = min(delay, max_delay)
-
-            logger.info(
-                f"Retry {retries}/{max_retries} for {func.__name__} "
-                f"after {current_delay:.2f}s delay. Error: {e!s}"
-            )
-
-            # Increase delay for next iteration
-            delay = delay * backoff_factor
-
-            # Wait before retrying
-            await asyncio.sleep(current_delay)
+    driver = _build_retry_driver(
+        max_retries,
+        base_delay,
+        max_delay,
+        backoff_factor,
+        jitter,
+        jitter_factor,
+        _exception_tuple(retry_exceptions),
+        _exception_tuple(exclude_exceptions),
+    )
+    return await driver(func, *args, **kwargs)
 
 
 def circuit_breaker(
@@ -409,10 +538,12 @@ def circuit_breaker(
             excluded_exceptions=excluded_exceptions,
             name=cb_name,
         )
+        # Bind the breaker's execute method once at decoration time
+        execute = cb.execute
 
         @functools.wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> T:
-            return await cb.execute(func, *args, **kwargs)
+            return await execute(func, *args, **kwargs)
 
         return wrapper
 
@@ -446,22 +577,22 @@ def with_retry(
         Decorator function that applies retry pattern.
     """
 
+    # Resolve the retry driver once at decoration time
+    driver = _build_retry_driver(
+        max_retries,
+        base_delay,
+        max_delay,
+        backoff_factor,
+        jitter,
+        jitter_factor,
+        _exception_tuple(retry_exceptions),
+        _exception_tuple(exclude_exceptions),
+    )
+
     def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
         @functools.wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> T:
-            return await retry_with_backoff(
-                func,
-                *args,
-                retry_exceptions=retry_exceptions,
-                exclude_exceptions=exclude_exceptions,
-                max_retries=max_retries,
-                base_delay=base_delay,
-                max_delay=max_delay,
-                backoff_factor=backoff_factor,
-                jitter=jitter,
-                jitter_factor=jitter_factor,
-                **kwargs,
-            )
+            return await driver(func, *args, **kwargs)
 
         return wrapper
 
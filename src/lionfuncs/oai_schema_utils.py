@@ -1,8 +1,11 @@
 """Utilities for generating and manipulating schemas."""
 
+import copy
+import functools
 import inspect
 import re
 import types
+import weakref
 from typing import Any, Callable, Union, get_type_hints
 
 from pydantic import BaseModel
@@ -23,9 +26,43 @@ _PY_TO_JSON_TYPE_MAP = {
 }
 
 
+# Direct lookup for the builtin types, skipping typing introspection entirely
+_SIMPLE_TYPE_NAMES = {
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    list: "array",
+    tuple: "array",
+    dict: "object",
+}
+
+
 def _get_type_name(annotation: Any) -> str:
     """Get a string representation of a type annotation.
 
+    Builtin types are resolved from a lookup table and other hashable
+    annotations are memoized, so each distinct annotation is introspected once.
+
+    Args:
+        annotation: The type annotation to convert
+
+    Returns:
+        str: String representation of the type
+    """
+    try:
+        simple = _SIMPLE_TYPE_NAMES.get(annotation)
+    except TypeError:
+        # Unhashable annotations cannot be looked up or cached
+        return _resolve_type_name(annotation)
+    if simple is not None:
+        return simple
+    return _cached_type_name(annotation)
+
+
+def _resolve_type_name(annotation: Any) -> str:
+    """Resolve the string representation of a type annotation without caching.
+
     Args:
         annotation: The type annotation to convert
 
@@ -58,6 +95,26 @@ def _get_type_name(annotation: Any) -> str:
     return _PY_TO_JSON_TYPE_MAP.get(type_name, type_name)
 
 
+_cached_type_name = functools.lru_cache(maxsize=256)(_resolve_type_name)
+
+
+# Docstring parsing patterns, compiled once at import time.
+# Finds the "Args:" or "Parameters:" section and captures its content
+_RE_ARGS_SECTION = re.compile(
+    r"(Args|Parameters):\s*\n(.*?)(?=\n\n|\Z)", re.MULTILINE | re.DOTALL
+)
+# Individual "name (type): description" entries, including multiline descriptions
+_RE_TYPED_PARAM = re.compile(
+    r"^\s*([_a-zA-Z]\w*)\s*\(.*?\)?\s*:\s*(.*?)(?=\n\s*[_a-zA-Z]\w*\s*\(|\Z)",
+    re.MULTILINE | re.DOTALL,
+)
+# Fallback for the simpler "name: description" format
+_RE_PLAIN_PARAM = re.compile(
+    r"^\s*([_a-zA-Z]\w*)\s*:\s*(.*?)(?=\n\s*[_a-zA-Z]\w*\s*:|\Z)",
+    re.MULTILINE | re.DOTALL,
+)
+
+
 def _extract_docstring_parts(docstring: str | None) -> tuple[str, dict[str, str]]:
     """Extract function description and parameter descriptions from docstring.
 
@@ -70,41 +127,18 @@ def _extract_docstring_parts(docstring: str | None) -> tuple[str, dict[str, str]
     if not docstring:
         return "", {}
 
-    # Split docstring into sections
-    parts = docstring.strip().split("\n\n")
-
-    # First part is the function description
-    func_description = parts[0].strip()
+    # First paragraph is the function description
+    func_description = docstring.strip().partition("\n\n")[0].strip()
 
     # Look for Args/Parameters section
     param_descriptions = {}
-    # Regex to find "Args:" or "Parameters:" section and capture content
-    args_section_match = re.search(
-        r"(Args|Parameters):\s*\n((?:.|\n)*?)(?=\n\n|\Z)", docstring, re.MULTILINE
-    )
+    args_section_match = _RE_ARGS_SECTION.search(docstring)
 
     if args_section_match:
         args_content = args_section_match.group(2)
-        # Regex to capture individual parameters and their descriptions
-        # Handles multiline descriptions by looking for lines indented more than the parameter name
-        param_matches = re.finditer(
-            r"^\s*([_a-zA-Z]\w*)\s*\(.*?\)?\s*:\s*(.*?)(?=\n\s*[_a-zA-Z]\w*\s*\(|\Z)",
-            args_content,
-            re.MULTILINE | re.DOTALL,
-        )
-        if not list(
-            re.finditer(
-                r"^\s*([_a-zA-Z]\w*)\s*\(.*?\)?\s*:\s*(.*?)(?=\n\s*[_a-zA-Z]\w*\s*\(|\Z)",
-                args_content,
-                re.MULTILINE | re.DOTALL,
-            )
-        ):  # check if any matches found
-            # Fallback for simpler "param: description" format if the above doesn't match
-            param_matches = re.finditer(
-                r"^\s*([_a-zA-Z]\w*)\s*:\s*(.*?)(?=\n\s*[_a-zA-Z]\w*\s*:|\Z)",
-                args_content,
-                re.MULTILINE | re.DOTALL,
-            )
+        param_matches = list(_RE_TYPED_PARAM.finditer(args_content))
+        if not param_matches:
+            param_matches = _RE_PLAIN_PARAM.finditer(args_content)
 
         for match in param_matches:
             param_name = match.group(1).strip()
@@ -121,7 +155,59 @@ def function_to_openai_schema(func: Callable) -> dict[str, Any]:
     """Generate an OpenAI function schema from a Python function.
 
     Analyzes a function's signature, type hints, and docstring to generate
-    a schema compatible with OpenAI's function calling API.
+    a schema compatible with OpenAI's function calling API. Schemas of plain
+    functions are cached per function object until its docstring changes; each
+    call returns a fresh copy that is safe to modify.
+
+    Args:
+        func: The function to generate a schema for
+
+    Returns:
+        dict: A schema describing the function, including its name,
+              description, and parameter details
+    """
+    # Bound methods would keep their instance alive in the cache, and closures
+    # are usually recreated per call, so only plain functions are cached
+    if not isinstance(func, types.FunctionType) or func.__closure__ is not None:
+        return _build_function_schema(func)
+
+    doc = func.__doc__
+    entry = _FUNCTION_SCHEMA_CACHE.get(func)
+    if entry is None or entry[0] is not doc:
+        entry = (doc, _build_function_schema(func))
+        _FUNCTION_SCHEMA_CACHE[func] = entry
+    return _copy_function_schema(entry[1])
+
+
+def _copy_function_schema(schema: dict[str, Any]) -> dict[str, Any]:
+    """Copy a function schema deeply enough that callers cannot alter the cache.
+
+    Args:
+        schema: A schema produced by `_build_function_schema`
+
+    Returns:
+        dict: An independent copy of the schema
+    """
+    parameters = schema["parameters"]
+    return {
+        "name": schema["name"],
+        "description": schema["description"],
+        "parameters": {
+            "type": parameters["type"],
+            "properties": {
+                name: dict(prop) for name, prop in parameters["properties"].items()
+            },
+            "required": list(parameters["required"]),
+        },
+    }
+
+
+# Parameters that are bound implicitly and never part of the schema
+_SKIPPED_PARAMS = frozenset({"self", "cls"})
+
+
+def _build_function_schema(func: Callable) -> dict[str, Any]:
+    """Build the OpenAI function schema for `func` without caching.
 
     Args:
         func: The function to generate a schema for
@@ -145,30 +231,27 @@ def function_to_openai_schema(func: Callable) -> dict[str, Any]:
         # Handle cases where get_type_hints might fail
         type_hints = {}
 
-    # Create parameters schema
-    parameters = {"type": "object", "properties": {}, "required": []}
+    # Skip self/cls parameters
+    params = [
+        (name, param)
+        for name, param in sig.parameters.items()
+        if name not in _SKIPPED_PARAMS
+    ]
+    empty = inspect.Parameter.empty
 
-    for name, param in sig.parameters.items():
-        # Skip self/cls parameters
-        if name in ("self", "cls"):
-            continue
-
-        # Get parameter type
-        annotation = type_hints.get(name, param.annotation)
-        param_type = _get_type_name(annotation)
-
-        # Get parameter description
-        description = param_descriptions.get(name, "")
-
-        # Add parameter to schema
-        parameters["properties"][name] = {
-            "type": param_type,
-            "description": description,
-        }
-
-        # Check if parameter is required
-        if param.default is inspect.Parameter.empty:
-            parameters["required"].append(name)
+    # Create parameters schema
+    parameters = {
+        "type": "object",
+        "properties": {
+            name: {
+                "type": _get_type_name(type_hints.get(name, param.annotation)),
+                "description": param_descriptions.get(name, ""),
+            }
+            for name, param in params
+        },
+        # Parameters without a default are required
+        "required": [name for name, param in params if param.default is empty],
+    }
 
     # Create final schema
     schema = {
@@ -180,6 +263,16 @@ def function_to_openai_schema(func: Callable) -> dict[str, Any]:
     return schema
 
 
+# Function -> (docstring the schema was built from, schema). Entries are dropped
+# together with their function.
+_FUNCTION_SCHEMA_CACHE: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+# Model class -> parameters schema. Held weakly like _FUNCTION_SCHEMA_CACHE, so
+# models created on the fly (e.g. with create_model) are not kept alive.
+_MODEL_PARAMETERS_CACHE: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
 def pydantic_model_to_openai_schema(
     model_class: type[BaseModel],
     function_name: str,
@@ -187,12 +280,50 @@ def pydantic_model_to_openai_schema(
 ) -> dict[str, Any]:
     """Convert a Pydantic model to an OpenAI parameter schema.
 
+    The model's JSON schema is generated once per model class and cached; each
+    call returns a fresh copy that is safe to modify.
+
     Args:
         model_class: The Pydantic model class
 
     Returns:
         dict: A schema describing the model's fields
     """
+    return {
+        "type": "function",
+        "function": {
+            "name": function_name,
+            "description": function_description,
+            "parameters": copy.deepcopy(_cached_model_parameters(model_class)),
+        },
+    }
+
+
+def _cached_model_parameters(model_class: type[BaseModel]) -> dict[str, Any]:
+    """Get the parameters section of a model's schema, cached per model class.
+
+    Args:
+        model_class: The Pydantic model class
+
+    Returns:
+        dict: The cached object schema; callers must copy it before modifying
+    """
+    parameters = _MODEL_PARAMETERS_CACHE.get(model_class)
+    if parameters is None:
+        parameters = _build_model_parameters(model_class)
+        _MODEL_PARAMETERS_CACHE[model_class] = parameters
+    return parameters
+
+
+def _build_model_parameters(model_class: type[BaseModel]) -> dict[str, Any]:
+    """Build the parameters section of a model's schema.
+
+    Args:
+        model_class: The Pydantic model class
+
+    Returns:
+        dict: The object schema holding the model's properties and required fields
+    """
     schema = model_class.model_json_schema()
 
     result = {
@@ -203,11 +334,8 @@ def pydantic_model_to_openai_schema(
     if "required" in schema:
         result["required"] = schema["required"]
 
-    return {
-        "type": "function",
-        "function": {
-            "name": function_name,
-            "description": function_description,
-            "parameters": result,
-        },
-    }
+    # Nested models are emitted as "#/$defs/..." references, keep their targets
+    if "$defs" in schema:
+        result["$defs"] = schema["$defs"]
+
+    return result
@@ -1,5 +1,6 @@
 """Robust parsing utilities for various data formats."""
 
+import ast
 import re
 from typing import Any
 
@@ -19,23 +20,26 @@ except ImportError:
 
 # --- Compiled Regexes for Cleaning Logic ---
 # Pre-compiling regexes improves performance if the function is called frequently.
-RE_LINE_COMMENT = re.compile(r"//.*")
-RE_BLOCK_COMMENT = re.compile(r"/\*.*?\*/", re.DOTALL)
-RE_PYTHON_NONE = re.compile(r"\bNone\b")
-RE_PYTHON_TRUE = re.compile(r"\bTrue\b")
-RE_PYTHON_FALSE = re.compile(r"\bFalse\b")
+# Comments and Python constants are handled in a single scan: comments are
+# dropped and constants are mapped through PYTHON_TO_JSON_CONSTANTS.
+RE_PREPROCESS = re.compile(r"//[^\n]*|/\*.*?\*/|\b(None|True|False)\b", re.DOTALL)
+PYTHON_TO_JSON_CONSTANTS = {"None": "null", "True": "true", "False": "false"}
 RE_UNESCAPED_SINGLE_QUOTE = re.compile(r"(?<!\\)'")  # For ' -> " if not escaped
+# For {key: -> {"key":. Double-quoted strings are matched first and kept as they
+# are, so "key-like" text inside string values is never rewritten.
 RE_UNQUOTED_KEY = re.compile(
-    r"([\{\[,])\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*:"
-)  # For {key: -> {"key":
+    r'("(?:[^"\\]|\\.)*")|([\{\[,])\s*([a-zA-Z_][a-zA-Z0-9_]*)\s*:', re.DOTALL
+)
 RE_NORMALIZE_SPACE = re.compile(r"\s\s+")  # For multiple spaces to one
-RE_TRAILING_COMMA_OBJECT = re.compile(r",\s*(\})")  # For, } -> }
-RE_TRAILING_COMMA_ARRAY = re.compile(r",\s*(\])")  # For, ] -> ]
+RE_TRAILING_COMMA = re.compile(r",\s*([\}\]])")  # For, } -> } and, ] -> ]
 
 # --- Type Alias for JSON Output ---
 # orjson can parse valid JSON into these primitive types at the top level.
 JSONOutputType = Union[dict[str, Any], list[Any], str, int, float, bool, None]
 
+# Scalar types a Python literal may contain and still map onto JSON
+_JSON_SCALAR_TYPES = (str, int, float, bool, type(None))
+
 # --- Helper Functions ---
 
 
@@ -53,12 +57,13 @@ def _preprocess_json_string(s: str) -> str:
     - Removes common comment types (// and /* ... */).
     - Converts Python's None, True, False to JSON's null, true, false.
     """
-    s = RE_LINE_COMMENT.sub("", s)
-    s = RE_BLOCK_COMMENT.sub("", s)
-    s = RE_PYTHON_NONE.sub("null", s)
-    s = RE_PYTHON_TRUE.sub("true", s)
-    s = RE_PYTHON_FALSE.sub("false", s)
-    return s
+    return RE_PREPROCESS.sub(_preprocess_replacement, s)
+
+
+def _preprocess_replacement(match: re.Match) -> str:
+    """Maps a Python constant to its JSON spelling; comments map to ''."""
+    constant = match.group(1)
+    return PYTHON_TO_JSON_CONSTANTS[constant] if constant else ""
 
 
 def _clean_further_json_string(s: str) -> str:
@@ -73,17 +78,56 @@ def _clean_further_json_string(s: str) -> str:
     s = RE_UNESCAPED_SINGLE_QUOTE.sub('"', s)
 
     # Add quotes around unquoted keys (e.g., {key: value} -> {"key": value})
-    s = RE_UNQUOTED_KEY.sub(r'\1"\2":', s)
+    s = RE_UNQUOTED_KEY.sub(_quote_key_replacement, s)
 
     # Normalize whitespace and strip leading/trailing
     s = RE_NORMALIZE_SPACE.sub(" ", s.strip())
 
     # Remove trailing commas
-    s = RE_TRAILING_COMMA_OBJECT.sub(r"\1", s)
-    s = RE_TRAILING_COMMA_ARRAY.sub(r"\1", s)
+    s = RE_TRAILING_COMMA.sub(r"\1", s)
     return s
 
 
+def _is_json_compatible(obj: Any) -> bool:
+    """Checks that a Python literal only holds JSON-representable values."""
+    if isinstance(obj, _JSON_SCALAR_TYPES):
+        return True
+    if isinstance(obj, list):
+        return all(_is_json_compatible(item) for item in obj)
+    if isinstance(obj, dict):
+        return all(
+            isinstance(key, str) and _is_json_compatible(value)
+            for key, value in obj.items()
+        )
+    return False
+
+
+def _parse_python_literal(s: str) -> Union[dict[str, Any], list[Any], None]:
+    """
+    Parses a Python dict or list literal (single quotes, None/True/False,
+    trailing commas) with `ast.literal_eval`.
+    Returns None if the string is not such a literal, or if it contains values
+    JSON cannot represent (tuples, sets, bytes, non-string keys, ...).
+    """
+    s = s.strip()
+    if not s or s[0] not in "{[":
+        return None
+    try:
+        result = ast.literal_eval(s)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return None
+    if isinstance(result, (dict, list)) and _is_json_compatible(result):
+        return result
+    return None
+
+
+def _quote_key_replacement(match: re.Match) -> str:
+    """Quotes an unquoted object key; string literals are returned unchanged."""
+    if match.group(1) is not None:
+        return match.group(1)
+    return f'{match.group(2)}"{match.group(3)}":'
+
+
 def _fix_json_brackets(str_to_parse: str) -> Union[str, None]:
     """
     Attempts to fix unmatched brackets/braces in a JSON-like string.
@@ -95,6 +139,7 @@ def _fix_json_brackets(str_to_parse: str) -> Union[str, None]:
         return None
 
     brackets_map: dict[str, str] = {"{": "}", "[": "]"}
+    closing_brackets = frozenset(brackets_map.values())
     open_brackets_stack: list[str] = []  # Stores expected closing characters
 
     pos = 0
@@ -125,7 +170,7 @@ def _fix_json_brackets(str_to_parse: str) -> Union[str, None]:
 
         if char in brackets_map:  # Opening bracket/brace
             open_brackets_stack.append(brackets_map[char])
-        elif char in brackets_map.values():  # Potential closing bracket/brace
+        elif char in closing_brackets:  # Potential closing bracket/brace
             if not open_brackets_stack or open_brackets_stack[-1] != char:
                 # Extra closing bracket or mismatched bracket type
                 return None  # Unrecoverable structural error
@@ -150,12 +195,14 @@ def fuzzy_parse_json(str_to_parse: str, /) -> JSONOutputType:
 
     The parsing strategy is tiered:
     1. Direct parse with `orjson.loads()` (fastest, for valid JSON).
-    2. Preprocess (comments, Python constants) then `orjson.loads()`.
-    3. Further clean (quotes, keys, spaces, trailing commas) then `orjson.loads()`.
-    4. Fix brackets on the cleaned string, then `orjson.loads()`.
-    5. If `dirtyjson` is available, fallback to it using the preprocessed string,
+    2. Parse as a Python dict/list literal with `ast.literal_eval()`, which
+       handles single quotes, None/True/False and trailing commas natively.
+    3. Preprocess (comments, Python constants) then `orjson.loads()`.
+    4. Further clean (quotes, keys, spaces, trailing commas) then `orjson.loads()`.
+    5. Fix brackets on the cleaned string, then `orjson.loads()`.
+    6. If `dirtyjson` is available, fallback to it using the preprocessed string,
        as it can handle more complex JavaScript-like "dirtiness".
-    6. As a last resort, try `dirtyjson` on the absolute original string.
+    7. As a last resort, try `dirtyjson` on the absolute original string.
 
     Args:
         str_to_parse: The string suspected to be JSON or JSON-like.
@@ -170,6 +217,17 @@ def fuzzy_parse_json(str_to_parse: str, /) -> JSONOutputType:
     """
     _check_valid_input_str(str_to_parse)
 
+    # Fast path: well-formed JSON needs no fixing, so try it before any regex pass.
+    try:
+        return orjson.loads(str_to_parse)
+    except orjson.JSONDecodeError:
+        pass
+
+    # Python-literal input (e.g. a repr()'d dict) parses without any regex fixups
+    literal = _parse_python_literal(str_to_parse)
+    if literal is not None:
+        return literal
+
     # Keep the absolute original for a final fallback with dirtyjson if all else fails
     absolute_original_string = str_to_parse
 
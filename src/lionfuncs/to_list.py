@@ -1,4 +1,4 @@
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Iterator, Mapping
 from enum import Enum
 from typing import Any
 
@@ -53,48 +53,45 @@ def _initial_conversion_to_list(current_input: Any, use_values_flag: bool) -> li
 
 def _recursive_process_list(
     input_list: list[Any],
-    flatten_flag: bool,
     dropna_flag: bool,
     skip_flatten_types: tuple[type[Any], ...],
 ) -> list[Any]:
-    """Recursively processes list for flattening and dropping None/Undefined values."""
+    """Recursively drops None/Undefined values, keeping the nested structure."""
     processed_list: list[Any] = []
     for item in input_list:
         if dropna_flag and (item is None or item is PydanticUndefined):
             continue
 
-        is_iterable_to_process = isinstance(item, Iterable) and not isinstance(
-            item, skip_flatten_types
-        )
-
-        if is_iterable_to_process:
-            # Materialize generic iterables (like generators) once before recursion
-            elements_to_process = list(item)
-            if flatten_flag:
-                processed_list.extend(
-                    _recursive_process_list(
-                        input_list=elements_to_process,
-                        flatten_flag=True,
-                        dropna_flag=dropna_flag,
-                        skip_flatten_types=skip_flatten_types,
-                    )
-                )
-            else:
-                # Process sub-list (for dropna on its elements) but append as a single (processed) item
-                processed_list.append(
-                    _recursive_process_list(
-                        input_list=elements_to_process,
-                        flatten_flag=False,
-                        dropna_flag=dropna_flag,
-                        skip_flatten_types=skip_flatten_types,
-                    )
+        if isinstance(item, Iterable) and not isinstance(item, skip_flatten_types):
+            # Materialize generic iterables (like generators) once, then process
+            # the sub-list (for dropna on its elements) and append it as one item
+            processed_list.append(
+                _recursive_process_list(
+                    input_list=list(item),
+                    dropna_flag=dropna_flag,
+                    skip_flatten_types=skip_flatten_types,
                 )
+            )
         else:
-            # Item is not an iterable to be further processed, or flattening is off for this level
             processed_list.append(item)
     return processed_list
 
 
+def _iter_flattened(
+    input_iterable: Iterable[Any],
+    dropna_flag: bool,
+    skip_flatten_types: tuple[type[Any], ...],
+) -> Iterator[Any]:
+    """Lazily yields the flattened leaf items, dropping None/Undefined in the same pass."""
+    for item in input_iterable:
+        if dropna_flag and (item is None or item is PydanticUndefined):
+            continue
+        if isinstance(item, Iterable) and not isinstance(item, skip_flatten_types):
+            yield from _iter_flattened(item, dropna_flag, skip_flatten_types)
+        else:
+            yield item
+
+
 def to_list(
     input_: Any,
     /,
@@ -157,36 +154,28 @@ def to_list(
     intermediate_list = _initial_conversion_to_list(input_, use_values)
 
     # Stage 2: Apply user-specified flattening and dropna operations
-    # This list's structure depends on the `flatten` flag provided by the user.
-    processed_list = _recursive_process_list(
-        intermediate_list,
-        flatten_flag=flatten,  # User's desired flattening for the main output structure
-        dropna_flag=dropna,
-        skip_flatten_types=current_skip_flatten_types,
-    )
+    # When flattening, the leaves are streamed from a single generator walk,
+    # with dropna applied in the same pass, instead of building and extending
+    # an intermediate list per nesting level.
+    if flatten:
+        flat_items = _iter_flattened(
+            intermediate_list, dropna, current_skip_flatten_types
+        )
+        if not unique:
+            return list(flat_items)
+    else:
+        # This list's structure follows the input since flattening is off
+        processed_list = _recursive_process_list(
+            intermediate_list,
+            dropna_flag=dropna,
+            skip_flatten_types=current_skip_flatten_types,
+        )
 
     # Stage 3: Apply uniqueness if requested
     if unique:
-        # For uniqueness, we need to operate on individual elements.
-        # If the `processed_list` is not already flat (because user set flatten=False),
-        # we perform an internal flattening pass specifically for the uniqueness logic.
-        if not flatten:  # `processed_list` might contain sub-lists
-            elements_for_uniqueness = _recursive_process_list(
-                list(processed_list),  # Operate on a copy if further processing
-                flatten_flag=True,  # Force flatten for unique logic
-                dropna_flag=dropna,  # Re-apply dropna on the now flat stream
-                skip_flatten_types=current_skip_flatten_types,
-            )
-        else:  # `processed_list` is already flat as per user's `flatten=True`
-            # Ensure dropna has been applied to these flat elements
-            if dropna:
-                elements_for_uniqueness = [
-                    item
-                    for item in processed_list
-                    if not (item is None or item is PydanticUndefined)
-                ]
-            else:
-                elements_for_uniqueness = processed_list
+        # Uniqueness operates on the flattened, already dropna-filtered stream
+        # of individual elements, consumed directly without materializing it
+        elements_for_uniqueness = flat_items
 
         final_unique_list: list[Any] = []
         seen_hashes: set[int] = set()
@@ -34,9 +34,19 @@ def is_coro_func(func: Callable[..., Any]) -> bool:
 
 
 async def _run_sync_in_executor(func: Callable[..., R], *args: Any, **kwargs: Any) -> R:
-    """Helper to run a sync function in the default executor."""
+    """
+    Helper to run a sync function in the default executor.
+
+    run_in_executor does not copy the caller's contextvars into the worker
+    thread, and positional-only calls are passed straight through without
+    building a functools.partial.
+    """
     loop = asyncio.get_running_loop()
-    return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+    if kwargs:
+        return await loop.run_in_executor(
+            None, functools.partial(func, *args, **kwargs)
+        )
+    return await loop.run_in_executor(None, func, *args)
 
 
 def force_async(func: Callable[..., R]) -> Callable[..., Coroutine[Any, Any, R]]:
@@ -0,0 +1,43 @@
+"""
+Shared fixtures for the network module tests.
+"""
+
+import pytest
+
+
+def _make_async_stub(return_value=None, side_effect=None):
+    """
+    Build a plain async function that records its calls.
+
+    A lightweight stand-in for AsyncMock on test fast paths: it skips mock's
+    spec and call bookkeeping and just appends ``(args, kwargs)`` to ``calls``.
+
+    Args:
+        return_value: Value returned by each call when there is no side effect.
+        side_effect: An exception to raise on every call, or a list whose items
+                     are consumed one per call (exceptions are raised, other
+                     values returned).
+
+    Returns:
+        The async function, with ``calls`` and ``call_count`` attributes.
+    """
+    # Sequences are consumed through an iterator cursor rather than popped
+    effects = iter(side_effect) if isinstance(side_effect, list) else None
+
+    async def stub(*args, **kwargs):
+        stub.calls.append((args, kwargs))
+        stub.call_count += 1
+        effect = next(effects) if effects is not None else side_effect
+        if isinstance(effect, BaseException):
+            raise effect
+        return return_value if effect is None else effect
+
+    stub.calls = []
+    stub.call_count = 0
+    return stub
+
+
+@pytest.fixture
+def async_stub():
+    """Factory fixture for lightweight recording async functions."""
+    return _make_async_stub
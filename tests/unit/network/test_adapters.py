@@ -2,6 +2,8 @@
 Unit tests for the network adapters module.
 """
 
+import subprocess
+import sys
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -307,3 +309,17 @@ def test_create_sdk_adapter():
                 )
 
             assert "Unsupported provider: unsupported" in str(excinfo.value)
+
+
+def test_create_sdk_adapter_does_not_import_sdk():
+    """Test that vendor SDKs are only imported when a client is first needed."""
+    code = (
+        "import sys\n"
+        "from lionfuncs.network import Endpoint, Executor, iModel\n"
+        "from lionfuncs.network.adapters import create_sdk_adapter\n"
+        "create_sdk_adapter(provider='openai', api_key='k')\n"
+        "create_sdk_adapter(provider='anthropic', api_key='k')\n"
+        "assert 'openai' not in sys.modules\n"
+        "assert 'anthropic' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -16,7 +16,7 @@ from lionfuncs.errors import (
     ResourceNotFoundError,
     ServerError,
 )
-from lionfuncs.network.client import AsyncAPIClient
+from lionfuncs.network.client import DEFAULT_LIMITS, AsyncAPIClient
 from lionfuncs.network.resilience import CircuitBreaker, RetryConfig
 
 
@@ -26,7 +26,7 @@ def mock_httpx_client():
     with patch("httpx.AsyncClient") as mock_client:
         # Create a mock response
         mock_response = MagicMock()
-        mock_response.json.return_value = {"data": "test"}
+        mock_response.content = b'{"data": "test"}'
         mock_response.raise_for_status = MagicMock()
         mock_response.is_closed = False
         mock_response.close = MagicMock()
@@ -50,6 +50,7 @@ async def test_async_api_client_init():
     assert client.timeout == 10.0
     assert client.headers == {}
     assert client.auth is None
+    assert client.limits == DEFAULT_LIMITS
     assert client._client is None
     assert client._closed is False
     assert client.circuit_breaker is None
@@ -77,6 +78,7 @@ async def test_async_api_client_get_client(mock_httpx_client):
         timeout=10.0,
         headers={},
         auth=None,
+        limits=DEFAULT_LIMITS,
     )
 
 
@@ -123,7 +125,43 @@ async def test_async_api_client_request_success(mock_httpx_client):
     assert result == {"data": "test"}
     mock_client.request.assert_called_once_with("GET", "/endpoint")
     mock_response.raise_for_status.assert_called_once()
-    mock_response.json.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_api_client_request_json_body(mock_httpx_client):
+    """Test request method serializes json payloads to bytes."""
+    mock_client, _ = mock_httpx_client
+
+    client = AsyncAPIClient(base_url="https://api.example.com")
+    await client.request(
+        "POST", "/endpoint", json={"data": "test"}, headers={"X-Custom": "1"}
+    )
+
+    mock_client.request.assert_called_once_with(
+        "POST",
+        "/endpoint",
+        content=b'{"data":"test"}',
+        headers={"Content-Type": "application/json", "X-Custom": "1"},
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_api_client_request_json_keeps_caller_content_type(
+    mock_httpx_client,
+):
+    """Test a caller's content-type header is matched case-insensitively."""
+    mock_client, _ = mock_httpx_client
+
+    client = AsyncAPIClient(base_url="https://api.example.com")
+    await client.request(
+        "POST",
+        "/endpoint",
+        json={"data": "test"},
+        headers={"content-type": "application/vnd.api+json"},
+    )
+
+    headers = mock_client.request.call_args[1]["headers"]
+    assert headers.get_list("Content-Type") == ["application/vnd.api+json"]
 
 
 @pytest.mark.asyncio
@@ -294,7 +332,8 @@ async def test_async_api_client_call(mock_httpx_client):
         "GET",
         "/endpoint",
         params={"param": "value"},
-        json={"data": "test"},
+        content=b'{"data":"test"}',
+        headers={"Content-Type": "application/json"},
         data="raw data",
         extra="value",
     )
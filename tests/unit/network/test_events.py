@@ -6,11 +6,15 @@
 Unit tests for the network events module.
 """
 
+import asyncio
+import dataclasses
 import datetime
 import unittest
 from unittest.mock import patch
 
+from lionfuncs.format_utils import as_readable
 from lionfuncs.network.events import NetworkRequestEvent, RequestStatus
+from lionfuncs.to_dict import to_dict
 
 
 class TestNetworkRequestEvent(unittest.TestCase):
@@ -176,6 +180,35 @@ class TestNetworkRequestEvent(unittest.TestCase):
         # Just verify the log entry contains a timestamp format
         self.assertRegex(event.logs[0], r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}")
 
+    def test_wait(self):
+        """Test wait() returns once the event reaches a terminal status."""
+
+        async def run():
+            event = NetworkRequestEvent(request_id="test-id")
+            waiter = asyncio.create_task(event.wait())
+            await asyncio.sleep(0)
+            self.assertFalse(waiter.done())
+
+            event.update_status(RequestStatus.PROCESSING)
+            await asyncio.sleep(0)
+            self.assertFalse(waiter.done())
+
+            event.set_result(status_code=200, headers={}, body={})
+            await asyncio.wait_for(waiter, timeout=1)
+
+            # Already finished: returns immediately
+            await asyncio.wait_for(event.wait(), timeout=1)
+
+        asyncio.run(run())
+
+    def test_done_event_not_serialized(self):
+        """Test the internal done event stays out of dataclass fields."""
+        event = NetworkRequestEvent(request_id="test-id")
+
+        self.assertNotIn("_done", {f.name for f in dataclasses.fields(event)})
+        self.assertNotIn("_done", to_dict(event))
+        self.assertNotIn("_done", as_readable(event))
+
 
 if __name__ == "__main__":
     unittest.main()
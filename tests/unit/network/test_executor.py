@@ -327,6 +327,81 @@ class TestExecutor:
         finally:
             await executor.stop()
 
+    @pytest.mark.asyncio
+    async def test_batch_window(self):
+        """Test that tasks for the same endpoint are coalesced into one queue item."""
+        executor = Executor(batch_window_ms=20, num_workers=2)
+        await executor.start()
+
+        try:
+            mock_api_coro = AsyncMock(return_value=(200, {}, {"ok": True}))
+            put_spy = AsyncMock(wraps=executor.work_queue.put)
+            executor.work_queue.put = put_spy
+
+            events = [
+                await executor.submit_task(
+                    api_call_coroutine=mock_api_coro,
+                    endpoint_url="https://api.example.com/v1/test",
+                )
+                for _ in range(3)
+            ]
+
+            # Nothing is enqueued until the window elapses
+            assert put_spy.call_count == 0
+            assert all(e.status == RequestStatus.QUEUED for e in events)
+
+            await asyncio.wait_for(
+                asyncio.gather(*(event.wait() for event in events)), timeout=1
+            )
+
+            # One queue item for the whole batch, but every call is made
+            assert put_spy.call_count == 1
+            assert len(put_spy.call_args[0][0]) == 3
+            assert mock_api_coro.call_count == 3
+            assert all(e.status == RequestStatus.COMPLETED for e in events)
+        finally:
+            await executor.stop()
+
+    @pytest.mark.asyncio
+    async def test_stop_flushes_open_batch_window(self):
+        """Test stop() enqueues batches still inside their window and runs them."""
+        executor = Executor(batch_window_ms=60_000, num_workers=2)
+        await executor.start()
+
+        mock_api_coro = AsyncMock(return_value=(200, {}, {"ok": True}))
+        events = [
+            await executor.submit_task(
+                api_call_coroutine=mock_api_coro, endpoint_url=url
+            )
+            for url in ("https://a.example.com", "https://b.example.com")
+        ]
+
+        await asyncio.wait_for(executor.stop(), timeout=1)
+
+        assert mock_api_coro.call_count == 2
+        assert all(e.status == RequestStatus.COMPLETED for e in events)
+
+    @pytest.mark.asyncio
+    async def test_batch_window_applies_queue_capacity(self):
+        """Test tasks waiting in a batch window count against queue_capacity."""
+        executor = Executor(queue_capacity=2, batch_window_ms=60_000)
+        await executor.start()
+
+        mock_api_coro = AsyncMock(return_value=(200, {}, {"ok": True}))
+        try:
+            for _ in range(2):
+                await executor.submit_task(api_call_coroutine=mock_api_coro)
+
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    executor.submit_task(api_call_coroutine=mock_api_coro),
+                    timeout=0.05,
+                )
+        finally:
+            await executor.stop()
+
+        assert mock_api_coro.call_count == 2
+
 
 if __name__ == "__main__":
     unittest.main()
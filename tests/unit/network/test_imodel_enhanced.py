@@ -191,6 +191,28 @@ class TestIModelEnhanced:
         client_call_args = mock_client.request.call_args[1]
         assert client_call_args["timeout"] == 30.0
 
+    @pytest.mark.asyncio
+    async def test_invoke_snapshots_default_request_kwargs(
+        self, mock_executor, mock_http_endpoint
+    ):
+        """Test defaults changed after invoke() do not reach the queued request."""
+        mock_endpoint, mock_client = mock_http_endpoint
+        model = iModel(endpoint=mock_endpoint, executor=mock_executor)
+        mock_client.request = AsyncMock(return_value={"result": "success"})
+
+        await model.invoke(request_payload={"prompt": "Hello"}, http_path="v1/x")
+        mock_endpoint.config.default_request_kwargs["timeout"] = 99.0
+        mock_endpoint.config.default_request_kwargs["extra"] = True
+
+        api_call_coroutine = mock_executor.submit_task.call_args[1][
+            "api_call_coroutine"
+        ]
+        await api_call_coroutine()
+
+        client_call_args = mock_client.request.call_args[1]
+        assert client_call_args["timeout"] == 30.0
+        assert "extra" not in client_call_args
+
     @pytest.mark.asyncio
     async def test_invoke_sdk_with_non_dict_payload(
         self, mock_executor, mock_sdk_endpoint
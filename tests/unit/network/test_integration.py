@@ -5,6 +5,8 @@ Integration tests for the network module components.
 import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import httpx
+import orjson
 import pytest
 
 from lionfuncs.errors import APIClientError
@@ -74,10 +76,9 @@ class TestNetworkIntegration:
                 )
 
                 # Wait for the request to complete
-                while event.status != RequestStatus.COMPLETED:
-                    await asyncio.sleep(0.1)
-                    if event.status == RequestStatus.FAILED:
-                        raise Exception(f"Request failed: {event.error_message}")
+                await asyncio.wait_for(event.wait(), timeout=5)
+                if event.status == RequestStatus.FAILED:
+                    raise Exception(f"Request failed: {event.error_message}")
 
                 # Verify the result
                 assert event.status == RequestStatus.COMPLETED
@@ -99,6 +100,133 @@ class TestNetworkIntegration:
             # Stop the executor
             await executor.stop()
 
+    @pytest.mark.asyncio
+    async def test_http_flow_reuses_client(self):
+        """Test that repeated invocations share one AsyncAPIClient instance."""
+        executor = Executor(
+            queue_capacity=10,
+            concurrency_limit=5,
+            requests_rate=10.0,
+            requests_period=1.0,
+            api_tokens_rate=None,
+            num_workers=2,
+        )
+
+        await executor.start()
+
+        try:
+            config = ServiceEndpointConfig(
+                name="test-http",
+                transport_type="http",
+                base_url="https://api.example.com",
+                http_config=HttpTransportConfig(method="POST"),
+            )
+
+            with patch(
+                "lionfuncs.network.endpoint.AsyncAPIClient"
+            ) as mock_client_class:
+                mock_client = mock_client_class.return_value
+                mock_client.__aenter__ = AsyncMock(return_value=mock_client)
+                mock_client.__aexit__ = AsyncMock()
+                mock_client.request = AsyncMock(return_value={"result": "success"})
+
+                endpoint = Endpoint(config)
+                model = iModel(endpoint=endpoint, executor=executor)
+
+                events = [
+                    await model.invoke(
+                        request_payload={"prompt": f"Hello {i}"},
+                        http_path="v1/completions",
+                    )
+                    for i in range(3)
+                ]
+
+                await asyncio.wait_for(
+                    asyncio.gather(*(e.wait() for e in events)), timeout=5
+                )
+                if any(e.status == RequestStatus.FAILED for e in events):
+                    raise Exception("Request failed")
+
+                # One client (and one connection pool) for the endpoint's lifetime
+                assert mock_client_class.call_count == 1
+                assert mock_client.request.call_count == 3
+        finally:
+            await executor.stop()
+
+    @pytest.mark.asyncio
+    async def test_http_flow_asgi_transport(self):
+        """Test the HTTP flow end to end against an in-process ASGI app."""
+        received = []
+
+        async def fake_app(scope, receive, send):
+            body = b""
+            while True:
+                message = await receive()
+                body += message.get("body", b"")
+                if not message.get("more_body"):
+                    break
+            received.append(
+                {
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "headers": dict(scope["headers"]),
+                    "body": body,
+                }
+            )
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [(b"content-type", b"application/json")],
+                }
+            )
+            await send({"type": "http.response.body", "body": b'{"result":"success"}'})
+
+        executor = Executor(
+            queue_capacity=10,
+            concurrency_limit=5,
+            requests_rate=10.0,
+            requests_period=1.0,
+            api_tokens_rate=None,
+            num_workers=2,
+        )
+
+        await executor.start()
+
+        try:
+            http_client = httpx.AsyncClient(
+                base_url="https://api.example.com",
+                transport=httpx.ASGITransport(app=fake_app),
+            )
+            config = ServiceEndpointConfig(
+                name="test-http",
+                transport_type="http",
+                base_url="https://api.example.com",
+                http_config=HttpTransportConfig(method="POST"),
+                # For HTTP these are passed through to AsyncAPIClient.request
+                default_request_kwargs={"timeout": 10.0},
+                client_constructor_kwargs={"client": http_client},
+            )
+
+            async with iModel(endpoint=Endpoint(config), executor=executor) as model:
+                event = await model.invoke(
+                    request_payload={"prompt": "Hello, world!"},
+                    http_path="v1/completions",
+                )
+                await asyncio.wait_for(event.wait(), timeout=5)
+
+            assert event.status == RequestStatus.COMPLETED
+            assert event.response_body == {"result": "success"}
+
+            assert len(received) == 1
+            request = received[0]
+            assert request["method"] == "POST"
+            assert request["path"] == "/v1/completions"
+            assert request["headers"][b"content-type"] == b"application/json"
+            assert orjson.loads(request["body"]) == {"prompt": "Hello, world!"}
+        finally:
+            await executor.stop()
+
     @pytest.mark.asyncio
     async def test_sdk_flow(self):
         """Test the complete SDK flow from iModel through Endpoint to SDKAdapter."""
@@ -152,10 +280,9 @@ class TestNetworkIntegration:
                 )
 
                 # Wait for the request to complete
-                while event.status != RequestStatus.COMPLETED:
-                    await asyncio.sleep(0.1)
-                    if event.status == RequestStatus.FAILED:
-                        raise Exception(f"Request failed: {event.error_message}")
+                await asyncio.wait_for(event.wait(), timeout=5)
+                if event.status == RequestStatus.FAILED:
+                    raise Exception(f"Request failed: {event.error_message}")
 
                 # Verify the result
                 assert event.status == RequestStatus.COMPLETED
@@ -229,11 +356,7 @@ class TestNetworkIntegration:
                 )
 
                 # Wait for the request to complete or fail
-                while event.status not in [
-                    RequestStatus.COMPLETED,
-                    RequestStatus.FAILED,
-                ]:
-                    await asyncio.sleep(0.1)
+                await asyncio.wait_for(event.wait(), timeout=5)
 
                 # Verify that the request failed
                 assert event.status == RequestStatus.FAILED
@@ -3,10 +3,11 @@ Unit tests for the network primitives module.
 """
 
 import time
+from typing import Optional
 from unittest.mock import AsyncMock
 
 import pytest
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 
 from lionfuncs.network.primitives import (
     AdaptiveRateLimiter,
@@ -138,6 +139,20 @@ class TestEndpointConfig:
 
         assert config.full_url == "https://api.example.com/test/endpoint"
 
+    def test_endpoint_config_full_url_skips_format_without_params(self):
+        """Test full_url leaves the endpoint untouched when endpoint_params is empty."""
+        for endpoint_params in (None, []):
+            config = EndpointConfig(
+                name="test_endpoint",
+                provider="test_provider",
+                base_url="https://api.example.com",
+                endpoint="test/{literal}",
+                endpoint_params=endpoint_params,
+            )
+
+            # No str.format call, so the braces survive and no KeyError is raised
+            assert config.full_url == "https://api.example.com/test/{literal}"
+
     def test_endpoint_config_full_url_with_params(self):
         """Test full_url property with endpoint params."""
         config = EndpointConfig(
@@ -151,6 +166,29 @@ class TestEndpointConfig:
 
         assert config.full_url == "https://api.example.com/test/value1/endpoint/value2"
 
+    def test_endpoint_config_full_url_tracks_changes(self):
+        """Test full_url reflects updates, in-place params changes and copies."""
+        config = EndpointConfig(
+            name="test_endpoint",
+            provider="test_provider",
+            base_url="https://api.example.com",
+            endpoint="test/{param1}",
+            endpoint_params=["param1"],
+            params={"param1": "value1"},
+        )
+
+        assert config.full_url == "https://api.example.com/test/value1"
+
+        config.update(params={"param1": "value2"})
+        assert config.full_url == "https://api.example.com/test/value2"
+
+        config.params["param1"] = "value3"
+        assert config.full_url == "https://api.example.com/test/value3"
+
+        copied = config.model_copy(update={"base_url": "https://other.example.com"})
+        assert copied.full_url == "https://other.example.com/test/value3"
+        assert config.full_url == "https://api.example.com/test/value3"
+
     def test_endpoint_config_update(self):
         """Test update method."""
         config = EndpointConfig(
@@ -266,6 +304,36 @@ class TestEndpoint:
             "Authorization": "Bearer test_api_key",
         }
 
+    def test_endpoint_create_payload_with_model_skips_none(self):
+        """Test create_payload dumps non-None model fields, defaults included."""
+
+        class TestModel(BaseModel):
+            model_config = ConfigDict(populate_by_name=True)
+
+            max_tokens: int = Field(default=256, alias="maxTokens")
+            temperature: Optional[float] = None
+            stop: Optional[str] = None
+            prompt: str
+
+        endpoint = Endpoint(
+            config={
+                "name": "test_endpoint",
+                "provider": "test_provider",
+                "endpoint": "test/endpoint",
+                "api_key": "test_api_key",
+            }
+        )
+
+        request = TestModel(prompt="hi", max_tokens=16, stop=None)
+        payload, _ = endpoint.create_payload(request)
+
+        assert payload == {"prompt": "hi", "maxTokens": 16}
+
+        # Fields left at a non-None default are still sent
+        payload, _ = endpoint.create_payload(TestModel(prompt="hi"))
+
+        assert payload == {"prompt": "hi", "maxTokens": 256}
+
     def test_endpoint_create_payload_with_extra_headers(self):
         """Test create_payload method with extra headers."""
         endpoint = Endpoint(
@@ -288,6 +356,35 @@ class TestEndpoint:
             "X-Custom": "custom_value",
         }
 
+    def test_endpoint_create_payload_tracks_auth_changes(self):
+        """Test create_payload headers follow key rotation, copies and mutations."""
+        endpoint = Endpoint(
+            config={
+                "name": "test_endpoint",
+                "provider": "test_provider",
+                "endpoint": "test/endpoint",
+                "api_key": "test_api_key",
+            }
+        )
+
+        # Extra headers never leak into later requests
+        _, headers1 = endpoint.create_payload({}, extra_headers={"X-Custom": "1"})
+        _, headers2 = endpoint.create_payload({})
+        assert headers1["X-Custom"] == "1"
+        assert "X-Custom" not in headers2
+
+        endpoint.config.update(api_key="new_api_key")
+        _, headers3 = endpoint.create_payload({})
+        assert headers3["Authorization"] == "Bearer new_api_key"
+
+        endpoint.config.default_headers["X-Team"] = "a"
+        _, headers4 = endpoint.create_payload({})
+        assert headers4["X-Team"] == "a"
+
+        copied = Endpoint(endpoint.config.model_copy(update={"api_key": "copy_key"}))
+        _, headers5 = copied.create_payload({})
+        assert headers5["Authorization"] == "Bearer copy_key"
+
     def test_endpoint_create_payload_with_kwargs(self):
         """Test create_payload method with kwargs."""
         endpoint = Endpoint(
@@ -332,6 +429,16 @@ def test_match_endpoint():
     assert endpoint.config.base_url == "https://api.example.com"
 
 
+def test_match_endpoint_returns_independent_endpoints():
+    """Test match_endpoint never shares an Endpoint between callers."""
+    first = match_endpoint(provider="p", endpoint="chat", api_key="key")
+    second = match_endpoint(provider="p", endpoint="chat", api_key="key")
+
+    assert first is not second
+    first.config.update(api_key="rotated")
+    assert second.config.api_key == "key"
+
+
 class TestTokenBucketRateLimiter:
     """Tests for the TokenBucketRateLimiter class."""
 
@@ -358,22 +465,21 @@ class TestTokenBucketRateLimiter:
         assert limiter.max_tokens == 20.0
         assert limiter.tokens == 5.0
 
-    @pytest.mark.asyncio
-    async def test_token_bucket_rate_limiter_refill(self):
+    def test_token_bucket_rate_limiter_refill(self):
         """Test _refill method."""
         limiter = TokenBucketRateLimiter(rate=10.0, period=1.0, initial_tokens=0.0)
 
         # Manually set last_refill to simulate elapsed time
         limiter.last_refill = time.monotonic() - 0.5  # 0.5 seconds ago
 
-        await limiter._refill()
+        limiter._refill()
 
         # Should have refilled 5 tokens (0.5 seconds * 10 tokens/second)
         assert limiter.tokens == pytest.approx(5.0, abs=0.01)
 
         # Refill again immediately should not add tokens
         old_tokens = limiter.tokens
-        await limiter._refill()
+        limiter._refill()
         assert limiter.tokens == pytest.approx(old_tokens, abs=0.01)
 
     @pytest.mark.asyncio
@@ -398,6 +504,17 @@ class TestTokenBucketRateLimiter:
         assert wait_time > 0.0  # Should have wait time
         assert wait_time == pytest.approx(0.5, abs=0.01)  # (10 - 5) / 10 = 0.5 seconds
 
+    @pytest.mark.asyncio
+    async def test_token_bucket_rate_limiter_fractional_tokens_exact(self):
+        """Test fractional acquisitions drain the bucket without float drift."""
+        # Very long period so no measurable refill happens during the test
+        limiter = TokenBucketRateLimiter(rate=1.0, period=1_000_000.0)
+
+        for _ in range(10):
+            assert await limiter.acquire(0.1) == 0.0
+
+        assert limiter.tokens == 0.0
+
     @pytest.mark.asyncio
     async def test_token_bucket_rate_limiter_execute(self):
         """Test execute method."""
@@ -517,6 +634,13 @@ class TestEndpointRateLimiter:
 
         assert endpoint_limiter.tokens == 5.0  # Tokens should be reduced proportionally
 
+        # Non-power-of-two ratios are scaled exactly in micro-tokens
+        endpoint_limiter.tokens = 7.0
+        await limiter.update_rate_limit("test/endpoint", rate=3.0)
+
+        assert endpoint_limiter._tokens_u == 2_100_000
+        assert endpoint_limiter.tokens == 2.1
+
 
 class TestAdaptiveRateLimiter:
     """Tests for the AdaptiveRateLimiter class."""
@@ -575,3 +699,51 @@ class TestAdaptiveRateLimiter:
 
         # New rate would be (0 / 30) * 0.9 = 0, but min_rate is 0.1
         assert limiter.rate == 0.1
+
+    def test_adaptive_rate_limiter_update_from_headers_alternate_prefix(self):
+        """Test update_from_headers with mixed-case, non-default prefix headers."""
+        limiter = AdaptiveRateLimiter(initial_rate=10.0, min_rate=0.1)
+
+        headers = {
+            "Content-Type": "application/json",
+            "RateLimit-Limit": "100",
+            "RATELIMIT-REMAINING": "20",
+            "ratelimit-reset": "10",
+        }
+
+        limiter.update_from_headers(headers)
+
+        # New rate should be (20 / 10) * 0.9 = 1.8
+        assert limiter.rate == pytest.approx(1.8)
+
+        # Unrelated headers leave the rate untouched
+        limiter.update_from_headers({"Content-Type": "application/json"})
+        assert limiter.rate == pytest.approx(1.8)
+
+    def test_adaptive_rate_limiter_update_from_raw_headers(self):
+        """Test update_from_raw_headers with a raw CRLF-joined header block."""
+        limiter = AdaptiveRateLimiter(initial_rate=10.0, min_rate=0.1)
+
+        raw = b"\r\n".join(
+            k + b": " + v
+            for k, v in [
+                (b"content-type", b"application/json"),
+                (b"x-ratelimit-limit", b"100"),
+                (b"X-RateLimit-Remaining", b"50"),
+                (b"x-ratelimit-reset", b"60"),
+                (b"x-request-id", b"x-ratelimit-remaining: 1"),
+            ]
+        )
+
+        limiter.update_from_raw_headers(raw)
+
+        # New rate should be (50 / 60) * 0.9 = 0.75
+        assert limiter.rate == pytest.approx(0.75)
+
+        # Retry-After alone behaves like the dict-based method
+        limiter.update_from_raw_headers(b"Retry-After: 30")
+        assert limiter.rate == 0.1
+
+        # Blocks without rate limit headers leave the rate untouched
+        limiter.update_from_raw_headers(b"content-type: application/json")
+        assert limiter.rate == 0.1
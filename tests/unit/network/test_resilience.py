@@ -3,11 +3,11 @@ Unit tests for the resilience module.
 """
 
 import asyncio
-from unittest.mock import AsyncMock
 
 import pytest
 
 from lionfuncs.errors import CircuitBreakerOpenError
+from lionfuncs.network import resilience
 from lionfuncs.network.resilience import (
     CircuitBreaker,
     CircuitState,
@@ -45,29 +45,29 @@ class TestCircuitBreaker:
         assert len(cb._metrics["state_changes"]) == 0
 
     @pytest.mark.asyncio
-    async def test_circuit_breaker_execute_success(self):
+    async def test_circuit_breaker_execute_success(self, async_stub):
         """Test CircuitBreaker execute with successful function."""
         cb = CircuitBreaker(failure_threshold=3, name="test_breaker")
 
         # Create a mock async function that succeeds
-        mock_func = AsyncMock(return_value="success")
+        mock_func = async_stub(return_value="success")
 
         # Execute the function through the circuit breaker
         result = await cb.execute(mock_func, "arg1", kwarg1="value1")
 
         assert result == "success"
-        mock_func.assert_called_once_with("arg1", kwarg1="value1")
+        assert mock_func.calls == [(("arg1",), {"kwarg1": "value1"})]
         assert cb.state == CircuitState.CLOSED
         assert cb._metrics["success_count"] == 1
         assert cb._metrics["failure_count"] == 0
 
     @pytest.mark.asyncio
-    async def test_circuit_breaker_execute_failure(self):
+    async def test_circuit_breaker_execute_failure(self, async_stub):
         """Test CircuitBreaker execute with failing function."""
         cb = CircuitBreaker(failure_threshold=2, name="test_breaker")
 
         # Create a mock async function that fails
-        mock_func = AsyncMock(side_effect=ValueError("test error"))
+        mock_func = async_stub(side_effect=ValueError("test error"))
 
         # Execute the function through the circuit breaker
         with pytest.raises(ValueError) as excinfo:
@@ -88,7 +88,7 @@ class TestCircuitBreaker:
         assert cb._metrics["failure_count"] == 2
 
     @pytest.mark.asyncio
-    async def test_circuit_breaker_open_state(self):
+    async def test_circuit_breaker_open_state(self, async_stub):
         """Test CircuitBreaker in open state."""
         cb = CircuitBreaker(
             failure_threshold=1,
@@ -97,7 +97,7 @@ class TestCircuitBreaker:
         )
 
         # Create a mock async function that fails
-        mock_func = AsyncMock(side_effect=ValueError("test error"))
+        mock_func = async_stub(side_effect=ValueError("test error"))
 
         # Execute to trigger circuit open
         with pytest.raises(ValueError):
@@ -110,20 +110,21 @@ class TestCircuitBreaker:
             await cb.execute(mock_func)
 
         assert "Circuit breaker 'test_breaker' is open" in str(excinfo.value)
+        assert 0 < excinfo.value.retry_after <= 60.0
         assert cb._metrics["rejected_count"] == 1
-        mock_func.assert_called_once()  # Function should only be called once
+        assert mock_func.call_count == 1  # Function should only be called once
 
     @pytest.mark.asyncio
-    async def test_circuit_breaker_half_open_state(self):
+    async def test_circuit_breaker_half_open_state(self, async_stub):
         """Test CircuitBreaker transition to half-open state."""
         cb = CircuitBreaker(
             failure_threshold=1,
-            recovery_time=0.1,  # Short recovery time for testing
+            recovery_time=0.01,  # Short recovery time for testing
             name="test_breaker",
         )
 
         # Create a mock async function that fails then succeeds
-        mock_func = AsyncMock(side_effect=[ValueError("test error"), "success"])
+        mock_func = async_stub(side_effect=[ValueError("test error"), "success"])
 
         # Execute to trigger circuit open
         with pytest.raises(ValueError):
@@ -132,7 +133,7 @@ class TestCircuitBreaker:
         assert cb.state == CircuitState.OPEN
 
         # Wait for recovery time to elapse
-        await asyncio.sleep(0.2)
+        await asyncio.sleep(0.02)
 
         # Execute again, should transition to half-open and allow the call
         result = await cb.execute(mock_func)
@@ -144,7 +145,60 @@ class TestCircuitBreaker:
         assert mock_func.call_count == 2
 
     @pytest.mark.asyncio
-    async def test_circuit_breaker_excluded_exceptions(self):
+    async def test_circuit_breaker_half_open_concurrent_calls(self, async_stub):
+        """Test that concurrent calls in half-open state respect the call limit."""
+        cb = CircuitBreaker(
+            failure_threshold=1,
+            recovery_time=0.01,
+            half_open_max_calls=1,
+            name="test_breaker",
+        )
+
+        with pytest.raises(ValueError):
+            await cb.execute(async_stub(side_effect=ValueError("test error")))
+        await asyncio.sleep(0.02)
+
+        async def slow_success():
+            await asyncio.sleep(0.01)
+            return "success"
+
+        results = await asyncio.gather(
+            *(cb.execute(slow_success) for _ in range(3)), return_exceptions=True
+        )
+
+        # Only one probe call is let through; the rest are rejected
+        assert results.count("success") == 1
+        assert sum(isinstance(r, CircuitBreakerOpenError) for r in results) == 2
+        assert cb.state == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_circuit_breaker_state_change_history(self, monkeypatch):
+        """Test state changes are exported as dicts and the history is bounded."""
+        monkeypatch.setattr(resilience, "_STATE_CHANGE_HISTORY", 4)
+        cb = CircuitBreaker(failure_threshold=1, name="test_breaker")
+
+        cb._change_state(CircuitState.OPEN)
+        changes = cb.metrics["state_changes"]
+        assert len(changes) == 1
+        assert changes[0]["from"] == "closed"
+        assert changes[0]["to"] == "open"
+        assert isinstance(changes[0]["time"], float)
+
+        for _ in range(5):
+            cb._change_state(CircuitState.HALF_OPEN)
+            cb._change_state(CircuitState.OPEN)
+
+        # Only the most recent transitions are kept
+        changes = cb.metrics["state_changes"]
+        assert len(changes) == 4
+        assert changes[-1] == {
+            "time": changes[-1]["time"],
+            "from": "half_open",
+            "to": "open",
+        }
+
+    @pytest.mark.asyncio
+    async def test_circuit_breaker_excluded_exceptions(self, async_stub):
         """Test CircuitBreaker with excluded exceptions."""
         cb = CircuitBreaker(
             failure_threshold=2,
@@ -153,7 +207,7 @@ class TestCircuitBreaker:
         )
 
         # Create a mock async function that raises excluded exception
-        mock_func = AsyncMock(side_effect=KeyError("excluded error"))
+        mock_func = async_stub(side_effect=KeyError("excluded error"))
 
         # Execute the function through the circuit breaker
         with pytest.raises(KeyError):
@@ -165,10 +219,28 @@ class TestCircuitBreaker:
         assert cb._metrics["failure_count"] == 0
 
     @pytest.mark.asyncio
-    async def test_circuit_breaker_decorator(self):
+    async def test_circuit_breaker_excluded_exception_subclasses(self, async_stub):
+        """Test subclasses of excluded exceptions are not counted as failures."""
+        cb = CircuitBreaker(
+            failure_threshold=1,
+            excluded_exceptions={LookupError},
+            name="test_breaker",
+        )
+        assert cb.excluded_exceptions == {LookupError}
+        with pytest.raises(AttributeError):
+            cb.excluded_exceptions = {ValueError}
+
+        with pytest.raises(KeyError):
+            await cb.execute(async_stub(side_effect=KeyError("excluded error")))
+
+        assert cb.state == CircuitState.CLOSED
+        assert cb.failure_count == 0
+
+    @pytest.mark.asyncio
+    async def test_circuit_breaker_decorator(self, async_stub):
         """Test circuit_breaker decorator."""
         # Create a mock async function
-        mock_func = AsyncMock(return_value="success")
+        mock_func = async_stub(return_value="success")
 
         # Apply the decorator
         decorated_func = circuit_breaker(
@@ -181,17 +253,17 @@ class TestCircuitBreaker:
         result = await decorated_func("arg1", kwarg1="value1")
 
         assert result == "success"
-        mock_func.assert_called_once_with("arg1", kwarg1="value1")
+        assert mock_func.calls == [(("arg1",), {"kwarg1": "value1"})]
 
 
 class TestRetry:
     """Tests for retry functionality."""
 
     @pytest.mark.asyncio
-    async def test_retry_with_backoff_success(self):
+    async def test_retry_with_backoff_success(self, async_stub):
         """Test retry_with_backoff with successful function."""
         # Create a mock async function that succeeds
-        mock_func = AsyncMock(return_value="success")
+        mock_func = async_stub(return_value="success")
 
         # Call with retry
         result = await retry_with_backoff(
@@ -203,13 +275,13 @@ class TestRetry:
         )
 
         assert result == "success"
-        mock_func.assert_called_once_with("arg1", kwarg1="value1")
+        assert mock_func.calls == [(("arg1",), {"kwarg1": "value1"})]
 
     @pytest.mark.asyncio
-    async def test_retry_with_backoff_retry_success(self):
+    async def test_retry_with_backoff_retry_success(self, async_stub):
         """Test retry_with_backoff with function that fails then succeeds."""
         # Create a mock async function that fails twice then succeeds
-        mock_func = AsyncMock(
+        mock_func = async_stub(
             side_effect=[
                 ValueError("error 1"),
                 ValueError("error 2"),
@@ -229,10 +301,10 @@ class TestRetry:
         assert mock_func.call_count == 3
 
     @pytest.mark.asyncio
-    async def test_retry_with_backoff_max_retries(self):
+    async def test_retry_with_backoff_max_retries(self, async_stub):
         """Test retry_with_backoff with function that always fails."""
         # Create a mock async function that always fails
-        mock_func = AsyncMock(side_effect=ValueError("persistent error"))
+        mock_func = async_stub(side_effect=ValueError("persistent error"))
 
         # Call with retry
         with pytest.raises(ValueError) as excinfo:
@@ -246,10 +318,10 @@ class TestRetry:
         assert mock_func.call_count == 3  # Initial call + 2 retries
 
     @pytest.mark.asyncio
-    async def test_retry_with_backoff_excluded_exceptions(self):
+    async def test_retry_with_backoff_excluded_exceptions(self, async_stub):
         """Test retry_with_backoff with excluded exceptions."""
         # Create a mock async function that raises excluded exception
-        mock_func = AsyncMock(side_effect=KeyError("excluded error"))
+        mock_func = async_stub(side_effect=KeyError("excluded error"))
 
         # Call with retry
         with pytest.raises(KeyError) as excinfo:
@@ -261,7 +333,31 @@ class TestRetry:
             )
 
         assert "excluded error" in str(excinfo.value)
-        mock_func.assert_called_once()  # Should not retry excluded exceptions
+        assert mock_func.call_count == 1  # Should not retry excluded exceptions
+
+    @pytest.mark.asyncio
+    async def test_retry_with_backoff_single_exception_class(self, async_stub):
+        """Test retry_with_backoff accepts a bare exception class."""
+        mock_func = async_stub(side_effect=[ValueError("transient"), "success"])
+
+        result = await retry_with_backoff(
+            mock_func,
+            max_retries=2,
+            base_delay=0.01,
+            retry_exceptions=ValueError,
+        )
+        assert result == "success"
+        assert mock_func.call_count == 2
+
+        mock_func = async_stub(side_effect=KeyError("excluded error"))
+        with pytest.raises(KeyError):
+            await retry_with_backoff(
+                mock_func,
+                max_retries=2,
+                base_delay=0.01,
+                exclude_exceptions=KeyError,
+            )
+        assert mock_func.call_count == 1
 
     @pytest.mark.asyncio
     async def test_retry_config(self):
@@ -289,10 +385,91 @@ class TestRetry:
         assert kwargs["exclude_exceptions"] == (KeyError,)
 
     @pytest.mark.asyncio
-    async def test_with_retry_decorator(self):
+    async def test_retry_config_as_driver(self, async_stub):
+        """Test RetryConfig.as_driver returns a cached, working retry driver."""
+        config = RetryConfig(max_retries=2, base_delay=0.01, jitter=False)
+
+        driver = config.as_driver()
+        assert config.as_driver() is driver
+        assert RetryConfig(
+            max_retries=2, base_delay=0.01, jitter=False
+        ).as_driver() is (driver)
+        assert RetryConfig(max_retries=1).as_driver() is not driver
+
+        mock_func = async_stub(side_effect=[ValueError("error"), "success"])
+        result = await driver(mock_func, "arg1", kwarg1="value1")
+
+        assert result == "success"
+        assert mock_func.call_count == 2
+        assert mock_func.calls[-1] == (("arg1",), {"kwarg1": "value1"})
+
+    @pytest.mark.asyncio
+    async def test_retry_delay_schedule(self, async_stub, monkeypatch):
+        """Test retries follow the capped exponential backoff schedule."""
+        sleeps = []
+
+        async def record_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr(resilience.asyncio, "sleep", record_sleep)
+        mock_func = async_stub(side_effect=ValueError("persistent error"))
+
+        with pytest.raises(ValueError):
+            await retry_with_backoff(
+                mock_func,
+                max_retries=4,
+                base_delay=0.1,
+                max_delay=0.5,
+                backoff_factor=2.0,
+                jitter=False,
+            )
+        assert sleeps == pytest.approx([0.1, 0.2, 0.4, 0.5])
+
+        sleeps.clear()
+        with pytest.raises(ValueError):
+            await retry_with_backoff(
+                mock_func,
+                max_retries=3,
+                base_delay=0.1,
+                max_delay=0.3,
+                backoff_factor=2.0,
+                jitter=True,
+                jitter_factor=0.1,
+            )
+        assert 0.09 <= sleeps[0] <= 0.11
+        assert 0.18 <= sleeps[1] <= 0.22
+        assert sleeps[2] <= 0.3
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("max_retries", [float("inf"), 10**12])
+    async def test_retry_unbounded_max_retries(
+        self, async_stub, monkeypatch, max_retries
+    ):
+        """Test huge or infinite max_retries keep retrying at max_delay."""
+        sleeps = []
+
+        async def record_sleep(delay):
+            sleeps.append(delay)
+
+        monkeypatch.setattr(resilience.asyncio, "sleep", record_sleep)
+        mock_func = async_stub(side_effect=[ValueError("transient")] * 6 + ["ok"])
+
+        result = await retry_with_backoff(
+            mock_func,
+            max_retries=max_retries,
+            base_delay=0.1,
+            max_delay=0.5,
+            backoff_factor=2.0,
+            jitter=False,
+        )
+        assert result == "ok"
+        assert sleeps == pytest.approx([0.1, 0.2, 0.4, 0.5, 0.5, 0.5])
+
+    @pytest.mark.asyncio
+    async def test_with_retry_decorator(self, async_stub):
         """Test with_retry decorator."""
         # Create a mock async function
-        mock_func = AsyncMock(return_value="success")
+        mock_func = async_stub(return_value="success")
 
         # Apply the decorator
         decorated_func = with_retry(
@@ -304,4 +481,4 @@ class TestRetry:
         result = await decorated_func("arg1", kwarg1="value1")
 
         assert result == "success"
-        mock_func.assert_called_once_with("arg1", kwarg1="value1")
+        assert mock_func.calls == [(("arg1",), {"kwarg1": "value1"})]
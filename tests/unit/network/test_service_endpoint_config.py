@@ -159,3 +159,40 @@ class TestServiceEndpointConfig:
             }
             # Pass the dict to the model constructor
             ServiceEndpointConfig(**config_dict)
+
+    def test_from_trusted(self):
+        """Test building a derived config from trusted, validated data."""
+        config = ServiceEndpointConfig(
+            name="test_http",
+            transport_type="http",
+            base_url="https://api.example.com",
+            default_headers={"X-Test": "value"},
+        )
+
+        derived = ServiceEndpointConfig.from_trusted(
+            **{**dict(config), "name": "derived", "timeout": 5.0}
+        )
+
+        assert isinstance(derived, ServiceEndpointConfig)
+        assert derived.name == "derived"
+        assert derived.timeout == 5.0
+        assert derived.http_config == config.http_config
+        assert derived.default_headers == {"X-Test": "value"}
+        assert derived.model_dump() == {
+            **config.model_dump(),
+            "name": "derived",
+            "timeout": 5.0,
+        }
+
+    def test_from_trusted_applies_transport_defaults(self):
+        """Test that from_trusted still fills defaults and checks transport."""
+        config = ServiceEndpointConfig.from_trusted(
+            name="test_http",
+            transport_type="http",
+            base_url="https://api.example.com",
+        )
+        assert config.http_config == HttpTransportConfig()
+        assert config.default_request_kwargs == {}
+
+        with pytest.raises(ValueError, match="sdk_config must be provided"):
+            ServiceEndpointConfig.from_trusted(name="test_sdk", transport_type="sdk")
@@ -1,4 +1,5 @@
 import asyncio
+import gc
 import sys
 import time
 
@@ -12,6 +13,7 @@ from lionfuncs.async_utils import (
     BCallParams,
     CallParams,
     TaskGroup,
+    Throttle,
     alcall,
     bcall,
     max_concurrent,
@@ -19,6 +21,13 @@ from lionfuncs.async_utils import (
     throttle,
 )
 
+# TaskGroup raises a BaseExceptionGroup, which is built in from Python 3.11
+# and provided by the exceptiongroup backport (an anyio dependency) before that
+if sys.version_info >= (3, 11):
+    _EXC_GROUP = BaseExceptionGroup
+else:
+    from exceptiongroup import BaseExceptionGroup as _EXC_GROUP
+
 
 # Helper function for tests
 async def dummy_async_func(x, delay=0.01, fail_on=None):
@@ -35,24 +44,40 @@ def dummy_sync_func(x, delay=0.01, fail_on=None):
     return x * 2
 
 
+class InFlightTracker:
+    """Records the peak number of concurrent calls to its async `call`."""
+
+    def __init__(self, delay=0.01):
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+
+    async def call(self, x):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return x * 2
+
+
 @pytest.mark.asyncio
 async def test_throttle_async():
-    @throttle(period=0.1)
+    @throttle(period=0.02)
     async def throttled_func_async(val):
-        return time.monotonic(), val
+        return time.perf_counter(), val
 
-    start_time = time.monotonic()
+    start_time = time.perf_counter()
     r1_time, r1_val = await throttled_func_async(1)
     assert r1_val == 1
     assert r1_time >= start_time
 
     r2_time, r2_val = await throttled_func_async(2)
     assert r2_val == 2
-    assert r2_time >= r1_time + 0.1  # Approximately
+    assert r2_time - r1_time >= 0.019  # Allow for clock resolution
 
     r3_time, r3_val = await throttled_func_async(3)
     assert r3_val == 3
-    assert r3_time >= r2_time + 0.1
+    assert r3_time - r2_time >= 0.019
 
 
 @pytest.mark.asyncio
@@ -61,9 +86,9 @@ async def test_throttle_sync():
     # This primarily tests the decorator application.
     call_times = []
 
-    @throttle(period=0.1)
+    @throttle(period=0.02)
     def throttled_func_sync(val):
-        call_times.append(time.monotonic())
+        call_times.append(time.perf_counter())
         return val
 
     # Running sync throttled function in thread to avoid blocking test runner
@@ -74,9 +99,24 @@ async def test_throttle_sync():
 
     assert len(call_times) == 3
     if len(call_times) >= 2:
-        assert call_times[1] - call_times[0] >= 0.09  # Allow some leeway
+        assert call_times[1] - call_times[0] >= 0.019  # Allow some leeway
     if len(call_times) >= 3:
-        assert call_times[2] - call_times[1] >= 0.09
+        assert call_times[2] - call_times[1] >= 0.019
+
+
+def test_throttle_period_and_last_called_are_writable():
+    throttler = Throttle(period=10)
+    throttled = throttler(lambda: time.monotonic())
+
+    # Shortening the period after construction takes effect on the next call
+    throttler.period = 0.01
+    first = throttled()
+    assert throttler.last_called_sync == pytest.approx(first, abs=0.01)
+    second = throttled()
+    assert 0.009 <= second - first < 1
+
+    throttler.last_called_async = 1.5
+    assert throttler.last_called_async == 1.5
 
 
 @pytest.mark.asyncio
@@ -89,7 +129,7 @@ async def test_max_concurrent_async():
         nonlocal active_count, max_observed_concurrency
         active_count += 1
         max_observed_concurrency = max(max_observed_concurrency, active_count)
-        await asyncio.sleep(0.1)  # Simulate work
+        await asyncio.sleep(0.01)  # Simulate work
         active_count -= 1
         return True
 
@@ -110,7 +150,7 @@ async def test_max_concurrent_sync():
         nonlocal active_count, max_observed_concurrency
         active_count += 1
         max_observed_concurrency = max(max_observed_concurrency, active_count)
-        time.sleep(0.1)  # Simulate work
+        time.sleep(0.01)  # Simulate work
         active_count -= 1
         return True
 
@@ -120,6 +160,25 @@ async def test_max_concurrent_sync():
     assert max_observed_concurrency == 2
 
 
+@pytest.mark.asyncio
+async def test_max_concurrent_limit_one_serializes():
+    active_count = 0
+    max_observed_concurrency = 0
+
+    @max_concurrent(limit=1)
+    async def serial_func(x):
+        nonlocal active_count, max_observed_concurrency
+        active_count += 1
+        max_observed_concurrency = max(max_observed_concurrency, active_count)
+        await asyncio.sleep(0.01)
+        active_count -= 1
+        return x
+
+    results = await asyncio.gather(*(serial_func(i) for i in range(5)))
+    assert results == [0, 1, 2, 3, 4]
+    assert max_observed_concurrency == 1
+
+
 @pytest.mark.asyncio
 async def test_max_concurrent_invalid_limit():
     with pytest.raises(ValueError, match="Concurrency limit must be at least 1"):
@@ -149,13 +208,21 @@ async def test_alcall_with_kwargs():
 
 @pytest.mark.asyncio
 async def test_alcall_max_concurrent():
-    start_time = time.monotonic()
-    # 5 tasks, 0.1s each, max_concurrent 2. Expected time ~ (5/2)*0.1 = 0.25s + overhead
-    await alcall([1, 2, 3, 4, 5], dummy_async_func, delay=0.1, max_concurrent=2)
-    duration = time.monotonic() - start_time
-    assert (
-        0.2 < duration < 0.45
-    )  # Check it's not purely sequential (0.5s) or fully parallel
+    delay = 0.02
+    start_time = time.perf_counter()
+    # 5 tasks, max_concurrent 2: three rounds of `delay` plus overhead
+    await alcall([1, 2, 3, 4, 5], dummy_async_func, delay=delay, max_concurrent=2)
+    duration = time.perf_counter() - start_time
+    # Check it's neither fully parallel (1 round) nor purely sequential (5 rounds)
+    assert 2.5 * delay < duration < 5 * delay
+
+
+@pytest.mark.asyncio
+async def test_alcall_max_concurrent_bounds_in_flight_calls():
+    tracker = InFlightTracker()
+    results = await alcall(list(range(20)), tracker.call, max_concurrent=3)
+    assert results == [x * 2 for x in range(20)]
+    assert tracker.peak == 3
 
 
 @pytest.mark.asyncio
@@ -169,16 +236,59 @@ async def test_alcall_retries():
             raise ValueError("Flaky")
         return x * 2
 
-    results = await alcall([1], flaky_func, num_retries=2, retry_delay=0.01)
+    results = await alcall([1], flaky_func, num_retries=2, retry_delay=0.001)
     assert results == [2]
     assert call_count == 3
 
     call_count = 0
     with pytest.raises(ValueError, match="Flaky"):
-        await alcall([1], flaky_func, num_retries=1, retry_delay=0.01)
+        await alcall([1], flaky_func, num_retries=1, retry_delay=0.001)
     assert call_count == 2  # Original call + 1 retry
 
 
+@pytest.mark.asyncio
+async def test_alcall_retries_in_waves():
+    calls = []
+
+    async def fail_first_attempt(x):
+        calls.append(x)
+        await asyncio.sleep(0.01 * x)
+        if calls.count(x) == 1 and x % 2:
+            raise ValueError("Flaky")
+        return x * 2
+
+    results = await alcall(
+        [1, 2, 3, 4, 5], fail_first_attempt, num_retries=2, retry_delay=0.001
+    )
+
+    assert results == [2, 4, 6, 8, 10]
+    # Every first attempt runs before the failed odd items are retried together
+    assert calls == [1, 2, 3, 4, 5, 1, 3, 5]
+
+
+@pytest.mark.parametrize("max_concurrent", [None, 1])
+@pytest.mark.asyncio
+async def test_alcall_fails_fast_on_exhausted_item(max_concurrent):
+    finished = []
+
+    async def slow_or_failing(x):
+        if x == 2:
+            raise ValueError("Failed on 2")
+        await asyncio.sleep(1)
+        finished.append(x)
+
+    start = time.perf_counter()
+    with pytest.raises(ValueError, match="Failed on 2"):
+        await alcall(
+            [2, 1, 3], slow_or_failing, num_retries=0, max_concurrent=max_concurrent
+        )
+
+    # Raised without waiting for the slow items, which were cancelled
+    assert time.perf_counter() - start < 0.5
+    await asyncio.sleep(0)
+    assert finished == []
+
+
 @pytest.mark.asyncio
 async def test_alcall_retry_default():
     results = await alcall(
@@ -229,7 +339,7 @@ async def test_alcall_params_class():
     params = ALCallParams(
         func=dummy_async_func,
         num_retries=1,
-        retry_delay=0.01,
+        retry_delay=0.001,
         max_concurrent=1,
         retry_default=UNDEFINED,  # Explicitly provide default
     )
@@ -244,6 +354,19 @@ async def test_alcall_params_class():
     assert results_call_func == [2]
 
 
+@pytest.mark.asyncio
+async def test_alcall_params_kwargs_merge():
+    async def scale(x, factor=1):
+        return x * factor
+
+    params = ALCallParams(func=scale, kwargs={"factor": 3})
+    assert await params([1, 2]) == [3, 6]
+    # Call-time kwargs override stored ones without mutating them
+    assert await params([1, 2], factor=10) == [10, 20]
+    assert params.kwargs == {"factor": 3}
+    assert await params([1]) == [3]
+
+
 @pytest.mark.asyncio
 async def test_bcall_simple():
     results = []
@@ -271,7 +394,7 @@ async def test_bcall_params_passthrough():
         count_calls_func,
         batch_size=2,
         num_retries=1,
-        retry_delay=0.01,
+        retry_delay=0.001,
         max_concurrent=1,
     ):
         results.extend(batch_result)
@@ -282,6 +405,98 @@ async def test_bcall_params_passthrough():
     assert call_counts[3] == 1
 
 
+@pytest.mark.asyncio
+async def test_bcall_overlap_batches():
+    events = []
+
+    async def tracked(x):
+        events.append(("start", x))
+        await asyncio.sleep(0.01)
+        return x * 2
+
+    batches = []
+    async for batch_result in bcall(
+        [1, 2, 3, 4, 5], tracked, batch_size=2, overlap_batches=True
+    ):
+        batches.append(batch_result)
+        events.append(("yield", batch_result))
+
+    assert batches == [[2, 4], [6, 8], [10]]
+    # The second batch starts before the first one is handed to the consumer
+    assert events.index(("start", 3)) < events.index(("yield", [2, 4]))
+
+
+@pytest.mark.asyncio
+async def test_bcall_overlap_batches_early_exit_cancels_pending():
+    started = []
+
+    async def tracked(x):
+        started.append(x)
+        await asyncio.sleep(0.02)
+        return x
+
+    gen = bcall(list(range(6)), tracked, batch_size=2, overlap_batches=True)
+    assert await gen.__anext__() == [0, 1]
+    await gen.aclose()
+    await asyncio.sleep(0.04)
+
+    # The prefetched second batch was cancelled; the third was never started
+    assert sorted(started) == [0, 1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_bcall_overlap_batches_retrieves_failed_prefetch():
+    loop = asyncio.get_running_loop()
+    reported = []
+    loop.set_exception_handler(lambda _loop, context: reported.append(context))
+
+    async def always_fails(x):
+        # The first batch fails last, after the prefetched batch has failed
+        if x <= 2:
+            await asyncio.sleep(0.02)
+        raise ValueError(f"Failed on {x}")
+
+    try:
+        with pytest.raises(ValueError):
+            async for _ in bcall(
+                [1, 2, 3, 4], always_fails, batch_size=2, overlap_batches=True
+            ):
+                pass
+        # Unretrieved task exceptions are reported when the task is collected
+        gc.collect()
+        await asyncio.sleep(0.01)
+        gc.collect()
+    finally:
+        loop.set_exception_handler(None)
+
+    # The prefetched batch failed too; its exception was retrieved, not logged
+    assert reported == []
+
+
+@pytest.mark.asyncio
+async def test_bcall_overlap_batches_close_stays_cancellable():
+    async def slow_to_cancel(x):
+        if x < 2:
+            return x
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            await asyncio.sleep(0.2)
+            raise
+
+    async def consume():
+        gen = bcall(list(range(4)), slow_to_cancel, batch_size=2, overlap_batches=True)
+        assert await gen.__anext__() == [0, 1]
+        await gen.aclose()
+
+    # Cancel the consumer while bcall waits for the prefetched batch to cancel
+    consumer = asyncio.create_task(consume())
+    await asyncio.sleep(0.05)
+    consumer.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await consumer
+
+
 @pytest.mark.asyncio
 async def test_bcall_params_class():
     params = BCallParams(
@@ -303,6 +518,14 @@ async def test_parallel_map():
     assert results == [item * 2 for item in items]
 
 
+@pytest.mark.asyncio
+async def test_parallel_map_bounds_in_flight_calls():
+    tracker = InFlightTracker()
+    results = await parallel_map(tracker.call, list(range(20)), max_concurrency=3)
+    assert results == [x * 2 for x in range(20)]
+    assert tracker.peak == 3
+
+
 @pytest.mark.asyncio
 async def test_parallel_map_exception_handling():
     items = [1, 2, 0, 4]  # 0 will cause division by zero if func was 1/x
@@ -317,6 +540,24 @@ async def test_parallel_map_exception_handling():
         await parallel_map(func_with_potential_error, items, max_concurrency=2)
 
 
+@pytest.mark.asyncio
+async def test_parallel_map_stops_after_exception():
+    calls = []
+
+    async def func_with_error(x):
+        calls.append(x)
+        if x == 1:
+            raise ValueError("Cannot process one")
+        await asyncio.sleep(0.01)
+        return x
+
+    with pytest.raises(ValueError, match="Cannot process one"):
+        await parallel_map(func_with_error, list(range(10)), max_concurrency=2)
+
+    # Item 1 fails while item 0 is in flight, so no further items are started
+    assert sorted(calls) == [0, 1]
+
+
 @pytest.mark.asyncio
 async def test_parallel_map_empty_list():
     results = await parallel_map(dummy_async_func, [], max_concurrency=2)
@@ -356,19 +597,7 @@ async def test_task_group_exception_propagation():  # Already async def, this wa
         await anyio.sleep(0.01)
         return "OK"
 
-    exc_group_type = None
-    # anyio.TaskGroup raises BaseExceptionGroup (Python 3.11+) or ExceptionGroup (earlier).
-    if sys.version_info >= (3, 11):
-        exc_group_type = BaseExceptionGroup
-    else:
-        try:
-            from exceptiongroup import ExceptionGroup
-
-            exc_group_type = ExceptionGroup
-        except ImportError:
-            exc_group_type = Exception  # Fallback, test may not be strict
-
-    with pytest.raises(exc_group_type) as excinfo:
+    with pytest.raises(_EXC_GROUP) as excinfo:
         async with TaskGroup() as tg:
             tg.start_soon(failing_task_func)
             tg.start_soon(ok_task_func)
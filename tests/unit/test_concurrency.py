@@ -1,6 +1,8 @@
 import asyncio
+import contextlib
 import logging
-from unittest.mock import MagicMock
+import math
+import re
 
 import anyio
 import pytest
@@ -23,14 +25,51 @@ logger = logging.getLogger(__name__)
 # logging.basicConfig(level=logging.DEBUG) # Uncomment for verbose test logging
 
 
+class RecordingLogger:
+    """
+    Minimal stand-in for a logging.Logger that records ``(level, message)`` calls.
+
+    Cheaper than ``MagicMock(spec=logging.Logger)``, which introspects the
+    Logger class and builds a child mock per attribute on every fixture setup.
+    """
+
+    __slots__ = ("calls",)
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, str]] = []
+
+    def debug(self, msg: str, *args, **kwargs) -> None:
+        self.calls.append(("debug", msg))
+
+    def info(self, msg: str, *args, **kwargs) -> None:
+        self.calls.append(("info", msg))
+
+    def warning(self, msg: str, *args, **kwargs) -> None:
+        self.calls.append(("warning", msg))
+
+    def error(self, msg: str, *args, **kwargs) -> None:
+        self.calls.append(("error", msg))
+
+    def exception(self, msg: str, *args, **kwargs) -> None:
+        self.calls.append(("exception", msg))
+
+    def assert_any_call(self, level: str, msg: str) -> None:
+        assert (level, msg) in self.calls, f"{level}({msg!r}) not in {self.calls}"
+
+    def assert_last_call(self, level: str, msg: str) -> None:
+        level_calls = [m for lvl, m in self.calls if lvl == level]
+        assert (
+            level_calls and level_calls[-1] == msg
+        ), f"last {level} call was not {msg!r}: {level_calls}"
+
+
 @pytest.fixture
 def mock_logger():
-    return MagicMock(spec=logging.Logger)
+    return RecordingLogger()
 
 
 @pytest.fixture
-# @pytest.mark.asyncio # <-- Remove marker
-async def bq(mock_logger: MagicMock):
+async def bq(mock_logger: RecordingLogger):
     queue = BoundedQueue[int](maxsize=3, logger=mock_logger)
     await queue.start()
     yield queue
@@ -38,17 +77,33 @@ async def bq(mock_logger: MagicMock):
         await queue.stop()
 
 
+@contextlib.contextmanager
+def forced_status(queue: BoundedQueue[int], status: QueueStatus):
+    """Force a queue's status for the block, then restore the previous one."""
+    previous = queue._status
+    queue._status = status
+    try:
+        yield queue
+    finally:
+        queue._status = previous
+
+
 @pytest.fixture
-# @pytest.mark.asyncio # <-- Remove marker
-async def wq(mock_logger: MagicMock):
+async def wq(mock_logger: RecordingLogger):
     work_queue = WorkQueue[int](maxsize=3, concurrency_limit=2, logger=mock_logger)
     async with work_queue as wq_instance:
         yield wq_instance
 
 
+async def fill(queue: BoundedQueue[int], items: list[int]) -> None:
+    """Enqueue items concurrently; use serial puts where order matters."""
+    async with anyio.create_task_group() as tg:
+        for item in items:
+            tg.start_soon(queue.put, item)
+
+
 class TestBoundedQueue:
-    @pytest.mark.asyncio  # <-- Add marker
-    async def test_initialization(self, mock_logger: MagicMock):
+    async def test_initialization(self, mock_logger: RecordingLogger):
         queue = BoundedQueue[int](maxsize=5, timeout=0.05, logger=mock_logger)
         assert queue.maxsize == 5
         assert queue.timeout == 0.05
@@ -56,34 +111,35 @@ class TestBoundedQueue:
         assert queue.size == 0
         assert not queue.is_full
         assert queue.is_empty
-        mock_logger.debug.assert_called_with(
-            "Initialized BoundedQueue with maxsize=5, timeout=0.05"
+        mock_logger.assert_last_call(
+            "debug", "Initialized BoundedQueue with maxsize=5, timeout=0.05"
         )
 
         with pytest.raises(ValueError):
             BoundedQueue[int](maxsize=0)
 
-    @pytest.mark.asyncio  # <-- Add marker
-    async def test_start_stop(self, bq: BoundedQueue[int], mock_logger: MagicMock):
+    async def test_start_stop(
+        self, bq: BoundedQueue[int], mock_logger: RecordingLogger
+    ):
         assert bq.status == QueueStatus.PROCESSING
-        mock_logger.info.assert_any_call("Queue started with maxsize 3")
+        mock_logger.assert_any_call("info", "Queue started with maxsize 3")
 
         await bq.stop()
         assert bq.status == QueueStatus.STOPPED
-        mock_logger.info.assert_any_call("Stopping queue and workers...")
-        mock_logger.info.assert_any_call("Queue stopped")
+        mock_logger.assert_any_call("info", "Stopping queue and workers...")
+        mock_logger.assert_any_call("info", "Queue stopped")
 
         # Test idempotency of stop
         await bq.stop()
         assert bq.status == QueueStatus.STOPPED
 
         # Test idempotency of start (if already processing or stopping)
-        bq._status = QueueStatus.PROCESSING  # manually set for test
-        await bq.start()  # should return
-        bq._status = QueueStatus.STOPPING  # manually set for test
-        await bq.start()  # should return
+        with forced_status(bq, QueueStatus.PROCESSING):
+            await bq.start()  # should return
+        with forced_status(bq, QueueStatus.STOPPING):
+            await bq.start()  # should return
+        assert bq.status == QueueStatus.STOPPED
 
-    @pytest.mark.asyncio  # <-- Add marker
     async def test_put_get_task_done_join(self, bq: BoundedQueue[int]):
         assert await bq.put(1) is True
         assert bq.size == 1
@@ -104,15 +160,12 @@ class TestBoundedQueue:
 
         await bq.join()  # Should complete as tasks are done
 
-    @pytest.mark.asyncio  # <-- Add marker
     async def test_put_full_queue_backpressure(self, bq: BoundedQueue[int]):
-        await bq.put(1)
-        await bq.put(2)
-        await bq.put(3)
+        await fill(bq, [1, 2, 3])
         assert bq.is_full
 
         # This should apply backpressure and return False due to timeout
-        assert await bq.put(4, timeout=0.01) is False
+        assert await bq.put(4, timeout=0.001) is False
         assert bq.metrics["backpressure_events"] == 1
         assert bq.size == 3  # Item 4 not added
 
@@ -121,29 +174,22 @@ class TestBoundedQueue:
         with pytest.raises(QueueStateError):
             await bq.put(5)
 
-    @pytest.mark.asyncio  # <-- Add marker
     async def test_get_empty_queue(self, bq: BoundedQueue[int]):
         # Test get when queue is not processing
-        current_status = bq.status
-        bq._status = QueueStatus.IDLE  # Manually set for test
-        with pytest.raises(QueueStateError):
-            await bq.get()
-        bq._status = current_status  # Reset status
+        with forced_status(bq, QueueStatus.IDLE):
+            with pytest.raises(QueueStateError):
+                await bq.get()
 
-        # Test get from empty queue (will hang if not handled by worker loop timeout)
-        # This is typically handled by worker logic, direct get() will wait.
-        # For this test, we'll ensure it doesn't raise QueueStateError if processing
+        # A direct get() on an empty processing queue would block indefinitely,
+        # so that case is left to the worker tests
         assert bq.status == QueueStatus.PROCESSING
-        # We won't await bq.get() here as it would block indefinitely
 
-    @pytest.mark.asyncio  # <-- Add marker
     async def test_worker_management(
-        self, bq: BoundedQueue[int], mock_logger: MagicMock
+        self, bq: BoundedQueue[int], mock_logger: RecordingLogger
     ):
         processed_items = []
 
         async def worker_func(item: int):
-            await asyncio.sleep(0.01)  # Simulate work
             processed_items.append(item)
 
         with pytest.raises(ValueError):
@@ -151,14 +197,12 @@ class TestBoundedQueue:
 
         await bq.start_workers(worker_func, num_workers=2)
         assert bq.worker_count == 2
-        mock_logger.info.assert_any_call("Started 2 worker tasks")
+        mock_logger.assert_any_call("info", "Started 2 worker tasks")
 
-        await bq.put(10)
-        await bq.put(20)
-        await bq.put(30)  # This one might wait if workers are busy
+        await fill(bq, [10, 20, 30])
 
         await bq.join()  # Wait for all items to be processed
-        assert sorted(processed_items) == [10, 20, 30]
+        assert set(processed_items) == {10, 20, 30}
         assert bq.metrics["processed"] == 3
 
         # Test starting new workers (should stop old ones)
@@ -168,18 +212,18 @@ class TestBoundedQueue:
             processed_items_new.append(item * 2)
 
         await bq.start_workers(new_worker_func, num_workers=1)
-        mock_logger.warning.assert_any_call(
-            "Stopping existing workers before starting new ones"
+        mock_logger.assert_any_call(
+            "warning", "Stopping existing workers before starting new ones"
         )
         assert bq.worker_count == 1
 
+        # The replaced workers must not keep a pending get that steals the item
         await bq.put(5)
-        await bq.join()
+        await asyncio.wait_for(bq.join(), timeout=1)
         assert processed_items_new == [10]
 
-    @pytest.mark.asyncio  # <-- Add marker
     async def test_worker_error_handling(
-        self, bq: BoundedQueue[int], mock_logger: MagicMock
+        self, bq: BoundedQueue[int], mock_logger: RecordingLogger
     ):
         error_handled_event = asyncio.Event()
         problematic_item = -1
@@ -187,7 +231,6 @@ class TestBoundedQueue:
         async def failing_worker(item: int):
             if item == problematic_item:
                 raise ValueError("Test worker error")
-            await asyncio.sleep(0.01)
 
         async def custom_error_handler(exc: Exception, item: int):
             assert isinstance(exc, ValueError)
@@ -198,15 +241,14 @@ class TestBoundedQueue:
         await bq.start_workers(
             failing_worker, num_workers=1, error_handler=custom_error_handler
         )
-        await bq.put(1)
-        await bq.put(problematic_item)
-        await bq.put(2)
+        await fill(bq, [1, problematic_item, 2])
 
         await bq.join()
         assert bq.metrics["errors"] == 1
         assert error_handled_event.is_set()
-        mock_logger.error.assert_any_call(
-            f"Custom handler caught: Test worker error for item {problematic_item}"
+        mock_logger.assert_any_call(
+            "error",
+            f"Custom handler caught: Test worker error for item {problematic_item}",
         )
 
         # Test default error logging if no handler
@@ -215,58 +257,76 @@ class TestBoundedQueue:
         await bq.put(problematic_item)
         await bq.join()
         assert bq.metrics["errors"] == 1
-        mock_logger.exception.assert_any_call("Error processing item")
+        mock_logger.assert_any_call("exception", "Error processing item")
 
-    @pytest.mark.asyncio  # <-- Add marker
     async def test_worker_loop_cancellation(self, bq: BoundedQueue[int]):
+        started_event = asyncio.Event()
+
         async def long_worker(item: int):
+            started_event.set()
             try:
-                await asyncio.sleep(5)  # Long running task
+                # Cancellation is the only way out
+                await asyncio.sleep(math.inf)
             except asyncio.CancelledError:
                 logger.info(f"Worker for item {item} cancelled as expected.")
                 raise
 
         await bq.start_workers(long_worker, num_workers=1)
         await bq.put(100)
-        await asyncio.sleep(0.05)  # Give worker time to start
+        await asyncio.wait_for(started_event.wait(), 1.0)
 
         assert bq.worker_count == 1
-        await bq.stop(timeout=0.1)  # Stop should cancel the worker
+        await bq.stop(timeout=0.01)  # Stop should cancel the worker
         assert bq.worker_count == 0
         # Check logs for cancellation message if logger was real and configured
 
-    @pytest.mark.asyncio  # <-- Add marker
-    async def test_context_manager(self, mock_logger: MagicMock):
+    async def test_idle_workers_stop_immediately(self, bq: BoundedQueue[int]):
+        processed = []
+
+        async def worker(item: int):
+            processed.append(item)
+
+        await bq.start_workers(worker, num_workers=2)
+        await bq.put(1)
+        await asyncio.wait_for(bq.join(), timeout=0.05)
+        assert processed == [1]
+
+        # Idle workers are woken by the stop event rather than a poll timeout
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await bq.stop()
+        assert loop.time() - start < 0.05
+        assert bq.worker_count == 0
+
+    async def test_context_manager(self, mock_logger: RecordingLogger):
         async with BoundedQueue[str](maxsize=2, logger=mock_logger) as q_ctx:
             assert q_ctx.status == QueueStatus.PROCESSING
             await q_ctx.put("hello")
         assert q_ctx.status == QueueStatus.STOPPED
-        mock_logger.info.assert_any_call("Queue started with maxsize 2")
-        mock_logger.info.assert_any_call("Stopping queue and workers...")
-        mock_logger.info.assert_any_call("Queue stopped")
+        mock_logger.assert_any_call("info", "Queue started with maxsize 2")
+        mock_logger.assert_any_call("info", "Stopping queue and workers...")
+        mock_logger.assert_any_call("info", "Queue stopped")
 
 
 class TestWorkQueue:
-    @pytest.mark.asyncio  # <-- Add marker
-    async def test_initialization(self, mock_logger: MagicMock):
+    async def test_initialization(self, mock_logger: RecordingLogger):
         wq_instance = WorkQueue[int](
             maxsize=10, timeout=0.2, concurrency_limit=5, logger=mock_logger
         )
         assert wq_instance.queue.maxsize == 10
         assert wq_instance.queue.timeout == 0.2
         assert wq_instance.concurrency_limit == 5
-        mock_logger.debug.assert_any_call(
-            "Initialized WorkQueue with maxsize=10, timeout=0.2, concurrency_limit=5"
+        mock_logger.assert_any_call(
+            "debug",
+            "Initialized WorkQueue with maxsize=10, timeout=0.2, concurrency_limit=5",
         )
 
-    @pytest.mark.asyncio  # <-- Add marker
     async def test_properties_delegation(self, wq: WorkQueue[int]):
         assert wq.is_full == wq.queue.is_full
         assert wq.is_empty == wq.queue.is_empty
         assert wq.metrics == wq.queue.metrics
         assert wq.size == wq.queue.size
 
-    @pytest.mark.asyncio  # <-- Add marker
     async def test_start_stop_put_join_delegation(self, wq: WorkQueue[int]):
         # Start is called by fixture's __aenter__
         assert wq.queue.status == QueueStatus.PROCESSING
@@ -278,7 +338,6 @@ class TestWorkQueue:
         processed_items_wq = []
 
         async def wq_worker(item: int):
-            await asyncio.sleep(0.01)
             processed_items_wq.append(item)
 
         await wq.process(wq_worker, num_workers=1)  # Starts workers in underlying BQ
@@ -288,8 +347,7 @@ class TestWorkQueue:
         # Stop is called by fixture's __aexit__
         # We can test it explicitly if needed by creating a WQ outside fixture
 
-    @pytest.mark.asyncio  # <-- Add marker
-    async def test_batch_process(self, mock_logger: MagicMock):
+    async def test_batch_process(self, mock_logger: RecordingLogger):
         # Create a new WQ for this test to control its lifecycle fully
         wq_batch = WorkQueue[int](maxsize=5, concurrency_limit=2, logger=mock_logger)
         items_to_process = [1, 2, 3, 4, 5]
@@ -298,7 +356,6 @@ class TestWorkQueue:
 
         async def batch_worker(item: int):
             nonlocal worker_calls
-            await asyncio.sleep(0.01)  # Simulate work
             processed_batch_items.append(item * 10)
             worker_calls += 1
 
@@ -315,7 +372,7 @@ class TestWorkQueue:
             error_handler=batch_error_handler,
         )
 
-        assert sorted(processed_batch_items) == [10, 20, 30, 40, 50]
+        assert set(processed_batch_items) == {10, 20, 30, 40, 50}
         assert worker_calls == 5
         assert (
             wq_batch.queue.status == QueueStatus.STOPPED
@@ -331,7 +388,6 @@ class TestWorkQueue:
             nonlocal worker_calls
             if item == -1:
                 raise ValueError("Batch item error")
-            await asyncio.sleep(0.01)
             processed_batch_items.append(item * 10)
             worker_calls += 1
 
@@ -341,12 +397,30 @@ class TestWorkQueue:
             num_workers=1,
             error_handler=batch_error_handler,
         )
-        assert sorted(processed_batch_items) == [10, 30]  # Item -1 skipped due to error
+        assert set(processed_batch_items) == {10, 30}  # Item -1 skipped due to error
         assert worker_calls == 2
         assert error_event.is_set()  # Error handler should have been called
         assert wq_batch.queue.metrics["errors"] == 1
 
 
+_RE_QUEUE_CAPACITY = re.compile("Queue capacity must be at least 1")
+_RE_REFRESH_TIME = re.compile("Capacity refresh time must be positive")
+_RE_CONCURRENCY_LIMIT = re.compile("Concurrency limit must be at least 1")
+
+
+@pytest.mark.parametrize(
+    "kwargs, pattern",
+    [
+        ({"queue_capacity": 0}, _RE_QUEUE_CAPACITY),
+        ({"capacity_refresh_time": 0}, _RE_REFRESH_TIME),
+        ({"concurrency_limit": 0}, _RE_CONCURRENCY_LIMIT),
+    ],
+)
+def test_queue_config_invalid(kwargs, pattern):
+    with pytest.raises(ValueError, match=pattern):
+        QueueConfig(**kwargs)
+
+
 def test_queue_config_validation():
     # Valid
     config = QueueConfig(
@@ -354,13 +428,6 @@ def test_queue_config_validation():
     )
     assert config.queue_capacity == 10
 
-    with pytest.raises(ValueError, match="Queue capacity must be at least 1"):
-        QueueConfig(queue_capacity=0)
-    with pytest.raises(ValueError, match="Capacity refresh time must be positive"):
-        QueueConfig(capacity_refresh_time=0)
-    with pytest.raises(ValueError, match="Concurrency limit must be at least 1"):
-        QueueConfig(concurrency_limit=0)
-
     # Test defaults
     config_default = QueueConfig()
     assert config_default.queue_capacity == 100
@@ -384,11 +451,7 @@ def test_anyio_wrappers_instantiation():
     event = Event()
     assert isinstance(event._event, anyio.Event)
 
-    # Condition requires an anyio.Lock for its internal _condition
-    # Our Lock wrapper wraps an anyio.Lock, so we pass its internal _lock
     cond_lock = Lock()
-    # The Condition class in concurrency.py expects our Lock wrapper or None
-    # If None, it creates its own Lock wrapper.
     cond = Condition(lock=cond_lock)
     assert isinstance(cond._condition, anyio.Condition)
     assert cond._lock == cond_lock
@@ -398,7 +461,6 @@ def test_anyio_wrappers_instantiation():
     assert isinstance(cond_no_lock._condition, anyio.Condition)
 
 
-@pytest.mark.asyncio
 async def test_lock_context_manager():
     lock = Lock()
     shared_resource = 0
@@ -407,39 +469,42 @@ async def test_lock_context_manager():
         nonlocal shared_resource
         async with lock:
             current_val = shared_resource
-            await asyncio.sleep(0.01)  # Simulate work
+            await asyncio.sleep(0)  # Yield to the other tasks while holding it
             shared_resource = current_val + 1
 
-    tasks = [asyncio.create_task(task()) for _ in range(5)]
-    await asyncio.gather(*tasks)
+    async with anyio.create_task_group() as tg:
+        for _ in range(5):
+            tg.start_soon(task)
     assert shared_resource == 5
 
 
-@pytest.mark.asyncio
 async def test_semaphore_context_manager():
     sema = Semaphore(2)  # Allow 2 concurrent tasks
     counter = 0
     active_tasks = 0
     max_active_tasks = 0
+    # Rendezvous instead of a sleep: the first task holds its permit until a
+    # second one is inside, so the bound is reached regardless of scheduling
+    both_inside = asyncio.Event()
 
     async def task():
         nonlocal counter, active_tasks, max_active_tasks
         async with sema:
             active_tasks += 1
             max_active_tasks = max(max_active_tasks, active_tasks)
-            await asyncio.sleep(0.05)  # Simulate work
+            if active_tasks == 2:
+                both_inside.set()
+            await asyncio.wait_for(both_inside.wait(), timeout=1)
             counter += 1
             active_tasks -= 1
-        return True
 
-    tasks = [asyncio.create_task(task()) for _ in range(5)]
-    results = await asyncio.gather(*tasks)
+    async with anyio.create_task_group() as tg:
+        for _ in range(5):
+            tg.start_soon(task)
     assert counter == 5
-    assert all(results)
     assert max_active_tasks == 2
 
 
-@pytest.mark.asyncio
 async def test_event_wait_set():
     event = Event()
     waiter_done = False
@@ -450,7 +515,7 @@ async def test_event_wait_set():
         waiter_done = True
 
     async def setter():
-        await asyncio.sleep(0.01)
+        await asyncio.sleep(0)  # Let the waiter block first
         event.set()
 
     assert not event.is_set()
@@ -5,113 +5,139 @@ import pytest
 from lionfuncs.dict_utils import fuzzy_match_keys
 
 
+@pytest.fixture(scope="module")
+def ref_keys():
+    """Reference keys shared by the fuzzy matching tests."""
+    return ("name", "age", "city")
+
+
+@pytest.fixture(scope="module")
+def typo_data():
+    """Data whose keys are misspellings of ref_keys (never mutated by tests)."""
+    return {"nmae": "John", "aeg": 30, "ctiy": "New York"}
+
+
 class TestFuzzyMatchKeys:
     """Tests for fuzzy_match_keys function."""
 
-    def test_fuzzy_match_keys_exact_matches(self):
+    def test_fuzzy_match_keys_exact_matches(self, ref_keys):
         """Test fuzzy_match_keys with exact matches."""
         data = {"name": "John", "age": 30, "city": "New York"}
-        reference_keys = ["name", "age", "city"]
 
-        result = fuzzy_match_keys(data, reference_keys)
+        result = fuzzy_match_keys(data, ref_keys)
 
         assert result == data
 
-    def test_fuzzy_match_keys_case_sensitivity(self):
+    def test_fuzzy_match_keys_case_sensitivity(self, ref_keys):
         """Test fuzzy_match_keys with case sensitivity."""
         data = {"Name": "John", "Age": 30, "City": "New York"}
-        reference_keys = ["name", "age", "city"]
 
         # With case sensitivity, should not match (using a high threshold to prevent fuzzy match of "Name" to "name")
-        result = fuzzy_match_keys(
-            data, reference_keys, case_sensitive=True, threshold=0.99
-        )
+        result = fuzzy_match_keys(data, ref_keys, case_sensitive=True, threshold=0.99)
         assert (
             "Name" in result
         )  # Original keys preserved because "Name" didn't exactly or fuzzily match "name"
         assert "name" not in result  # "name" (lowercase) should not be a key
 
         # Without case sensitivity, should match
-        result = fuzzy_match_keys(data, reference_keys, case_sensitive=False)
+        result = fuzzy_match_keys(data, ref_keys, case_sensitive=False)
         assert "name" in result  # Keys corrected to reference
         assert "Name" not in result
 
-    def test_fuzzy_match_keys_fuzzy_matches(self):
-        """Test fuzzy_match_keys with fuzzy matches."""
-        data = {"nmae": "John", "aeg": 30, "ctiy": "New York"}
-        reference_keys = ["name", "age", "city"]
+    @pytest.mark.parametrize("algorithm", ["levenshtein", "jaro_winkler", "wratio"])
+    def test_fuzzy_match_keys_case_insensitive_fuzzy(self, algorithm, ref_keys):
+        """Test fuzzy matching lowers the input key when case_sensitive=False."""
+        data = {"NMAE": "John", "CTIY": "New York"}
+
+        result = fuzzy_match_keys(
+            data, ref_keys, default_method=algorithm, threshold=0.7
+        )
 
+        assert result == {"name": "John", "city": "New York"}
+
+    def test_fuzzy_match_keys_fuzzy_matches(self, ref_keys, typo_data):
+        """Test fuzzy_match_keys with fuzzy matches."""
         # With high threshold, should not match
-        result = fuzzy_match_keys(data, reference_keys, threshold=0.9)
+        result = fuzzy_match_keys(typo_data, ref_keys, threshold=0.9)
         assert "nmae" in result  # Original keys preserved
         assert "name" not in result
 
         # With lower threshold, should match some keys
         # Note: The actual behavior depends on the similarity algorithm
         # and the specific implementation of fuzzy_match_keys
-        result = fuzzy_match_keys(data, reference_keys, threshold=0.5)
+        result = fuzzy_match_keys(typo_data, ref_keys, threshold=0.5)
         # At least one key should be matched with a low threshold
-        assert any(key in result for key in reference_keys)
+        assert any(key in result for key in ref_keys)
 
     @pytest.mark.parametrize(
         "algorithm",
         ["levenshtein", "jaro_winkler", "wratio"],  # Changed sequence_matcher to wratio
     )
-    def test_fuzzy_match_keys_algorithms(self, algorithm):
+    def test_fuzzy_match_keys_algorithms(self, algorithm, ref_keys, typo_data):
         """Test fuzzy_match_keys with different similarity algorithms."""
-        data = {"nmae": "John", "aeg": 30, "ctiy": "New York"}
-        reference_keys = ["name", "age", "city"]
-
         result = fuzzy_match_keys(
-            data, reference_keys, default_method=algorithm, threshold=0.5
+            typo_data, ref_keys, default_method=algorithm, threshold=0.5
         )
 
         # With a lower threshold, at least one key should be matched
-        assert any(key in result for key in reference_keys)
+        assert any(key in result for key in ref_keys)
+
+    @pytest.mark.parametrize(
+        "prefix_weight, expected_key", [(0.0, "namz"), (0.25, "name")]
+    )
+    def test_fuzzy_match_keys_jaro_winkler_prefix_weight(
+        self, prefix_weight, expected_key, ref_keys
+    ):
+        """Test the Jaro-Winkler prefix weight is passed through to the scorer."""
+        result = fuzzy_match_keys(
+            {"namz": "John"},
+            ref_keys,
+            default_method="jaro_winkler",
+            jaro_winkler_prefix_weight=prefix_weight,
+            threshold=0.9,
+        )
 
-    def test_fuzzy_match_keys_handle_unmatched_ignore(self):
+        assert result == {expected_key: "John"}
+
+    def test_fuzzy_match_keys_handle_unmatched_ignore(self, ref_keys):
         """Test fuzzy_match_keys with handle_unmatched='ignore'."""
         data = {"name": "John", "age": 30, "extra": "value"}
-        reference_keys = ["name", "age", "city"]
 
-        result = fuzzy_match_keys(data, reference_keys, handle_unmatched="ignore")
+        result = fuzzy_match_keys(data, ref_keys, handle_unmatched="ignore")
 
         assert "name" in result
         assert "age" in result
         assert "extra" in result  # Unmatched key preserved
         assert "city" not in result  # Missing reference key not added
 
-    def test_fuzzy_match_keys_handle_unmatched_raise(self):
+    def test_fuzzy_match_keys_handle_unmatched_raise(self, ref_keys):
         """Test fuzzy_match_keys with handle_unmatched='raise'."""
         data = {"name": "John", "age": 30, "extra": "value"}
-        reference_keys = ["name", "age", "city"]
 
         with pytest.raises(ValueError) as excinfo:
-            fuzzy_match_keys(data, reference_keys, handle_unmatched="raise")
+            fuzzy_match_keys(data, ref_keys, handle_unmatched="raise")
 
         error_message = str(excinfo.value)
         assert "Unmatched" in error_message
         assert "extra" in error_message
 
-    def test_fuzzy_match_keys_handle_unmatched_remove(self):
+    def test_fuzzy_match_keys_handle_unmatched_remove(self, ref_keys):
         """Test fuzzy_match_keys with handle_unmatched='remove'."""
         data = {"name": "John", "age": 30, "extra": "value"}
-        reference_keys = ["name", "age", "city"]
 
-        result = fuzzy_match_keys(data, reference_keys, handle_unmatched="remove")
+        result = fuzzy_match_keys(data, ref_keys, handle_unmatched="remove")
 
         assert "name" in result
         assert "age" in result
         assert "extra" not in result  # Unmatched key removed
         assert "city" not in result  # Missing reference key not added
 
-    def test_fuzzy_match_keys_handle_unmatched_fill(self):
+    def test_fuzzy_match_keys_handle_unmatched_fill(self, ref_keys):
         """Test fuzzy_match_keys with handle_unmatched='fill'."""
         data = {"name": "John", "age": 30, "extra": "value"}
-        reference_keys = ["name", "age", "city"]
 
         result = fuzzy_match_keys(
-            data, reference_keys, handle_unmatched="fill", fill_value="default"
+            data, ref_keys, handle_unmatched="fill", fill_value="default"
         )
 
         assert "name" in result
@@ -120,13 +146,12 @@ class TestFuzzyMatchKeys:
         assert "city" in result  # Missing reference key added
         assert result["city"] == "default"  # With default value
 
-    def test_fuzzy_match_keys_handle_unmatched_force(self):
+    def test_fuzzy_match_keys_handle_unmatched_force(self, ref_keys):
         """Test fuzzy_match_keys with handle_unmatched='force'."""
         data = {"name": "John", "age": 30, "extra": "value"}
-        reference_keys = ["name", "age", "city"]
 
         result = fuzzy_match_keys(
-            data, reference_keys, handle_unmatched="force", fill_value="default"
+            data, ref_keys, handle_unmatched="force", fill_value="default"
         )
 
         assert "name" in result
@@ -152,20 +177,19 @@ class TestFuzzyMatchKeys:
         assert result["city"] == "New York"
         assert result["country"] == "USA"
 
-    def test_fuzzy_match_keys_strict_mode(self):
+    def test_fuzzy_match_keys_strict_mode(self, ref_keys):
         """Test fuzzy_match_keys with strict=True."""
         data = {"name": "John", "age": 30}
-        reference_keys = ["name", "age", "city"]
 
         # Without strict, missing keys are allowed
-        result = fuzzy_match_keys(data, reference_keys)
+        result = fuzzy_match_keys(data, ref_keys)
         assert "name" in result
         assert "age" in result
         assert "city" not in result
 
         # With strict, missing keys raise error
         with pytest.raises(ValueError) as excinfo:
-            fuzzy_match_keys(data, reference_keys, strict=True)
+            fuzzy_match_keys(data, ref_keys, strict=True)
 
         error_message = str(excinfo.value)
         assert "Strict mode" in error_message
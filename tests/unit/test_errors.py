@@ -3,70 +3,103 @@ import pytest
 from lionfuncs import errors
 
 
-def test_lion_error_base():
-    """Tests that LionError can be raised and caught."""
-    with pytest.raises(errors.LionError, match="Base lion error"):
-        raise errors.LionError("Base lion error")
+@pytest.mark.parametrize(
+    "error_class, base_class",
+    [
+        (errors.LionError, Exception),
+        (errors.LionFileError, errors.LionError),
+        (errors.LionNetworkError, errors.LionError),
+        (errors.APIClientError, errors.LionNetworkError),
+        (errors.APIConnectionError, errors.APIClientError),
+        (errors.APITimeoutError, errors.APIClientError),
+        (errors.RateLimitError, errors.APIClientError),
+        (errors.AuthenticationError, errors.APIClientError),
+        (errors.ResourceNotFoundError, errors.APIClientError),
+        (errors.ServerError, errors.APIClientError),
+        (errors.CircuitBreakerOpenError, errors.LionNetworkError),
+        (errors.LionConcurrencyError, errors.LionError),
+        (errors.QueueStateError, errors.LionConcurrencyError),
+        (errors.LionSDKError, errors.LionError),
+    ],
+)
+def test_inheritance(error_class, base_class):
+    """Tests each error class sits under the expected base in the hierarchy."""
+    assert issubclass(error_class, base_class)
 
 
 @pytest.mark.parametrize(
-    "error_class, message_prefix, base_class",
+    "error_class, kwargs, expected_str",
     [
-        (errors.LionFileError, "File error", errors.LionError),
-        (errors.LionNetworkError, "Network error", errors.LionError),
-        (errors.APIClientError, "API client error", errors.LionNetworkError),
-        (errors.APIConnectionError, "API connection error", errors.APIClientError),
-        (errors.APITimeoutError, "API timeout error", errors.APIClientError),
-        (errors.RateLimitError, "Rate limit exceeded", errors.APIClientError),
-        (errors.AuthenticationError, "Auth error", errors.APIClientError),
-        (errors.ResourceNotFoundError, "Not found", errors.APIClientError),
-        (errors.ServerError, "Server error", errors.APIClientError),
+        (errors.LionError, {}, "Something failed"),
+        (errors.LionFileError, {}, "Something failed"),
+        (errors.APIClientError, {}, "Something failed"),
+        (
+            errors.ServerError,
+            {"status_code": 500},
+            "Something failed (Status Code: 500)",
+        ),
+        (errors.CircuitBreakerOpenError, {}, "Something failed"),
         (
             errors.CircuitBreakerOpenError,
-            "Circuit breaker open",
-            errors.LionNetworkError,
+            {"retry_after": 1.5},
+            "Something failed (Retry After: 1.50s)",
+        ),
+        (errors.QueueStateError, {}, "Something failed"),
+        (
+            errors.QueueStateError,
+            {"current_state": "stopped"},
+            "Something failed (Current State: stopped)",
         ),
-        (errors.LionConcurrencyError, "Concurrency error", errors.LionError),
-        (errors.QueueStateError, "Queue state error", errors.LionConcurrencyError),
-        (errors.LionSDKError, "SDK error", errors.LionError),
     ],
 )
-def test_specific_lion_errors(error_class, message_prefix, base_class):
-    """Tests specific LionError subclasses for basic raising, catching, and inheritance."""
-    message = f"{message_prefix} occurred"
-
-    # For errors that take specific constructor args beyond message
-    if error_class in [
-        errors.APIClientError,
-        errors.APIConnectionError,
-        errors.APITimeoutError,
-        errors.AuthenticationError,
-        errors.ResourceNotFoundError,
-        errors.ServerError,
-    ]:
-        with pytest.raises(error_class, match=message) as exc_info:
-            raise error_class(message, status_code=500)
-        assert isinstance(exc_info.value, base_class)
-        assert exc_info.value.status_code == 500
-        assert str(exc_info.value) == f"{message} (Status Code: 500)"
-    elif error_class is errors.RateLimitError:
-        with pytest.raises(error_class, match=message) as exc_info:
-            raise error_class(message, status_code=429, retry_after=60)
-        assert isinstance(exc_info.value, base_class)
-        assert exc_info.value.status_code == 429
-        assert exc_info.value.retry_after == 60
-        assert str(exc_info.value) == f"{message} (Status Code: 429)"
-    elif error_class is errors.LionSDKError:
+def test_str_format(error_class, kwargs, expected_str):
+    """Tests the message formatting, including classes that customize __str__."""
+    assert str(error_class("Something failed", **kwargs)) == expected_str
+
+
+class TestStatusCodeErrors:
+    """API client errors constructed with a status code."""
+
+    @pytest.mark.parametrize(
+        "error_class",
+        [
+            errors.APIClientError,
+            errors.APIConnectionError,
+            errors.APITimeoutError,
+            errors.AuthenticationError,
+            errors.ResourceNotFoundError,
+            errors.ServerError,
+        ],
+    )
+    def test_status_code(self, error_class):
+        """Tests status code errors keep the code and include it in the message."""
+        err = error_class("API error occurred", status_code=500)
+        assert err.status_code == 500
+        assert str(err) == "API error occurred (Status Code: 500)"
+
+
+class TestRateLimitError:
+    """RateLimitError carries a status code and a retry-after hint."""
+
+    def test_attributes(self):
+        """Tests RateLimitError keeps its status code and retry_after."""
+        err = errors.RateLimitError(
+            "Rate limit exceeded", status_code=429, retry_after=60
+        )
+        assert err.status_code == 429
+        assert err.retry_after == 60
+        assert str(err) == "Rate limit exceeded (Status Code: 429)"
+
+
+class TestSDKError:
+    """LionSDKError wraps the exception raised by the underlying SDK."""
+
+    def test_attributes(self):
+        """Tests LionSDKError keeps a reference to the original exception."""
         original_exc = ValueError("Original SDK issue")
-        with pytest.raises(error_class, match=message) as exc_info:
-            raise error_class(message, original_exception=original_exc)
-        assert isinstance(exc_info.value, base_class)
-        assert exc_info.value.original_exception is original_exc
-    else:  # For errors that only take a message
-        with pytest.raises(error_class, match=message) as exc_info:
-            raise error_class(message)
-        assert isinstance(exc_info.value, base_class)
-        assert str(exc_info.value) == message
+        err = errors.LionSDKError("SDK error occurred", original_exception=original_exc)
+        assert err.original_exception is original_exc
+        assert str(err) == "SDK error occurred"
 
 
 def test_api_client_error_str_no_status_code():
@@ -1,6 +1,9 @@
 """Tests for the format_utils module."""
 
+import datetime
 import json
+import uuid
+from enum import Enum
 from unittest.mock import patch
 
 import pytest
@@ -9,9 +12,22 @@ from pydantic import BaseModel
 from lionfuncs.format_utils import _format_dict_yaml_like, _is_in_notebook, as_readable
 
 
+class Color(Enum):
+    """Enum rendered by name by json.dumps but by value by orjson."""
+
+    RED = "red"
+
+
 class TestFormatUtils:
     """Tests for format_utils module."""
 
+    @pytest.fixture(autouse=True)
+    def clear_notebook_cache(self):
+        """Keep the cached notebook detection from leaking between tests."""
+        _is_in_notebook.cache_clear()
+        yield
+        _is_in_notebook.cache_clear()
+
     def test_is_in_notebook_not_in_notebook(self):
         """Test _is_in_notebook when not in a notebook."""
         # Default case - not in a notebook
@@ -22,6 +38,13 @@ class TestFormatUtils:
         with patch("builtins.__import__", side_effect=ImportError):
             assert not _is_in_notebook()
 
+    def test_is_in_notebook_cached(self):
+        """Test _is_in_notebook only inspects IPython on the first call."""
+        first = _is_in_notebook()
+        with patch("builtins.__import__", side_effect=ImportError) as mock_import:
+            assert _is_in_notebook() is first
+        mock_import.assert_not_called()
+
     def test_is_in_notebook_in_notebook(self):
         """Test _is_in_notebook when in a notebook."""
 
@@ -123,6 +146,10 @@ class TestFormatUtils:
         result = _format_dict_yaml_like({"tags": []})
         assert "tags: []" in result
 
+        # Dict with empty dict, still cut off by max_depth
+        assert _format_dict_yaml_like({"meta": {}}) == "meta:\n  {}"
+        assert _format_dict_yaml_like({"meta": {}}, max_depth=1) == "meta:\n  ..."
+
     def test_format_dict_yaml_like_max_depth(self):
         """Test _format_dict_yaml_like with max_depth."""
         data = {"level1": {"level2": {"level3": {"level4": "value"}}}}
@@ -167,6 +194,54 @@ class TestFormatUtils:
         parsed = json.loads(result)
         assert parsed == data
 
+    @pytest.mark.parametrize("indent", [2, 4])
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"name": "Jöhn", "ids": (1, 2), 3: None, "ratio": 0.5},
+            {"big": 2**70},
+            {"color": Color.RED, "nested": [{"score": float("nan")}]},
+            {"limits": (float("inf"), -float("inf"))},
+            {"small": [1e-05, -1.5e-07, 0.0001, 0.0, -0.0], 2.5e-05: "key"},
+            {"large": [1e16, -1.5e20, 1e15]},
+            {True: "bool key", None: "none key", 1.5: "float key"},
+        ],
+    )
+    def test_as_readable_json_matches_stdlib(self, data, indent):
+        """Test json output is identical to json.dumps for any indent width."""
+        result = as_readable(
+            data, format_type="json", indent=indent, in_notebook_override=False
+        )
+        assert result == json.dumps(
+            data, indent=indent, ensure_ascii=False, default=str
+        )
+
+    @pytest.mark.parametrize("indent", [2, 4])
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {datetime.date(2024, 1, 2): "date key"},
+            {uuid.UUID(int=1): "uuid key"},
+            {(1, 2): "tuple key"},
+        ],
+    )
+    def test_as_readable_json_rejects_non_json_keys(self, data, indent):
+        """Test keys json.dumps rejects fall back to str() for any indent width."""
+        with pytest.raises(TypeError):
+            json.dumps(data, default=str)
+        result = as_readable(
+            data, format_type="json", indent=indent, in_notebook_override=False
+        )
+        assert result == str(data)
+
+    def test_as_readable_json_uses_orjson(self):
+        """Test plain data at indent 2 is serialized by orjson."""
+        data = {"name": "Jöhn", "ids": (1, 2), 3: None}
+        with patch("lionfuncs.format_utils.json.dumps") as mock_dumps:
+            result = as_readable(data, format_type="json", in_notebook_override=False)
+        mock_dumps.assert_not_called()
+        assert result == json.dumps(data, indent=2, ensure_ascii=False)
+
     def test_as_readable_repr_format(self):
         """Test as_readable with repr format."""
         data = {"name": "John", "age": 30}
@@ -180,6 +255,19 @@ class TestFormatUtils:
         with pytest.raises(ValueError):
             as_readable(data, format_type="invalid")
 
+    def test_as_readable_invalid_format_skips_conversion(self):
+        """Test an unsupported format is rejected before the data is converted."""
+        with patch("lionfuncs.format_utils.to_dict") as mock_to_dict:
+            with pytest.raises(ValueError, match="Unsupported format_type: bogus"):
+                as_readable(object(), format_type="bogus")
+        mock_to_dict.assert_not_called()
+
+    def test_as_readable_repr_skips_notebook_detection(self):
+        """Test repr output is never fenced, so notebook detection is skipped."""
+        with patch("lionfuncs.format_utils._is_in_notebook") as mock_detect:
+            assert as_readable([1, 2], format_type="repr") == "[1, 2]"
+        mock_detect.assert_not_called()
+
     def test_as_readable_indent(self):
         """Test as_readable with custom indent."""
         data = {"name": "John", "age": 30}
@@ -226,6 +314,39 @@ class TestFormatUtils:
         assert "name: John" in result
         assert "age: 30" in result
 
+    def test_as_readable_with_nested_pydantic_model(self):
+        """Test nested models are dumped and None fields are left out."""
+
+        class Address(BaseModel):
+            city: str
+            zip_code: str | None = None
+
+        class User(BaseModel):
+            name: str
+            address: Address
+            nickname: str | None = None
+
+        user = User(name="John", address=Address(city="Paris"))
+        result = as_readable(user, format_type="json", in_notebook_override=False)
+
+        assert json.loads(result) == {"name": "John", "address": {"city": "Paris"}}
+
+    def test_as_readable_with_pydantic_model_custom_dump(self):
+        """Test models whose model_dump fails still go through to_dict."""
+
+        class Legacy(BaseModel):
+            name: str
+
+            def model_dump(self, **kwargs):
+                raise RuntimeError("unsupported")
+
+            def to_dict(self, **kwargs):
+                return {"name": self.name}
+
+        result = as_readable(Legacy(name="old"), in_notebook_override=False)
+
+        assert "name: old" in result
+
     def test_as_readable_with_primitive_types(self):
         """Test as_readable with primitive types."""
         # String
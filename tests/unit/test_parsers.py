@@ -37,6 +37,14 @@ class TestFuzzyParseJson:
         result = fuzzy_parse_json(json_string)
         assert result == expected
 
+    def test_fuzzy_parse_json_valid_skips_fixups(self):
+        """Test valid JSON is returned as-is, without comment or constant rewriting."""
+        json_string = '{"url": "http://example.com", "word": "None"}'
+        assert fuzzy_parse_json(json_string) == {
+            "url": "http://example.com",
+            "word": "None",
+        }
+
     @pytest.mark.parametrize(
         "malformed_json,expected",
         [
@@ -61,6 +69,10 @@ class TestFuzzyParseJson:
                 {"name": "John", "age": False},
             ),  # Python False
             ('{name: "John", age: 30}', {"name": "John", "age": 30}),  # Unquoted keys
+            (
+                '{"a": None, // line None\n "b": [1, 2,] /* block True */}',
+                {"a": None, "b": [1, 2]},
+            ),  # Comments, constants and trailing comma together
         ],
     )
     def test_fuzzy_parse_json_common_errors(self, malformed_json, expected):
@@ -68,6 +80,23 @@ class TestFuzzyParseJson:
         result = fuzzy_parse_json(malformed_json)
         assert result == expected
 
+    def test_fuzzy_parse_json_python_literal(self):
+        """Test Python dict literals parse directly, including quotes in values."""
+        result = fuzzy_parse_json("{'name': \"it's\", 'tags': ['a', None,],}")
+        assert result == {"name": "it's", "tags": ["a", None]}
+        assert type(result) is dict
+
+    def test_fuzzy_parse_json_python_literal_not_json_compatible(self):
+        """Test literals holding non-JSON values are not returned as-is."""
+        with pytest.raises(ValueError):
+            fuzzy_parse_json("{'point': (1, 2)}")
+
+    def test_fuzzy_parse_json_unquoted_keys_skip_string_values(self):
+        """Test key quoting leaves key-like text inside string values alone."""
+        result = fuzzy_parse_json('{msg: "x, y: z", n: 1}')
+        assert result == {"msg": "x, y: z", "n": 1}
+        assert type(result) is dict  # parsed by the cleaning pass, not dirtyjson
+
     def test_fuzzy_parse_json_strict_mode(self):
         """Test fuzzy_parse_json in strict mode."""
         # Valid JSON should parse in strict mode
@@ -1,10 +1,15 @@
 """Tests for the schema_utils module."""
 
+import gc
+import weakref
 from typing import Any, Optional, Union
+from unittest.mock import patch
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, create_model
 
 from lionfuncs.oai_schema_utils import (
+    _FUNCTION_SCHEMA_CACHE,
+    _MODEL_PARAMETERS_CACHE,
     _extract_docstring_parts,
     _get_type_name,
     function_to_openai_schema,
@@ -237,3 +242,123 @@ class TestSchemaUtils:
         assert "b" in schema["parameters"]["properties"]
         assert "a" in schema["parameters"]["required"]
         assert "b" not in schema["parameters"]["required"]
+
+    def test_function_to_openai_schema_cached_copies(self):
+        """Test repeated calls reuse the cached schema but return independent copies."""
+
+        def cached_function(a: int, b: str = "x"):
+            """Cached function."""
+            return True
+
+        first = function_to_openai_schema(cached_function)
+        first["parameters"]["properties"]["a"]["type"] = "mutated"
+        first["parameters"]["required"].append("b")
+
+        with patch("lionfuncs.oai_schema_utils._build_function_schema") as mock_build:
+            second = function_to_openai_schema(cached_function)
+
+        mock_build.assert_not_called()
+        assert second["parameters"]["properties"]["a"]["type"] == "integer"
+        assert second["parameters"]["required"] == ["a"]
+
+    def test_pydantic_model_to_openai_schema_cached_copies(self):
+        """Test model schemas are generated once and returned as independent copies."""
+
+        class Item(BaseModel):
+            name: str
+            tags: list[str] = []
+
+        first = pydantic_model_to_openai_schema(Item, "create", "Create an item")
+        first["function"]["parameters"]["properties"]["name"]["type"] = "mutated"
+        first["function"]["parameters"]["required"].append("tags")
+
+        with patch.object(Item, "model_json_schema") as mock_schema:
+            second = pydantic_model_to_openai_schema(Item, "update", "Update an item")
+        mock_schema.assert_not_called()
+        assert second["function"]["name"] == "update"
+        parameters = second["function"]["parameters"]
+        assert parameters["properties"]["name"]["type"] == "string"
+        assert parameters["required"] == ["name"]
+
+    def test_pydantic_model_to_openai_schema_cache_is_weak(self):
+        """Test cached model schemas are dropped together with their model."""
+        transient = create_model("Transient", value=(int, ...))
+        pydantic_model_to_openai_schema(transient, "make", "Make a value")
+        assert transient in _MODEL_PARAMETERS_CACHE
+
+        model_ref = weakref.ref(transient)
+        del transient
+        gc.collect()
+        assert model_ref() is None
+
+    def test_function_to_openai_schema_docstring_change(self):
+        """Test a changed docstring invalidates the cached schema."""
+
+        def documented(a: int):
+            """Old description."""
+            return a
+
+        assert function_to_openai_schema(documented)["description"] == (
+            "Old description."
+        )
+        documented.__doc__ = "New description."
+        assert function_to_openai_schema(documented)["description"] == (
+            "New description."
+        )
+
+    def test_function_to_openai_schema_skips_cache_for_methods_and_closures(self):
+        """Test bound methods and closures are never held by the cache."""
+
+        class Tool:
+            def run(self, a: int):
+                """Run the tool."""
+                return a
+
+        tool = Tool()
+        tool_ref = weakref.ref(tool)
+        assert function_to_openai_schema(tool.run)["name"] == "run"
+        del tool
+        gc.collect()
+        assert tool_ref() is None
+
+        def make_closure(offset):
+            def add(a: int):
+                """Add the offset."""
+                return a + offset
+
+            return add
+
+        closure = make_closure(1)
+        assert function_to_openai_schema(closure)["name"] == "add"
+        assert closure not in _FUNCTION_SCHEMA_CACHE
+
+    def test_function_to_openai_schema_cache_is_weak(self):
+        """Test cached schemas are dropped together with their function."""
+
+        def transient(a: int):
+            return a
+
+        function_to_openai_schema(transient)
+        assert transient in _FUNCTION_SCHEMA_CACHE
+        size = len(_FUNCTION_SCHEMA_CACHE)
+
+        del transient
+        gc.collect()
+        assert len(_FUNCTION_SCHEMA_CACHE) == size - 1
+
+    def test_function_to_openai_schema_unhashable_callable(self):
+        """Test callables that cannot be hashed still produce a schema."""
+
+        class UnhashableCallable:
+            __hash__ = None
+
+            def __call__(self, a: int):
+                return a
+
+        callable_obj = UnhashableCallable()
+        callable_obj.__name__ = "unhashable"
+
+        schema = function_to_openai_schema(callable_obj)
+
+        assert schema["name"] == "unhashable"
+        assert schema["parameters"]["properties"]["a"]["type"] == "integer"
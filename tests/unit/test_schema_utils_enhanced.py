@@ -6,6 +6,7 @@ from typing import Any, Optional, Union
 from pydantic import BaseModel, Field
 
 from lionfuncs.oai_schema_utils import (
+    _cached_type_name,
     _extract_docstring_parts,
     _get_type_name,
     function_to_openai_schema,
@@ -39,6 +40,28 @@ class TestSchemaUtilsEnhanced:
 
         assert _get_type_name(CustomClass) == "CustomClass"
 
+    def test_get_type_name_memoized(self):
+        """Test non-builtin annotations are resolved once and then cached."""
+
+        class CachedClass:
+            pass
+
+        assert _get_type_name(CachedClass) == "CachedClass"
+        hits = _cached_type_name.cache_info().hits
+        assert _get_type_name(CachedClass) == "CachedClass"
+        assert _cached_type_name.cache_info().hits == hits + 1
+
+    def test_get_type_name_unhashable_annotation(self):
+        """Test unhashable annotations fall back to uncached resolution."""
+
+        class Unhashable:
+            __hash__ = None
+
+            def __str__(self):
+                return "unhashable"
+
+        assert _get_type_name(Unhashable()) == "unhashable"
+
     def test_extract_docstring_parts_with_complex_formatting(self):
         """Test _extract_docstring_parts with complex formatting."""
         docstring = """This is a function description
@@ -102,6 +125,26 @@ class TestSchemaUtilsEnhanced:
         assert "This is a function description." in desc
         assert params == {}
 
+    def test_pydantic_model_to_openai_schema_keeps_nested_definitions(self):
+        """Test references to nested models resolve within the parameters schema."""
+
+        class Address(BaseModel):
+            city: str
+
+        class User(BaseModel):
+            name: str
+            address: Address
+
+        raw_schema = pydantic_model_to_openai_schema(
+            User,
+            function_name="create_user",
+            function_description="Create a user",
+        )
+        schema = raw_schema["function"]["parameters"]
+
+        assert schema["properties"]["address"] == {"$ref": "#/$defs/Address"}
+        assert schema["$defs"]["Address"]["properties"]["city"]["type"] == "string"
+
     def test_pydantic_model_to_openai_schema_with_complex_model(self):
         """Test pydantic_model_to_openai_schema with a complex model."""
 
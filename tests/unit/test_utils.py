@@ -93,6 +93,27 @@ async def test_force_async_with_sync_function_args():
     assert result == "1-test"
 
 
+@pytest.mark.asyncio
+async def test_force_async_positional_args_without_partial(monkeypatch):
+    """Tests positional-only calls reach the executor without a partial."""
+    loop = asyncio.get_running_loop()
+    submitted = []
+    original = loop.run_in_executor
+
+    def recording_run_in_executor(executor, func, *args):
+        submitted.append((func, args))
+        return original(executor, func, *args)
+
+    monkeypatch.setattr(loop, "run_in_executor", recording_run_in_executor)
+
+    forced_async_task = utils.force_async(sync_task_with_args)
+    assert await forced_async_task(1, "test") == "1-test"
+    assert await forced_async_task(2, b="kw") == "2-kw"
+
+    assert submitted[0][1] == (1, "test")
+    assert isinstance(submitted[1][0], functools.partial)
+
+
 @pytest.mark.asyncio
 async def test_force_async_with_sync_function_raises_exception():
     """Tests force_async with a sync function that raises an exception."""
@@ -162,6 +162,20 @@ def test_to_list_with_nested_iterables():
     assert result_flatten == [1, 2, 3, 4, 5]
 
 
+def test_to_list_flatten_dropna_unique_single_pass():
+    """Test flatten, dropna and unique together over nested lists and generators."""
+
+    def make_data():
+        gen = (x for x in [3, PydanticUndefined, [2, 4]])
+        return [1, [2, None, gen], "ab", None, 1]
+
+    result = to_list(make_data(), flatten=True, dropna=True, unique=True)
+    assert result == [1, 2, 3, 4, "ab"]
+
+    result_no_unique = to_list(make_data(), flatten=True, dropna=True)
+    assert result_no_unique == [1, 2, 3, 2, 4, "ab", 1]
+
+
 def test_to_list_with_unique_requires_flatten():
     """Test that to_list raises ValueError when unique=True without flatten=True."""
     with pytest.raises(ValueError, match="unique=True generally requires flatten=True"):